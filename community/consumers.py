@@ -0,0 +1,64 @@
+# community/consumers.py
+"""
+API 명세서 9.4: 대화방 웹소켓 (ws/messages/<str:username>/?token=<access token>)
+
+- 연결하면 상대방(username)과의 대화방 그룹에 참여하고, 새 쪽지와 읽음 확인을 받습니다.
+    {"type": "message", "message": {...}}       새 쪽지 (형식은 9.2 대화 내용의 항목과 같음)
+    {"type": "read", "reader": 3, "read_at": ...} 상대방(또는 다른 기기의 내가) 대화를 읽음
+- 클라이언트가 {"type": "read"}를 보내면 받은 쪽지를 읽음 처리합니다. (9.2 조회와 같은 효과)
+- 쪽지 전송은 기존처럼 POST /messages/ (9.3)로 합니다.
+
+비동기 컨슈머이므로 연결을 유지하는 동안 워커 스레드를 점유하지 않습니다.
+(DB 접근은 연결/읽음 처리 때만 database_sync_to_async로 수행)
+"""
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.contrib.auth import get_user_model
+
+from users.authentication import user_from_token
+from .conversations import mark_conversation_read
+from .models import make_pair_key
+from .realtime import conversation_group
+
+User = get_user_model()
+
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_NOT_FOUND = 4404
+
+
+class ConversationConsumer(AsyncJsonWebsocketConsumer):
+
+    async def connect(self):
+        query = parse_qs(self.scope.get('query_string', b'').decode())
+        self.user = await user_from_token(query.get('token', [None])[0])
+        if self.user is None:
+            await self.close(code=CLOSE_UNAUTHORIZED)
+            return
+
+        username = self.scope['url_route']['kwargs']['username']
+        self.participant = await database_sync_to_async(User.objects.filter(username=username).first)()
+        if self.participant is None or self.participant.id == self.user.id:
+            await self.close(code=CLOSE_NOT_FOUND)
+            return
+
+        self.group_name = conversation_group(make_pair_key(self.user.id, self.participant.id))
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        if getattr(self, 'group_name', None):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        if content.get('type') == 'read':
+            await database_sync_to_async(mark_conversation_read)(self.user, self.participant)
+
+    # --- 채널 그룹 이벤트 (community/realtime.py에서 보냄) ---
+
+    async def message_created(self, event):
+        await self.send_json({'type': 'message', 'message': event['message']})
+
+    async def message_read(self, event):
+        await self.send_json({'type': 'read', 'reader': event['reader'], 'read_at': event['read_at']})
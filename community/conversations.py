@@ -0,0 +1,58 @@
+# community/conversations.py
+"""
+쪽지 대화방(Conversation) 갱신 함수
+
+받은 편지함(API 9.1)은 사용자의 전체 쪽지 대신 대화방 목록만 읽으므로,
+쪽지가 오갈 때마다 대화방의 마지막 쪽지/안 읽은 개수를 여기서 갱신합니다.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+
+from .models import Conversation, Message, make_pair_key
+from .realtime import broadcast_read
+
+
+def get_or_create_conversation(user_a_id, user_b_id):
+    low, high = sorted((user_a_id, user_b_id))
+    pair_key = make_pair_key(low, high)
+    try:
+        with transaction.atomic():
+            conversation, _ = Conversation.objects.get_or_create(
+                pair_key=pair_key, defaults={'user_low_id': low, 'user_high_id': high}
+            )
+    except IntegrityError:
+        # 동시에 첫 쪽지를 보낸 경우
+        conversation = Conversation.objects.get(pair_key=pair_key)
+    return conversation
+
+
+def record_message(message):
+    """새 쪽지를 대화방에 반영합니다. (마지막 쪽지 갱신 + 받는 사람 안 읽은 개수 +1)"""
+    conversation = get_or_create_conversation(message.sender_id, message.receiver_id)
+    unread_field = 'unread_low' if message.receiver_id == conversation.user_low_id else 'unread_high'
+    Conversation.objects.filter(pk=conversation.pk).update(
+        last_message=message,
+        last_sent_at=message.sent_at,
+        **{unread_field: F(unread_field) + 1},
+    )
+    return conversation
+
+
+def mark_conversation_read(user, participant):
+    """user가 participant와의 대화를 열었을 때, 받은 쪽지를 읽음 처리하고 안 읽은 개수를 0으로 만듭니다."""
+    pair_key = make_pair_key(user.id, participant.id)
+    unread_field = 'unread_low' if user.id < participant.id else 'unread_high'
+    updated = Conversation.objects.filter(pair_key=pair_key).exclude(**{unread_field: 0}).update(**{unread_field: 0})
+    if updated:
+        Message.objects.filter(sender=participant, receiver=user, is_read=False).update(is_read=True)
+        broadcast_read(pair_key, user.id) # 대화방 웹소켓으로 읽음 확인 전달
+    return updated
+
+
+def user_conversations(user):
+    """user가 참여한 대화방을 최근 쪽지 순으로 (상대방/마지막 쪽지 포함)"""
+    return (
+        Conversation.objects.filter(Q(user_low=user) | Q(user_high=user))
+        .select_related('user_low', 'user_high', 'last_message')
+        .order_by('-last_sent_at')
+    )
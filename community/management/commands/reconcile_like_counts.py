@@ -0,0 +1,36 @@
+# community/management/commands/reconcile_like_counts.py
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F
+
+from community.models import Post
+
+
+class Command(BaseCommand):
+    """
+    Post.likes_count 컬럼을 실제 좋아요(M2M) 개수와 비교해 어긋난 게시글만 바로잡습니다.
+    - python manage.py reconcile_like_counts
+    - 확인만: python manage.py reconcile_like_counts --dry-run
+    """
+    help = "게시글 좋아요 개수(likes_count)를 실제 좋아요 행 수로 복구합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="bulk_update 배치 크기")
+        parser.add_argument('--dry-run', action='store_true', help="수정하지 않고 어긋난 게시글 수만 출력")
+
+    def handle(self, *args, **options):
+        drifted = (
+            Post.objects.annotate(actual=Count('likes'))
+            .exclude(likes_count=F('actual'))
+            .only('id', 'likes_count')
+        )
+
+        fixed = []
+        for post in drifted.iterator():
+            post.likes_count = post.actual
+            fixed.append(post)
+
+        if not options['dry_run'] and fixed:
+            Post.objects.bulk_update(fixed, ['likes_count'], batch_size=options['batch_size'])
+
+        verb = "발견" if options['dry_run'] else "복구"
+        self.stdout.write(self.style.SUCCESS(f"좋아요 개수가 어긋난 게시글 {len(fixed)}건을 {verb}했습니다."))
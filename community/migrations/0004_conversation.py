@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_conversations(apps, schema_editor):
+    Message = apps.get_model('community', 'Message')
+    Conversation = apps.get_model('community', 'Conversation')
+
+    conversations = {}
+    for message in Message.objects.order_by('sent_at', 'id').iterator():
+        low, high = sorted((message.sender_id, message.receiver_id))
+        conversation = conversations.get((low, high))
+        if conversation is None:
+            conversation = conversations[(low, high)] = Conversation(
+                pair_key=f"{low}:{high}", user_low_id=low, user_high_id=high
+            )
+        conversation.last_message_id = message.id
+        conversation.last_sent_at = message.sent_at
+        if not message.is_read:
+            if message.receiver_id == low:
+                conversation.unread_low += 1
+            else:
+                conversation.unread_high += 1
+    Conversation.objects.bulk_create(conversations.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0003_post_likes_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pair_key', models.CharField(max_length=50, unique=True, verbose_name='대화 쌍 키')),
+                ('last_sent_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 쪽지 시각')),
+                ('unread_low', models.PositiveIntegerField(default=0, verbose_name='안 읽은 쪽지 수 (작은 ID)')),
+                ('unread_high', models.PositiveIntegerField(default=0, verbose_name='안 읽은 쪽지 수 (큰 ID)')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_message', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='community.message', verbose_name='마지막 쪽지')),
+                ('user_high', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='conversations_as_high', to=settings.AUTH_USER_MODEL, verbose_name='참여자 (큰 ID)')),
+                ('user_low', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='conversations_as_low', to=settings.AUTH_USER_MODEL, verbose_name='참여자 (작은 ID)')),
+            ],
+            options={
+                'ordering': ['-last_sent_at'],
+                'indexes': [models.Index(fields=['user_low', '-last_sent_at'], name='conversation_low_recent_idx'), models.Index(fields=['user_high', '-last_sent_at'], name='conversation_high_recent_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_conversations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models import CharField, Value
+from django.db.models.functions import Cast, Concat, Greatest, Least
+
+
+def backfill_pair_key(apps, schema_editor):
+    Message = apps.get_model('community', 'Message')
+    Message.objects.update(pair_key=Concat(
+        Cast(Least('sender_id', 'receiver_id'), CharField()),
+        Value(':'),
+        Cast(Greatest('sender_id', 'receiver_id'), CharField()),
+        output_field=CharField(),
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0004_conversation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='pair_key',
+            field=models.CharField(default='', editable=False, max_length=50, verbose_name='대화 쌍 키'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_pair_key, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['pair_key', 'sent_at'], name='message_pair_sent_idx'),
+        ),
+    ]
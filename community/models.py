@@ -11,17 +11,23 @@ class Post(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     likes = models.ManyToManyField(User, related_name='liked_posts', blank=True, verbose_name="좋아요 누른 사람")
+    # 좋아요 개수 (LikeView와 m2m_changed 시그널에서 F() 업데이트로 유지, 어긋나면 reconcile_like_counts 명령으로 복구)
+    likes_count = models.PositiveIntegerField(default=0, verbose_name="좋아요 수")
 
     class Meta:
         ordering = ['-created_at'] # 최신 글부터 정렬
+        indexes = [
+            # 게시글 목록 커서 페이지네이션 (created_at, id)
+            models.Index(fields=['-created_at', '-id'], name='post_created_id_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
     @property
     def like_count(self):
-        """좋아요 개수를 계산하는 속성"""
-        return self.likes.count()
+        """좋아요 개수 (저장된 likes_count 값, COUNT 쿼리 없음)"""
+        return self.likes_count
 
 class Comment(models.Model):
     """댓글 모델"""
@@ -33,24 +39,78 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ['created_at'] # 작성 순서대로 정렬
+        indexes = [
+            # 게시글별 댓글 커서 페이지네이션 (post, created_at, id)
+            models.Index(fields=['post', 'created_at', 'id'], name='comment_post_created_id_idx'),
+        ]
 
     def __str__(self):
         return f"Comment by {self.author.username} on {self.post.title}"
 
+def make_pair_key(user_id_1, user_id_2):
+    """두 사용자 ID로 순서와 무관한 대화 쌍 키를 만듭니다. (예: 3, 1 -> "1:3")"""
+    low, high = sorted((int(user_id_1), int(user_id_2)))
+    return f"{low}:{high}"
+
 class Message(models.Model):
     """쪽지 모델"""
     sender = models.ForeignKey(User, on_delete=models.CASCADE, related_name='sent_messages', verbose_name="보낸 사람")
     receiver = models.ForeignKey(User, on_delete=models.CASCADE, related_name='received_messages', verbose_name="받는 사람")
+    # 보낸 사람/받는 사람 순서와 무관한 대화 쌍 키 ("작은ID:큰ID", 저장 시 자동 설정)
+    # -> 두 사람의 대화를 (pair_key, sent_at) 인덱스 하나로 조회합니다.
+    pair_key = models.CharField(max_length=50, editable=False, verbose_name="대화 쌍 키")
     content = models.TextField(verbose_name="쪽지 내용")
     sent_at = models.DateTimeField(auto_now_add=True, verbose_name="보낸 시각")
     is_read = models.BooleanField(default=False, verbose_name="읽음 여부")
 
     class Meta:
         ordering = ['-sent_at'] # 최신 메시지부터 정렬
+        indexes = [
+            models.Index(fields=['pair_key', 'sent_at'], name='message_pair_sent_idx'),
+        ]
 
     def __str__(self):
         return f"Message from {self.sender.username} to {self.receiver.username}"
 
+    def save(self, *args, **kwargs):
+        self.pair_key = make_pair_key(self.sender_id, self.receiver_id)
+        super().save(*args, **kwargs)
+
+class Conversation(models.Model):
+    """
+    쪽지 대화방 모델 (두 사용자 쌍마다 하나)
+    - user_low/user_high: ID가 작은/큰 참여자 (pair_key로 유일)
+    - 쪽지가 전송될 때마다 마지막 메시지와 받는 사람의 안 읽은 개수를 갱신합니다. (community/conversations.py)
+    """
+    pair_key = models.CharField(max_length=50, unique=True, verbose_name="대화 쌍 키")
+    user_low = models.ForeignKey(User, on_delete=models.CASCADE, related_name='conversations_as_low', verbose_name="참여자 (작은 ID)")
+    user_high = models.ForeignKey(User, on_delete=models.CASCADE, related_name='conversations_as_high', verbose_name="참여자 (큰 ID)")
+    last_message = models.ForeignKey(Message, on_delete=models.SET_NULL, null=True, blank=True, related_name='+', verbose_name="마지막 쪽지")
+    last_sent_at = models.DateTimeField(null=True, blank=True, verbose_name="마지막 쪽지 시각")
+    unread_low = models.PositiveIntegerField(default=0, verbose_name="안 읽은 쪽지 수 (작은 ID)")
+    unread_high = models.PositiveIntegerField(default=0, verbose_name="안 읽은 쪽지 수 (큰 ID)")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-last_sent_at']
+        indexes = [
+            # 받은 편지함: 내가 참여한 대화방을 최근 순으로
+            models.Index(fields=['user_low', '-last_sent_at'], name='conversation_low_recent_idx'),
+            models.Index(fields=['user_high', '-last_sent_at'], name='conversation_high_recent_idx'),
+        ]
+
+    def __str__(self):
+        return f"Conversation {self.pair_key}"
+
+    def other_user(self, user):
+        return self.user_high if user.id == self.user_low_id else self.user_low
+
+    def unread_field_for(self, user):
+        return 'unread_low' if user.id == self.user_low_id else 'unread_high'
+
+    def unread_count_for(self, user):
+        return getattr(self, self.unread_field_for(user))
+
 # 알림(Notification) 모델은 필요 시 별도 앱 또는 기능으로 구현합니다.
 # 예를 들어, Notification 모델을 만들고 Comment, Message 생성 시
 # signal 등을 이용해 Notification 객체를 생성하는 방식으로 구현할 수 있습니다.
@@ -0,0 +1,22 @@
+# community/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class PostCursorPagination(CursorPagination):
+    """
+    게시글 목록(API 8.1) 커서 페이지네이션 - 최신순 (created_at, id)
+    - GET /community/posts/?cursor=...&page_size=20
+    - 응답: {"next": "...", "previous": "...", "results": [...]}
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class CommentCursorPagination(CursorPagination):
+    """댓글 목록(API 8.4) 커서 페이지네이션 - 작성순 (created_at, id)"""
+    ordering = ('created_at', 'id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
@@ -0,0 +1,42 @@
+# community/realtime.py
+"""
+쪽지 실시간 전달 (웹소켓, community/consumers.py)
+
+대화방마다 채널 그룹 하나를 두고, 새 쪽지와 읽음 확인을 커밋 후에 그룹으로 보냅니다.
+채널 레이어는 settings.CHANNEL_LAYERS로 교체할 수 있습니다. (기본: 프로세스 내 InMemoryChannelLayer)
+"""
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+from django.utils import timezone
+
+from .serializers import MessageHistorySerializer
+
+
+def conversation_group(pair_key):
+    """대화방 채널 그룹 이름 (그룹 이름에는 ':'를 쓸 수 없음)"""
+    return f"conversation.{pair_key.replace(':', '-')}"
+
+
+def message_payload(message):
+    """9.2 대화 내용의 항목과 같은 형식 (채널 레이어로 보낼 수 있도록 일반 dict)"""
+    return dict(MessageHistorySerializer(message).data)
+
+
+def _group_send(pair_key, event):
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    async_to_sync(channel_layer.group_send)(conversation_group(pair_key), event)
+
+
+def broadcast_message(message):
+    """새 쪽지를 대화방 웹소켓으로 보냅니다. (트랜잭션 안이면 커밋 후)"""
+    event = {'type': 'message.created', 'message': message_payload(message)}
+    transaction.on_commit(lambda: _group_send(message.pair_key, event))
+
+
+def broadcast_read(pair_key, reader_id):
+    """reader_id가 대화를 읽었음을 상대방에게 알립니다. (읽음 확인)"""
+    event = {'type': 'message.read', 'reader': reader_id, 'read_at': timezone.now().isoformat()}
+    transaction.on_commit(lambda: _group_send(pair_key, event))
@@ -0,0 +1,10 @@
+# community/routing.py
+from django.urls import path
+
+from .consumers import ConversationConsumer
+
+websocket_urlpatterns = [
+    # 9.4 대화방 웹소켓
+    # ws://<host>/ws/messages/<str:username>/?token=<access token>
+    path('ws/messages/<str:username>/', ConversationConsumer.as_asgi()),
+]
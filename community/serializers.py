@@ -1,6 +1,6 @@
 # community/serializers.py
 from rest_framework import serializers
-from .models import Post, Comment, Message
+from .models import Post, Comment, Message, Conversation
 from users.models import User # User 모델 import
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -29,9 +29,6 @@ class PostSerializer(serializers.ModelSerializer):
     # (읽기 전용, 'many=True'로 여러 개를 가져옴)
     comments = CommentSerializer(many=True, read_only=True)
     
-    # '좋아요' 개수를 보여주기 위해 추가
-    likes_count = serializers.SerializerMethodField()
-
     class Meta:
         model = Post
         fields = [
@@ -40,11 +37,25 @@ class PostSerializer(serializers.ModelSerializer):
         ]
         # 'author'는 View에서 자동으로 설정할 것이므로 읽기 전용
         read_only_fields = ['id', 'author', 'author_nickname', 'created_at', 'updated_at', 'likes_count', 'comments']
+
     
-    def get_likes_count(self, obj):
-        # Post 모델에 정의된 likes(ManyToManyField)의 개수를 반환
-        return obj.likes.count()
-    
+class PostListSerializer(serializers.ModelSerializer):
+    """
+    API 명세서 8.1: 게시글 목록용 가벼운 Serializer
+    (댓글 트리 대신 댓글 개수만 포함, 댓글은 상세 조회/댓글 목록 API에서 조회)
+    """
+    author_nickname = serializers.ReadOnlyField(source='author.nickname')
+    # PostViewSet.get_queryset()에서 annotate한 값
+    comments_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Post
+        fields = [
+            'id', 'author', 'author_nickname', 'title', 'content', 'image',
+            'created_at', 'updated_at', 'likes_count', 'comments_count'
+        ]
+        read_only_fields = fields
+
 class MessageSerializer(serializers.ModelSerializer):
     """
     API 명세서 9.x: 쪽지(Message)를 위한 Serializer
@@ -58,4 +69,42 @@ class MessageSerializer(serializers.ModelSerializer):
             'id', 'sender', 'sender_nickname', 'receiver', 'receiver_nickname', 
             'content', 'sent_at', 'is_read'  # ❗️ [오류 수정] 'timestamp' -> 'sent_at'
         ]
-        read_only_fields = ['id', 'sender', 'sender_nickname', 'receiver_nickname', 'sent_at', 'is_read'] # ❗️ [오류 수정] 'timestamp' -> 'sent_at'
\ No newline at end of file
+        read_only_fields = ['id', 'sender', 'sender_nickname', 'receiver_nickname', 'sent_at', 'is_read'] # ❗️ [오류 수정] 'timestamp' -> 'sent_at'
+
+class MessageHistorySerializer(serializers.ModelSerializer):
+    """
+    API 명세서 9.2: 대화 내용 조회용 Serializer
+    - 상대방 정보는 응답의 'participant'에 한 번만 담으므로, 행마다 닉네임을 조회하지 않습니다.
+    """
+    class Meta:
+        model = Message
+        fields = ['id', 'sender', 'receiver', 'content', 'sent_at', 'is_read']
+        read_only_fields = fields
+
+class ConversationSerializer(serializers.ModelSerializer):
+    """
+    API 명세서 9.1: 받은 편지함(대화방 목록)을 위한 Serializer
+    - 요청한 사용자 기준으로 상대방(participant)과 안 읽은 쪽지 수를 보여줍니다.
+      (context['request'].user 필요)
+    """
+    participant = serializers.SerializerMethodField()
+    last_message = serializers.SerializerMethodField()
+    unread_count = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Conversation
+        fields = ['id', 'participant', 'last_message', 'last_sent_at', 'unread_count']
+        read_only_fields = fields
+
+    def get_participant(self, obj):
+        other = obj.other_user(self.context['request'].user)
+        return {'id': other.id, 'username': other.username, 'nickname': other.nickname}
+
+    def get_last_message(self, obj):
+        message = obj.last_message
+        if message is None:
+            return None
+        return {'id': message.id, 'sender': message.sender_id, 'content': message.content, 'sent_at': message.sent_at}
+
+    def get_unread_count(self, obj):
+        return obj.unread_count_for(self.context['request'].user)
@@ -1,5 +1,6 @@
 # community/signals.py
-from django.db.models.signals import post_save
+from django.db.models import F
+from django.db.models.signals import post_save, m2m_changed
 from django.dispatch import receiver
 
 # 1. 알림을 받을/보낼 User 모델 (users/models.py)
@@ -8,8 +9,10 @@ from users.models import User
 # 2. 이벤트가 발생할 모델 (community/models.py)
 from .models import Comment, Message, Post 
 
-# 3. 생성할 알림 모델 (notifications/models.py)
-from notifications.models import Notification
+# 3. 알림 발송 서비스 (notifications/dispatch.py)
+from notifications.dispatch import notify
+from .conversations import record_message
+from .realtime import broadcast_message
 
 # --- 예시 1: 새 댓글이 달리면 게시글 작성자에게 알림 ---
 @receiver(post_save, sender=Comment)
@@ -34,12 +37,13 @@ def notify_post_author_on_comment(sender, instance, created, **kwargs):
         # ❗️ [수정] config/urls.py와 community/urls.py를 반영한 주소
         link_to = f"/api/v1/community/posts/{post.id}/"
 
-        # 4. 알림 객체 생성
-        Notification.objects.create(
-            user=post_author,             # 알림을 받을 사람: 게시글 작성자
-            message=content,              # 알림 내용
-            notification_type='comment',  # 알림 종류
-            link=link_to                  # 클릭 시 이동할 URL
+        # 4. 알림 발송 (커밋 후 저장, 같은 댓글로 중복 발송 방지)
+        notify(
+            post_author.id,               # 알림을 받을 사람: 게시글 작성자
+            'comment',                    # 알림 종류
+            content,                      # 알림 내용
+            link=link_to,                 # 클릭 시 이동할 URL
+            source=comment,
         )
 
 # --- 예시 2: 새 쪽지가 오면 수신자에게 알림 ---
@@ -64,10 +68,51 @@ def notify_receiver_on_message(sender, instance, created, **kwargs):
         # ❗️ [수정] config/urls.py를 반영한 주소
         link_to = f"/api/v1/messages/"
 
-        # 4. 알림 객체 생성
-        Notification.objects.create(
-            user=receiver_user,           # 알림을 받을 사람: 쪽지 수신자
-            message=content,              # 알림 내용
-            notification_type='message',  # 알림 종류
-            link=link_to                  # 클릭 시 이동할 URL
-        )
\ No newline at end of file
+        # 4. 알림 발송 (쪽지 알림은 이 시그널 한 곳에서만 만듭니다)
+        notify(
+            receiver_user.id,             # 알림을 받을 사람: 쪽지 수신자
+            'message',                    # 알림 종류
+            content,                      # 알림 내용
+            link=link_to,                 # 클릭 시 이동할 URL
+            source=message,
+        )
+
+# --- 좋아요(Post.likes) 변경 시 Post.likes_count 동기화 ---
+@receiver(m2m_changed, sender=Post.likes.through)
+def sync_post_likes_count(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    관리자 페이지나 post.likes.add()/remove() 등 M2M API로 좋아요가 바뀐 경우
+    likes_count 컬럼을 함께 갱신합니다. (LikeView는 직접 갱신하므로 이 시그널을 타지 않습니다)
+    - add: Django가 이미 있는 좋아요를 빼고 pk_set을 넘겨줍니다.
+    - remove: pk_set은 요청한 id 그대로이므로, pre_remove에서 실제로 있는 좋아요만 골라 둡니다.
+    """
+    if action == 'pre_remove' and pk_set:
+        # reverse=True: instance는 User, pk_set은 게시글 id / False: instance는 Post, pk_set은 사용자 id
+        owner_field, target_field = ('user_id', 'post_id') if reverse else ('post_id', 'user_id')
+        instance._removed_like_ids = set(
+            sender.objects.filter(**{owner_field: instance.pk, f'{target_field}__in': pk_set})
+            .values_list(target_field, flat=True)
+        )
+    elif action in ('post_add', 'post_remove') and pk_set:
+        if action == 'post_remove':
+            pk_set = instance.__dict__.pop('_removed_like_ids', set())
+            if not pk_set:
+                return
+        sign = 1 if action == 'post_add' else -1
+        # reverse=True: user.liked_posts.add(post1, post2) -> 각 게시글마다 1씩
+        post_ids = pk_set if reverse else [instance.pk]
+        step = sign if reverse else sign * len(pk_set)
+        Post.objects.filter(pk__in=post_ids).update(likes_count=F('likes_count') + step)
+    elif action == 'pre_clear' and reverse:
+        # user.liked_posts.clear(): 지워지기 전에 해당 게시글들을 1씩 감소
+        Post.objects.filter(likes=instance).update(likes_count=F('likes_count') - 1)
+    elif action == 'post_clear' and not reverse:
+        Post.objects.filter(pk=instance.pk).update(likes_count=0)
+
+
+# --- 새 쪽지가 오면 대화방(Conversation)의 마지막 쪽지/안 읽은 개수 갱신 ---
+@receiver(post_save, sender=Message)
+def update_conversation_on_message(sender, instance, created, **kwargs):
+    if created:
+        record_message(instance)
+        broadcast_message(instance) # 대화방 웹소켓으로 전달 (커밋 후)
@@ -1,3 +1,227 @@
-from django.test import TestCase
+from io import StringIO
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.models import User
+from .models import Post, Comment, Message
+from .routing import websocket_urlpatterns
+
+
+def create_user(username):
+    return User.objects.create_user(
+        username=username, password='pw', email=f'{username}@example.com', nickname=f'{username}-닉네임'
+    )
+
+
+class CommunityAPITestCase(TestCase):
+    def setUp(self):
+        self.user = create_user('writer')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def create_posts(self, n, comments_per_post=0):
+        posts = []
+        for i in range(n):
+            post = Post.objects.create(author=self.user, title=f'제목 {i}', content='내용')
+            for j in range(comments_per_post):
+                Comment.objects.create(post=post, author=self.user, content=f'댓글 {j}')
+            posts.append(post)
+        return posts
+
+
+class PostFeedPaginationTests(CommunityAPITestCase):
+    """API 8.1 게시글 목록은 커서 페이지네이션과 댓글 개수만 반환해야 합니다."""
+
+    def test_cursor_walks_every_post_once(self):
+        posts = self.create_posts(5, comments_per_post=2)
+        seen = []
+        url = reverse('post-list') + '?page_size=2'
+        while url:
+            data = self.client.get(url).json()
+            seen.extend(item['id'] for item in data['results'])
+            url = data['next']
+        self.assertEqual(seen, [post.id for post in reversed(posts)])
+
+    def test_list_carries_comment_count_not_tree(self):
+        self.create_posts(1, comments_per_post=3)
+        item = self.client.get(reverse('post-list')).json()['results'][0]
+        self.assertEqual(item['comments_count'], 3)
+        self.assertNotIn('comments', item)
+
+
+class PostFeedQueryCountTests(CommunityAPITestCase):
+    """게시글 목록/상세 조회의 쿼리 수는 게시글·댓글·좋아요 수와 무관해야 합니다 (N+1 방지)."""
+
+    def add_likes(self, posts, n):
+        likers = [create_user(f'liker{i}') for i in range(n)]
+        for post in posts:
+            post.likes.add(*likers)
+
+    def test_feed_query_count_constant(self):
+        posts = self.create_posts(30, comments_per_post=3)
+        self.add_likes(posts, 3)
+        url = reverse('post-list')
+        with self.assertNumQueries(1):
+            small = self.client.get(url + '?page_size=2')
+        with self.assertNumQueries(1):
+            large = self.client.get(url + '?page_size=25')
+        self.assertEqual(len(small.json()['results']), 2)
+        self.assertEqual(len(large.json()['results']), 25)
+        self.assertEqual(large.json()['results'][0]['likes_count'], 3)
+
+    def test_detail_query_count_constant(self):
+        post = self.create_posts(1, comments_per_post=10)[0]
+        self.add_likes([post], 4)
+        with self.assertNumQueries(2):
+            data = self.client.get(reverse('post-detail', args=[post.id])).json()
+        self.assertEqual(len(data['comments']), 10)
+        self.assertEqual(data['likes_count'], 4)
+        self.assertEqual(data['comments'][0]['author_nickname'], self.user.nickname)
+
+
+class LikeCounterTests(CommunityAPITestCase):
+    """좋아요 토글과 likes_count 컬럼 동기화"""
+
+    def test_toggle_keeps_counter_in_sync(self):
+        post = self.create_posts(1)[0]
+        url = reverse('post-like', args=[post.id])
+
+        liked = self.client.post(url).json()
+        self.assertEqual((liked['message'], liked['likes_count']), ('좋아요 성공', 1))
+        unliked = self.client.post(url).json()
+        self.assertEqual((unliked['message'], unliked['likes_count']), ('좋아요 취소', 0))
+
+    def test_m2m_api_updates_counter(self):
+        post = self.create_posts(1)[0]
+        other = create_user('fan')
+        post.likes.add(self.user, other)
+        other.liked_posts.remove(post)
+        post.refresh_from_db()
+        self.assertEqual(post.likes_count, 1)
+
+    def test_removing_missing_like_keeps_counter(self):
+        post = self.create_posts(1)[0]
+        stranger = create_user('stranger')
+        post.likes.add(self.user)
+        post.likes.remove(stranger)
+        stranger.liked_posts.remove(post)
+        post.likes.remove(self.user, stranger)
+        post.refresh_from_db()
+        self.assertEqual(post.likes_count, 0)
+
+        post.likes.remove(self.user)
+        post.refresh_from_db()
+        self.assertEqual(post.likes_count, 0)
+
+    def test_reconcile_repairs_drift(self):
+        post = self.create_posts(1)[0]
+        post.likes.add(self.user)
+        Post.objects.filter(id=post.id).update(likes_count=42)
+        call_command('reconcile_like_counts', stdout=StringIO())
+        post.refresh_from_db()
+        self.assertEqual(post.likes_count, 1)
+
+
+class ConversationInboxTests(CommunityAPITestCase):
+    """API 9.1 받은 편지함은 대화방마다 한 줄, 최근 순이어야 합니다."""
+
+    def send(self, sender, receiver, content='안녕하세요'):
+        self.client.force_authenticate(user=sender)
+        response = self.client.post(reverse('message-list-create'), {'receiver': receiver.id, 'content': content})
+        self.assertEqual(response.status_code, 201)
+
+    def test_inbox_one_row_per_thread(self):
+        alice, bob = create_user('alice'), create_user('bob')
+        self.send(alice, self.user)
+        self.send(bob, self.user)
+        self.send(alice, self.user, '두 번째')
+        self.send(self.user, bob)
+
+        self.client.force_authenticate(user=self.user)
+        inbox = self.client.get(reverse('message-list-create')).json()
+        self.assertEqual([row['participant']['username'] for row in inbox], ['bob', 'alice'])
+        self.assertEqual([row['unread_count'] for row in inbox], [1, 2])
+        self.assertEqual(inbox[1]['last_message']['content'], '두 번째')
+
+    def test_opening_thread_resets_unread(self):
+        alice = create_user('alice')
+        self.send(alice, self.user)
+        self.client.force_authenticate(user=self.user)
+        self.client.get(reverse('message-detail', args=['alice']))
+        inbox = self.client.get(reverse('message-list-create')).json()
+        self.assertEqual(inbox[0]['unread_count'], 0)
+
+
+class MessageHistoryPaginationTests(CommunityAPITestCase):
+    """API 9.2 대화 내용은 before 기준으로 이전 쪽지를 limit개씩 불러옵니다."""
+
+    def test_backward_pages_cover_whole_history(self):
+        alice = create_user('alice')
+        for i in range(5):
+            Message.objects.create(sender=alice if i % 2 else self.user, receiver=self.user if i % 2 else alice, content=f'm{i}')
+        Message.objects.create(sender=alice, receiver=create_user('bob'), content='다른 대화')
+
+        url = reverse('message-detail', args=['alice'])
+        first = self.client.get(url, {'limit': 2}).json()
+        self.assertEqual(first['participant']['nickname'], alice.nickname)
+        self.assertEqual([m['content'] for m in first['messages']], ['m3', 'm4'])
+        self.assertTrue(first['has_more'])
+
+        second = self.client.get(url, {'limit': 2, 'before': first['next_before']}).json()
+        self.assertEqual([m['content'] for m in second['messages']], ['m1', 'm2'])
+
+        last = self.client.get(url, {'limit': 2, 'before': second['next_before']}).json()
+        self.assertEqual([m['content'] for m in last['messages']], ['m0'])
+        self.assertFalse(last['has_more'])
+        self.assertIsNone(last['next_before'])
+
+    def test_pair_key_is_order_independent(self):
+        alice = create_user('alice')
+        a = Message.objects.create(sender=alice, receiver=self.user, content='x')
+        b = Message.objects.create(sender=self.user, receiver=alice, content='y')
+        self.assertEqual(a.pair_key, b.pair_key)
+
+
+class ConversationWebsocketTests(TransactionTestCase):
+    """API 9.4 대화방 웹소켓은 새 쪽지와 읽음 확인을 바로 전달해야 합니다."""
+
+    def setUp(self):
+        self.user = create_user('writer')
+        self.alice = create_user('alice')
+
+    def connect(self, user, participant):
+        token = str(AccessToken.for_user(user)) if user else 'bad-token'
+        return WebsocketCommunicator(
+            URLRouter(websocket_urlpatterns), f"/ws/messages/{participant.username}/?token={token}"
+        )
+
+    async def test_delivers_messages_and_read_receipts(self):
+        mine = self.connect(self.user, self.alice)
+        theirs = self.connect(self.alice, self.user)
+        self.assertTrue((await mine.connect())[0])
+        self.assertTrue((await theirs.connect())[0])
+        try:
+            await sync_to_async(Message.objects.create)(sender=self.alice, receiver=self.user, content='실시간')
+            for communicator in (mine, theirs):
+                event = await communicator.receive_json_from(timeout=2)
+                self.assertEqual((event['type'], event['message']['content']), ('message', '실시간'))
+
+            await mine.send_json_to({'type': 'read'})
+            receipt = await theirs.receive_json_from(timeout=2)
+            self.assertEqual((receipt['type'], receipt['reader']), ('read', self.user.id))
+        finally:
+            await mine.disconnect()
+            await theirs.disconnect()
+
+    async def test_rejects_invalid_token(self):
+        communicator = self.connect(None, self.alice)
+        connected, code = await communicator.connect()
+        self.assertFalse(connected)
+        self.assertEqual(code, 4401)
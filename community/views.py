@@ -4,15 +4,17 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model # ❗️ User 모델을 가져오기 위해
-from django.db.models import Q # ❗️ OR 조건 검색을 위해
+from django.db import transaction, IntegrityError
+from django.db.models import Q, F, Count, Prefetch, OuterRef, Subquery # ❗️ OR 조건 검색을 위해
+from django.db.models.functions import Coalesce
 
 # ❗️ [수정] Message, MessageSerializer 추가
-from .models import Post, Comment, Message
-from .serializers import PostSerializer, CommentSerializer, MessageSerializer
+from .models import Post, Comment, Message, make_pair_key
+from .serializers import PostSerializer, PostListSerializer, CommentSerializer, MessageSerializer, MessageHistorySerializer, ConversationSerializer
+from .conversations import user_conversations, mark_conversation_read
+from .pagination import PostCursorPagination, CommentCursorPagination
 # ❗️ [수정] UserSerializer import
 from users.serializers import UserSerializer
-# ❗️ [추가] Notification 모델 import
-from notifications.models import Notification
 
 User = get_user_model() # ❗️ User 모델 정의
 
@@ -34,25 +36,54 @@ class IsAuthorOrReadOnly(permissions.BasePermission):
             
         return False
 
+def count_subquery(model, field):
+    """
+    model에서 field가 바깥 쿼리의 pk를 가리키는 행 수를 세는 서브쿼리.
+    (JOIN + GROUP BY 대신 게시글 행마다 인덱스로 셉니다)
+    """
+    counts = model.objects.filter(**{field: OuterRef('pk')}).order_by().values(field).annotate(total=Count('*')).values('total')
+    return Coalesce(Subquery(counts), 0)
+
 # --- 커뮤니티 API (API 8.x) ---
 
 class PostViewSet(viewsets.ModelViewSet):
     """
     API 명세서 8.1, 8.2, 8.3: 게시글(Post) 관리(CRUD) ViewSet
-    - GET /community/posts/
+    - GET /community/posts/ (커서 페이지네이션, 댓글 대신 댓글 개수만 포함)
     - POST /community/posts/
     - GET /community/posts/{post_id}/
     - PUT /community/posts/{post_id}/
     - DELETE /community/posts/{post_id}/
     """
-    queryset = Post.objects.all().order_by('-created_at') # 최신순으로 정렬
+    queryset = Post.objects.all().order_by('-created_at', '-id') # 최신순으로 정렬
     serializer_class = PostSerializer
+    pagination_class = PostCursorPagination
     
     # 권한 설정:
     # - IsAuthenticatedOrReadOnly: 로그인한 사용자는 모든 요청(읽기,쓰기) 가능, 비로그인 사용자는 읽기(GET)만 가능
     # - IsAuthorOrReadOnly: 수정(PUT)/삭제(DELETE)는 작성자 본인만 가능
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
 
+    def get_queryset(self):
+        """
+        게시글 수와 상관없이 쿼리 수가 일정하도록,
+        작성자는 JOIN으로, 댓글 개수는 annotate(서브쿼리)로 함께 가져옵니다.
+        (좋아요 개수는 Post.likes_count 컬럼, 상세 조회는 댓글과 댓글 작성자까지 한 번에 prefetch)
+        """
+        queryset = super().get_queryset().select_related('author').annotate(
+            comments_count=count_subquery(Comment, 'post'),
+        )
+        if self.action != 'list':
+            queryset = queryset.prefetch_related(
+                Prefetch('comments', queryset=Comment.objects.select_related('author').order_by('created_at', 'id'))
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return PostListSerializer
+        return PostSerializer
+
     def perform_create(self, serializer):
         """
         POST 요청으로 새로운 게시글을 생성할 때,
@@ -68,8 +99,9 @@ class CommentViewSet(viewsets.ModelViewSet):
     - PUT /community/comments/{comment_id}/
     - DELETE /community/comments/{comment_id}/
     """
-    queryset = Comment.objects.all().order_by('created_at') # 작성순으로 정렬
+    queryset = Comment.objects.all().order_by('created_at', 'id') # 작성순으로 정렬
     serializer_class = CommentSerializer
+    pagination_class = CommentCursorPagination
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
 
     def get_queryset(self):
@@ -79,8 +111,8 @@ class CommentViewSet(viewsets.ModelViewSet):
         # URL에서 post_id를 가져옵니다.
         post_id = self.kwargs.get('post_id')
         if post_id:
-            return Comment.objects.filter(post_id=post_id)
-        return super().get_queryset()
+            return Comment.objects.filter(post_id=post_id).select_related('author')
+        return super().get_queryset().select_related('author')
 
     def perform_create(self, serializer):
         """
@@ -99,53 +131,60 @@ class LikeView(APIView):
 
     def post(self, request, post_id):
         # 좋아요를 누를 게시글을 찾습니다.
-        post = get_object_or_404(Post, id=post_id)
-        user = request.user
+        post = get_object_or_404(Post.objects.only('id'), id=post_id)
+        like_rows = Post.likes.through.objects
+
+        with transaction.atomic():
+            # 1. 먼저 삭제를 시도합니다. 지워진 행이 있으면 "좋아요 취소"
+            #    (exists() 확인 없이 DELETE 한 번으로 판단)
+            deleted, _ = like_rows.filter(post_id=post.id, user_id=request.user.id).delete()
+            if deleted:
+                delta = -deleted
+                message = "좋아요 취소"
+            else:
+                # 2. 지울 행이 없었다면 INSERT 합니다.
+                try:
+                    with transaction.atomic():
+                        like_rows.create(post_id=post.id, user_id=request.user.id)
+                    delta = 1
+                except IntegrityError:
+                    # 동시에 들어온 같은 요청이 먼저 추가한 경우
+                    delta = 0
+                message = "좋아요 성공"
+
+            # 3. 좋아요 개수 컬럼을 F()로 원자적으로 갱신
+            if delta:
+                Post.objects.filter(id=post.id).update(likes_count=F('likes_count') + delta)
+            likes_count = Post.objects.filter(id=post.id).values_list('likes_count', flat=True).get()
 
-        # 만약 사용자가 이미 이 글에 좋아요를 눌렀다면,
-        if post.likes.filter(id=user.id).exists():
-            # 좋아요를 취소합니다.
-            post.likes.remove(user)
-            message = "좋아요 취소"
-        else:
-            # 좋아요를 누르지 않았다면, 좋아요를 추가합니다.
-            post.likes.add(user)
-            message = "좋아요 성공"
-            
         # 현재 좋아요 개수를 포함하여 응답
-        return Response({"message": message, "likes_count": post.likes.count()}, status=status.HTTP_200_OK)
+        return Response({"message": message, "likes_count": likes_count}, status=status.HTTP_200_OK)
 
 # --- 쪽지 API (API 9.x) ---
 
 class MessageView(APIView):
     """
     API 명세서 9.1 (GET) & 9.3 (POST) 통합 View
-    - GET /community/messages/ (모든 쪽지 목록 조회)
+    - GET /community/messages/ (대화방 목록 조회)
     - POST /community/messages/ (쪽지 전송)
     """
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
         """
-        [수정됨] API 명세서 9.1: 대화방 목록 대신,
-        이 유저가 포함된 "모든" 쪽지 목록을 반환합니다.
-        (프론트엔드 Chat.js가 이 데이터를 기반으로 스레드를 그룹화합니다.)
+        API 명세서 9.1: 받은 편지함 (대화방 목록)
+        - 상대방별로 한 줄씩, 최근 쪽지 순으로 반환합니다.
+          (전체 쪽지 대신 대화방 수만큼만 조회/직렬화)
         """
-        user = request.user
-        
-        # 이 유저가 보냈거나(sender=user) 또는 받은(receiver=user) 모든 메시지를 찾습니다.
-        all_messages = Message.objects.filter(
-            Q(sender=user) | Q(receiver=user)
-        ).order_by('sent_at') # 시간순 정렬
-
-        serializer = MessageSerializer(all_messages, many=True)
+        conversations = user_conversations(request.user)
+        serializer = ConversationSerializer(conversations, many=True, context={'request': request})
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def post(self, request):
         """
         [수정됨] API 명세서 9.3: 쪽지 전송
         (receiver_username 대신 receiver ID를 받도록 수정)
-        (알림 생성 로직 추가)
+        (수신자 알림은 signals.py에서 발송)
         """
         sender = request.user
         
@@ -167,32 +206,28 @@ class MessageView(APIView):
         if sender == receiver:
             return Response({"error": "자기 자신에게는 쪽지를 보낼 수 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        message = Message.objects.create(
-            sender=sender,
-            receiver=receiver,
-            content=content
-        )
-        
-        # [추가] 쪽지 전송 성공 시, 알림(Notification) 객체 생성
-        try:
-            Notification.objects.create(
-                user=receiver,  # 👈 알림을 받을 사람 (쪽지 수신자)
-                message=f"'{sender.nickname or sender.username}'님으로부터 새 쪽지가 도착했습니다.",
-                notification_type='MESSAGE' # 👈 알림 타입 (예시)
+        # 쪽지 저장과 대화방 갱신(signals.py)을 하나의 트랜잭션으로 처리
+        # 수신자 알림은 signals.py에서 notify()로 보내며, 커밋 후에 저장됩니다.
+        with transaction.atomic():
+            message = Message.objects.create(
+                sender=sender,
+                receiver=receiver,
+                content=content
             )
-        except Exception:
-            # 알림 생성에 실패하더라도 쪽지 전송은 성공해야 하므로, 오류를 무시합니다.
-            pass 
-        
+
         serializer = MessageSerializer(message)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 class MessageDetailView(APIView):
     """
     API 명세서 9.2: 특정 사용자와의 대화 내용 조회
-    - GET /community/messages/<str:username>/
+    - GET /community/messages/<str:username>/?before=<message_id>&limit=30
+    - 최신 쪽지부터 limit개씩, before 보다 이전 쪽지를 불러옵니다. (응답의 messages는 오래된 순)
+    - 더 불러올 쪽지가 있으면 has_more=True, 다음 요청에는 next_before를 before로 보냅니다.
     """
     permission_classes = [permissions.IsAuthenticated]
+    default_limit = 30
+    max_limit = 100
 
     def get(self, request, username):
         user = request.user
@@ -201,10 +236,34 @@ class MessageDetailView(APIView):
         except User.DoesNotExist:
             return Response({"error": "해당 사용자를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        messages = Message.objects.filter(
-            (Q(sender=user) & Q(receiver=participant)) |
-            (Q(sender=participant) & Q(receiver=user))
-        ).order_by('sent_at')
+        try:
+            limit = min(int(request.query_params.get('limit', self.default_limit)), self.max_limit)
+            before = request.query_params.get('before')
+            before = int(before) if before else None
+        except ValueError:
+            return Response({"error": "before, limit은 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        if limit < 1:
+            return Response({"error": "limit은 1 이상이어야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 대화를 열었으므로 받은 쪽지를 읽음 처리 (대화방 안 읽은 개수 0으로)
+        mark_conversation_read(user, participant)
+
+        # (pair_key, sent_at) 인덱스 하나로 두 사람 사이의 쪽지를 최신순으로 읽습니다.
+        messages = Message.objects.filter(pair_key=make_pair_key(user.id, participant.id))
+        if before is not None:
+            anchor = messages.filter(id=before).values_list('sent_at', flat=True).first()
+            if anchor is None:
+                return Response({"error": "기준 쪽지(before)를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+            messages = messages.filter(Q(sent_at__lt=anchor) | Q(sent_at=anchor, id__lt=before))
+
+        page = list(messages.order_by('-sent_at', '-id')[:limit + 1])
+        has_more = len(page) > limit
+        page = page[:limit]
+        page.reverse()
 
-        serializer = MessageSerializer(messages, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response({
+            "participant": {"id": participant.id, "username": participant.username, "nickname": participant.nickname},
+            "messages": MessageHistorySerializer(page, many=True).data,
+            "has_more": has_more,
+            "next_before": page[0].id if has_more else None,
+        }, status=status.HTTP_200_OK)
@@ -3,6 +3,10 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+- http: Django (실시간 알림 스트림 /api/v1/notifications/stream/ 포함)
+- websocket: 대화방 웹소켓 (community/routing.py)
+ASGI 서버에서 실행합니다. 예) daphne config.asgi:application
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -13,4 +17,15 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+# 앱 모듈을 불러오기 전에 Django를 먼저 초기화해야 합니다.
+django_asgi_app = get_asgi_application()
+
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+
+from community.routing import websocket_urlpatterns  # noqa: E402
+
+# 웹소켓은 쿠키가 아니라 JWT(?token=)로 인증하므로 Origin 검사는 하지 않습니다. (CORS_ALLOW_ALL_ORIGINS와 동일한 정책)
+application = ProtocolTypeRouter({
+    'http': django_asgi_app,
+    'websocket': URLRouter(websocket_urlpatterns),
+})
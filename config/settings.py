@@ -36,6 +36,7 @@ ALLOWED_HOSTS = ['172.20.33.191', '127.0.0.1', 'localhost','10.110.192.1', 'youn
 # Application definition
 
 INSTALLED_APPS = [
+    'daphne', # ASGI 서버: runserver도 ASGI로 실행 (웹소켓/실시간 알림 스트림), 반드시 맨 위
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -48,6 +49,7 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt',
     'rest_framework_simplejwt.token_blacklist', # 선택사항: Refresh Token 블랙리스트 관리
     'corsheaders',
+    'channels', # 웹소켓 (쪽지 실시간 전달)
 
     # Local Apps (여기에 추가!)
     'users',
@@ -152,6 +154,103 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 GOOGLE_GEMINI_API_KEY = os.environ.get('GOOGLE_GEMINI_API_KEY')
 KAKAO_API_KEY = os.environ.get('KAKAO_API_KEY')
 
+# 기록 일괄 저장 API(pets/bulk.py) 요청 한 번에 받을 수 있는 최대 항목 수
+PET_LOG_BULK_MAX_ITEMS = 200
+
+# 캘린더 월 그리드 요약(API 6.4)의 months 파라미터 기본값 / 최대값
+CALENDAR_GRID_DEFAULT_MONTHS = 3
+CALENDAR_GRID_MAX_MONTHS = 12
+
+# AI 건강 분석(API 7.3) 처리 방식
+# - False(기본): 기존처럼 요청 안에서 바로 분석 후 200 + 결과 반환
+# - True: 요청은 작업(AiCheckupJob)만 등록하고 202 + job_id를 반환, 분석은 워커가 수행
+#         응답 형식이 바뀌므로 클라이언트가 상태 조회(ai-checkup/jobs/<job_id>/)를 지원하고,
+#         워커(python manage.py run_ai_checkup_worker)를 띄운 뒤에만 켜세요.
+AI_CHECKUP_ASYNC = os.environ.get('AI_CHECKUP_ASYNC', 'False') == 'True'
+AI_CHECKUP_JOB_MAX_ATTEMPTS = 3
+AI_CHECKUP_JOB_STALE_SECONDS = 300 # 이 시간보다 오래 'running'인 작업은 워커가 죽은 것으로 보고 다시 대기열에 넣음
+
+# AI 분석과 주변 병원 검색은 동시에 실행되며, 각자의 제한 시간(초)을 넘기면 기본값으로 대체됩니다.
+AI_MODEL_NAME = 'gemini-pro-latest'
+AI_MODEL_LIST_TTL = 60 * 60 # list_models() 결과 캐시 시간(초)
+AI_CHECKUP_MAX_WORKERS = 8
+AI_ANALYSIS_TIMEOUT = 25
+CLINIC_SEARCH_TIMEOUT = 5
+
+# 주변 동물병원 검색 타일 캐시 (pets/clinics.py)
+CLINIC_SEARCH_BACKEND = 'pets.clinics.KakaoClinicBackend' # 테스트: 'pets.clinics.FakeClinicBackend'
+CLINIC_TILE_SIZE_DEG = 0.01 # 타일 한 변 (위도 기준 약 1.1km)
+CLINIC_TILE_CACHE_ALIAS = 'default'
+CLINIC_TILE_CACHE_TTL = 60 * 60 * 6 # 6시간
+CLINIC_DENSE_TILE_SPLIT = 4 # 타일 목록이 잘리는 밀집 지역은 한 변을 4등분한 작은 타일로 다시 캐시
+CLINIC_FETCH_DEADLINE = 3 # 검색 1회(Kakao 페이지 요청 + 재시도)의 전체 제한 시간(초), CLINIC_SEARCH_TIMEOUT보다 짧게
+
+# 외부 HTTP 호출 공용 클라이언트 (pets/http_client.py)
+OUTBOUND_HTTP_POOL_CONNECTIONS = 4 # 호스트별 연결 풀 개수
+OUTBOUND_HTTP_POOL_MAXSIZE = 16 # 풀 하나당 유지할 최대 연결 수
+OUTBOUND_HTTP_MAX_RETRIES = 2
+OUTBOUND_HTTP_BACKOFF_BASE = 0.1 # 재시도 대기(초): base * 2^n + 지터
+OUTBOUND_HTTP_RETRY_BUDGET_RATIO = 0.2 # 요청 1건당 재시도 토큰 적립량 (재시도는 요청의 약 20%까지)
+OUTBOUND_HTTP_RETRY_BUDGET_MAX = 10
+OUTBOUND_HTTP_BREAKER_THRESHOLD = 5 # 연속 실패 횟수
+OUTBOUND_HTTP_BREAKER_COOLDOWN = 30 # 차단 유지 시간(초)
+
+# ASGI / 웹소켓 (config/asgi.py, community/consumers.py)
+ASGI_APPLICATION = 'config.asgi.application'
+# 채널 레이어: 기본은 프로세스 내 메모리(단일 프로세스, 테스트용).
+# 여러 프로세스로 운영하면 Redis로 교체하세요. (pip install channels-redis)
+#   {'default': {'BACKEND': 'channels_redis.core.RedisChannelLayer', 'CONFIG': {'hosts': [('127.0.0.1', 6379)]}}}
+CHANNEL_LAYERS = {
+    'default': {
+        'BACKEND': 'channels.layers.InMemoryChannelLayer',
+    },
+}
+
+# 알림 발송 (notifications/dispatch.py)
+# True이면 커밋 후 알림 저장을 백그라운드 스레드에서 처리합니다.
+NOTIFICATION_DISPATCH_ASYNC = os.environ.get('NOTIFICATION_DISPATCH_ASYNC', 'False') == 'True'
+# 안 읽은 알림 수 카운터 (notifications/counters.py)
+# 모든 프로세스가 같이 보는 공유 캐시(Redis/Memcached 등)의 CACHES 이름을 지정하세요.
+# 지정하지 않으면(None) 카운터 없이 매번 DB에서 셉니다. (locmem은 프로세스마다 값이 달라 쓰지 않음)
+NOTIFICATION_COUNT_CACHE_ALIAS = os.environ.get('NOTIFICATION_COUNT_CACHE_ALIAS') or None
+NOTIFICATION_UNREAD_COUNT_TTL = 60 * 60 # 만료되면 DB에서 다시 셈 (주기적 보정)
+# 알림 보관 기간 (python manage.py purge_old_notifications)
+NOTIFICATION_RETENTION_DAYS = 90 # 이 기간이 지난 읽은 알림을 정리
+NOTIFICATION_RETENTION_BATCH_SIZE = 1000
+# 실시간 알림 스트림 (notifications/streams.py, ASGI 서버 필요)
+NOTIFICATION_STREAM_HEARTBEAT = 15 # 초
+NOTIFICATION_STREAM_POLL_INTERVAL = int(os.environ.get('NOTIFICATION_STREAM_POLL_INTERVAL', '0')) # 여러 프로세스로 운영 시 DB 확인 주기(초), 0이면 끔
+NOTIFICATION_STREAM_MAX_SECONDS = 60 * 5 # 연결 최대 유지 시간 (이후 클라이언트가 재접속)
+
+# 캐시 설정
+# - 'ai_analysis'는 다른 백엔드로 교체할 수 있습니다. 예)
+#   파일: {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': BASE_DIR / 'cache' / 'ai_analysis'}
+#   DB:   {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'ai_analysis_cache'} (python manage.py createcachetable 필요)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'ai_analysis': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'ai-analysis',
+        'OPTIONS': {'MAX_ENTRIES': 2000},
+    },
+    'pet_pages': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pet-pages',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
+# AI 건강 분석 결과 캐시 (pets/ai_cache.py)
+AI_ANALYSIS_CACHE_ALIAS = 'ai_analysis'
+AI_ANALYSIS_CACHE_TTL = 60 * 60 * 24 * 7 # 7일
+AI_ANALYSIS_CACHE_MAX_ENTRIES = 512 # 프로세스 내 LRU 캐시 크기
+
+# 반려동물별 페이지 응답 캐시 (pets/page_cache.py) - 건강/활동/월별 일정
+PET_PAGE_CACHE_ALIAS = 'pet_pages'
+PET_PAGE_CACHE_TTL = 60 * 60 # 기록이 바뀌면 바로 지워지고, 놓친 항목은 이 시간 후 만료
+
 # 1. 커스텀 User 모델 설정
 AUTH_USER_MODEL = 'users.User'
 
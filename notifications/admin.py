@@ -1,7 +1,7 @@
 # notifications/admin.py (수정)
 
 from django.contrib import admin
-from .models import Notification
+from .models import Notification, NotificationReadState, NotificationArchive
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
@@ -10,4 +10,16 @@ class NotificationAdmin(admin.ModelAdmin):
     # 필터링 옵션 추가
     list_filter = ('is_read', 'notification_type')
     # ❗️ [수정] 'content'를 'message'로 변경
-    search_fields = ('user__username', 'message') # 👈 여기도 수정
\ No newline at end of file
+    search_fields = ('user__username', 'message') # 👈 여기도 수정
+
+@admin.register(NotificationReadState)
+class NotificationReadStateAdmin(admin.ModelAdmin):
+    list_display = ('user', 'last_read_at')
+    search_fields = ('user__username',)
+
+
+@admin.register(NotificationArchive)
+class NotificationArchiveAdmin(admin.ModelAdmin):
+    list_display = ('user', 'message', 'notification_type', 'created_at', 'archived_at')
+    list_filter = ('notification_type',)
+    search_fields = ('user__username', 'message')
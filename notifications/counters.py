@@ -0,0 +1,97 @@
+# notifications/counters.py
+"""
+사용자별 안 읽은 알림 수 카운터
+
+알림 배지는 가장 자주 호출되는 API이므로, 알림 테이블을 세지 않고 캐시의 카운터를 읽습니다.
+- 알림 저장 시 증가 (dispatch.write_notifications)
+- 알림 하나 읽음 처리 시 감소, 모두 읽음 처리 시 0으로
+- 캐시에 값이 없으면 DB에서 한 번 세어 채웁니다. (DB 폴백)
+- 카운터는 NOTIFICATION_UNREAD_COUNT_TTL 후 만료되어 DB 값으로 다시 맞춰지고,
+  python manage.py reconcile_unread_counts 로 한 번에 보정할 수도 있습니다.
+- 카운터는 모든 서버 프로세스가 같이 보는 공유 캐시(Redis/Memcached 등)에 있어야 합니다.
+  NOTIFICATION_COUNT_CACHE_ALIAS가 없으면(None) 카운터를 쓰지 않고 매번 DB에서 셉니다.
+  ((user, created_at) 인덱스 범위 조회. locmem은 프로세스마다 값이 달라 배지가 어긋납니다)
+- 카운터는 표시용입니다. 읽음 처리 등 쓰기 결정은 항상 DB 기준으로 합니다.
+"""
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count
+
+from .models import Notification
+from .read_state import unread_q
+
+
+def _cache():
+    """공유 카운터 캐시 (설정되지 않았으면 None)"""
+    alias = settings.NOTIFICATION_COUNT_CACHE_ALIAS
+    return caches[alias] if alias else None
+
+
+def unread_count_key(user_id):
+    return f"notification-unread:{user_id}"
+
+
+def count_unread_in_db(user_id):
+    return Notification.objects.filter(unread_q(), user_id=user_id).count()
+
+
+def count_unread_by_user(user_ids):
+    """{user_id: 안 읽은 알림 수} (한 번의 GROUP BY 쿼리, 알림이 없는 사용자는 0)"""
+    counts = dict.fromkeys(user_ids, 0)
+    rows = (
+        Notification.objects.filter(unread_q(), user_id__in=user_ids)
+        .order_by().values('user_id').annotate(n=Count('id')).values_list('user_id', 'n')
+    )
+    counts.update(rows)
+    return counts
+
+
+def get_unread_count(user_id):
+    """캐시된 안 읽은 알림 수. 없으면 DB에서 세어 캐시에 넣습니다."""
+    cache = _cache()
+    if cache is None:
+        return count_unread_in_db(user_id)
+    key = unread_count_key(user_id)
+    count = cache.get(key)
+    if count is None:
+        count = count_unread_in_db(user_id)
+        # 그 사이 다른 요청이 먼저 채웠다면 그 값을 유지
+        cache.add(key, count, timeout=settings.NOTIFICATION_UNREAD_COUNT_TTL)
+    return count
+
+
+def increment_unread(user_id, delta=1):
+    """카운터가 캐시에 있을 때만 더합니다. (없으면 다음 조회 때 DB에서 셉니다)"""
+    cache = _cache()
+    if cache is None:
+        return
+    try:
+        value = cache.incr(unread_count_key(user_id), delta)
+    except ValueError:
+        return
+    if value < 0:
+        cache.set(unread_count_key(user_id), 0, timeout=settings.NOTIFICATION_UNREAD_COUNT_TTL)
+
+
+def decrement_unread(user_id, delta=1):
+    increment_unread(user_id, -delta)
+
+
+def reset_unread(user_id, count=0):
+    cache = _cache()
+    if cache is None:
+        return
+    cache.set(unread_count_key(user_id), count, timeout=settings.NOTIFICATION_UNREAD_COUNT_TTL)
+
+
+def reconcile_unread_counts(user_ids):
+    """user_ids의 카운터를 DB 값으로 덮어씁니다."""
+    counts = count_unread_by_user(user_ids)
+    cache = _cache()
+    if cache is None:
+        return counts
+    cache.set_many(
+        {unread_count_key(user_id): count for user_id, count in counts.items()},
+        timeout=settings.NOTIFICATION_UNREAD_COUNT_TTL,
+    )
+    return counts
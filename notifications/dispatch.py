@@ -0,0 +1,191 @@
+# notifications/dispatch.py
+"""
+알림 발송 서비스
+
+댓글/쪽지 등 알림이 필요한 곳은 Notification.objects.create() 대신 notify()를 호출합니다.
+- (받는 사람, 알림 종류, 원본 객체) 기준으로 중복을 제거합니다. (DB에도 같은 기준의 유니크 제약)
+- 트랜잭션 안에서 호출되면 커밋된 뒤에(transaction.on_commit) 한 번에 bulk_create 합니다.
+  롤백되면 알림도 만들어지지 않습니다.
+- settings.NOTIFICATION_DISPATCH_ASYNC가 True이면 저장을 백그라운드 스레드에 넘겨
+  요청이 알림 INSERT를 기다리지 않습니다.
+
+사용 예)
+    from notifications.dispatch import notify
+    notify(post.author_id, 'comment', "...님이 댓글을 남겼습니다.", link=..., source=comment)
+"""
+import logging
+import threading
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+
+from .counters import increment_unread
+from .models import Notification
+from .streams import notification_broker
+
+logger = logging.getLogger(__name__)
+
+
+def source_key_for(source):
+    """원본 객체를 '<모델명>:<pk>' 문자열로 바꿉니다. (예: comment:12) 문자열은 그대로 사용"""
+    if source is None:
+        return None
+    if isinstance(source, str):
+        return source
+    return f"{source._meta.model_name}:{source.pk}"
+
+
+class NotificationBatch:
+    """한 트랜잭션 동안 쌓인 알림 (중복 키 -> Notification)"""
+
+    def __init__(self):
+        self.pending = {}
+
+    def add(self, notification):
+        key = (notification.user_id, notification.notification_type, notification.source_key)
+        # 원본이 없는 알림(source_key=None)은 중복 제거 대상이 아님
+        if not notification.source_key:
+            key += (len(self.pending),)
+        self.pending.setdefault(key, notification)
+
+    def flush(self):
+        notifications = list(self.pending.values())
+        self.pending = {}
+        if notifications:
+            _dispatch(notifications)
+
+
+class _CommitHook:
+    """
+    transaction.on_commit에 등록하는 콜백 (batch를 커밋 후 저장)
+    트랜잭션(또는 이 콜백을 등록한 savepoint)이 롤백되면 Django가 콜백을 버리므로,
+    스레드 로컬에는 약한 참조만 두어 '현재 트랜잭션에 등록된 batch가 있는지' 판단합니다.
+    """
+
+    def __init__(self):
+        self.batch = NotificationBatch()
+
+    def __call__(self):
+        if _registered_hook() is self:
+            _local.hook = None
+        self.batch.flush()
+
+
+_local = threading.local()
+
+# 알림 저장 전용 백그라운드 스레드 (NOTIFICATION_DISPATCH_ASYNC=True 일 때만 사용)
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='notification-dispatch')
+
+
+def _registered_hook():
+    ref = _local.__dict__.get('hook')
+    return ref() if ref is not None else None
+
+
+def _current_batch():
+    hook = _registered_hook()
+    if hook is None:
+        hook = _CommitHook()
+        transaction.on_commit(hook)
+        _local.hook = weakref.ref(hook)
+    return hook.batch
+
+
+def _dedupe_key(notification):
+    return (notification.user_id, notification.notification_type, notification.source_key)
+
+
+def _unsaved_only(notifications):
+    """같은 (받는 사람, 종류, 원본) 알림이 DB나 목록 앞쪽에 이미 있으면 뺍니다."""
+    keyed = [n for n in notifications if n.source_key]
+    existing = set()
+    if keyed:
+        existing = set(
+            Notification.objects.filter(
+                user_id__in={n.user_id for n in keyed},
+                source_key__in={n.source_key for n in keyed},
+            ).order_by().values_list('user_id', 'notification_type', 'source_key')
+        )
+    unsaved = []
+    for notification in notifications:
+        if notification.source_key:
+            key = _dedupe_key(notification)
+            if key in existing:
+                continue
+            existing.add(key)
+        unsaved.append(notification)
+    return unsaved
+
+
+def _inserted_only(notifications):
+    """
+    bulk_create(ignore_conflicts=True)는 건너뛴 행까지 넘긴 목록을 그대로 돌려주므로,
+    같은 트랜잭션에서 (받는 사람, 종류, 원본)으로 다시 읽어 created_at이 이 알림과 같은 행만 남깁니다.
+    (건너뛴 알림의 행은 먼저 저장한 요청의 created_at을 가집니다. 원본이 없는 알림은 충돌하지 않음)
+    """
+    keyed = [n for n in notifications if n.source_key]
+    if not keyed:
+        return notifications
+    saved = set(
+        Notification.objects.filter(
+            user_id__in={n.user_id for n in keyed},
+            source_key__in={n.source_key for n in keyed},
+        ).order_by().values_list('user_id', 'notification_type', 'source_key', 'created_at')
+    )
+    return [
+        n for n in notifications
+        if not n.source_key or (*_dedupe_key(n), n.created_at) in saved
+    ]
+
+
+def write_notifications(notifications):
+    """
+    아직 없는 알림만 INSERT 한 번으로 저장하고, 실제로 저장된 알림 기준으로
+    받는 사람별 안 읽은 알림 카운터를 올린 뒤 실시간 스트림에 알립니다.
+    (확인과 저장 사이에 다른 요청이 같은 알림을 저장하면 유니크 제약으로 건너뛰고, 세지 않습니다)
+    """
+    with transaction.atomic():
+        notifications = _unsaved_only(notifications)
+        Notification.objects.bulk_create(notifications, ignore_conflicts=True)
+        created = _inserted_only(notifications)
+    for user_id, count in Counter(n.user_id for n in created).items():
+        increment_unread(user_id, count)
+        notification_broker.publish(user_id) # 열려 있는 실시간 알림 스트림(streams.py) 깨우기
+    return created
+
+
+def _dispatch(notifications):
+    if settings.NOTIFICATION_DISPATCH_ASYNC:
+        _executor.submit(_write_in_worker, notifications)
+    else:
+        write_notifications(notifications)
+
+
+def _write_in_worker(notifications):
+    try:
+        write_notifications(notifications)
+    except Exception:
+        logger.exception("알림 %d건 저장 실패", len(notifications))
+    finally:
+        connections.close_all()
+
+
+def notify(user_id, notification_type, message, link=None, source=None):
+    """
+    user_id에게 알림을 보냅니다.
+    트랜잭션 밖이면 바로 저장하고, 트랜잭션 안이면 커밋 후 모아서 저장합니다.
+    """
+    notification = Notification(
+        user_id=user_id,
+        notification_type=notification_type,
+        message=message,
+        link=link,
+        source_key=source_key_for(source),
+    )
+    if not connection.in_atomic_block:
+        _dispatch([notification])
+        return
+    _current_batch().add(notification)
@@ -0,0 +1,33 @@
+# notifications/management/commands/purge_old_notifications.py
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from notifications.retention import expired_read_notifications, purge_expired_notifications
+
+
+class Command(BaseCommand):
+    """
+    보관 기간이 지난 읽은 알림을 정리합니다. (cron 등으로 하루 한 번 실행)
+    - python manage.py purge_old_notifications
+    - 보관 테이블로 옮기기: python manage.py purge_old_notifications --archive
+    - 확인만: python manage.py purge_old_notifications --dry-run
+    """
+    help = "보관 기간이 지난 읽은 알림을 배치 단위로 삭제(또는 보관)합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.NOTIFICATION_RETENTION_DAYS, help="보관 기간(일)")
+        parser.add_argument('--batch-size', type=int, default=settings.NOTIFICATION_RETENTION_BATCH_SIZE, help="한 번에 정리할 알림 수")
+        parser.add_argument('--archive', action='store_true', help="삭제 전에 NotificationArchive로 옮김")
+        parser.add_argument('--dry-run', action='store_true', help="정리하지 않고 대상 알림 수만 출력")
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            count = expired_read_notifications(options['days']).count()
+            self.stdout.write(self.style.SUCCESS(f"정리 대상 알림 {count}건을 발견했습니다."))
+            return
+
+        count = purge_expired_notifications(
+            options['days'], batch_size=options['batch_size'], archive=options['archive']
+        )
+        verb = "보관" if options['archive'] else "삭제"
+        self.stdout.write(self.style.SUCCESS(f"{options['days']}일이 지난 읽은 알림 {count}건을 {verb}했습니다."))
@@ -0,0 +1,36 @@
+# notifications/management/commands/reconcile_unread_counts.py
+from django.core.management.base import BaseCommand
+
+from users.models import User
+from notifications.counters import reconcile_unread_counts
+
+
+class Command(BaseCommand):
+    """
+    캐시된 안 읽은 알림 카운터를 DB 값으로 다시 맞춥니다. (cron 등으로 주기적으로 실행)
+    - python manage.py reconcile_unread_counts
+    - 특정 사용자만: python manage.py reconcile_unread_counts --user 3 --user 7
+    """
+    help = "사용자별 안 읽은 알림 수 카운터를 DB 기준으로 복구합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='user_ids', help="대상 사용자 ID (여러 번 지정 가능)")
+        parser.add_argument('--batch-size', type=int, default=500, help="한 번에 집계할 사용자 수")
+
+    def handle(self, *args, **options):
+        if options['user_ids']:
+            user_ids = options['user_ids']
+        else:
+            user_ids = User.objects.order_by('id').values_list('id', flat=True).iterator()
+
+        total = 0
+        batch = []
+        for user_id in user_ids:
+            batch.append(user_id)
+            if len(batch) >= options['batch_size']:
+                total += len(reconcile_unread_counts(batch))
+                batch = []
+        if batch:
+            total += len(reconcile_unread_counts(batch))
+
+        self.stdout.write(self.style.SUCCESS(f"사용자 {total}명의 안 읽은 알림 수를 다시 계산했습니다."))
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_remove_notification_content_notification_message_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='source_key',
+            field=models.CharField(blank=True, default='', max_length=100, verbose_name='원본 객체 키'),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(condition=models.Q(('source_key', ''), _negated=True), fields=('user', 'notification_type', 'source_key'), name='notification_unique_source'),
+        ),
+    ]
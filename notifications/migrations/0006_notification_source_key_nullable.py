@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def empty_source_key_to_null(apps, schema_editor):
+    # 원본 없는 기존 알림('')이 새 유니크 제약에 걸리지 않도록 NULL로 바꿉니다.
+    for model_name in ('Notification', 'NotificationArchive'):
+        apps.get_model('notifications', model_name).objects.filter(source_key='').update(source_key=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_notification_retention'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='notification',
+            name='notification_unique_source',
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='source_key',
+            field=models.CharField(blank=True, max_length=100, null=True, verbose_name='원본 객체 키'),
+        ),
+        migrations.AlterField(
+            model_name='notificationarchive',
+            name='source_key',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.RunPython(empty_source_key_to_null, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(fields=('user', 'notification_type', 'source_key'), name='notification_unique_source'),
+        ),
+    ]
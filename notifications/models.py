@@ -21,9 +21,65 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     link = models.URLField(blank=True, null=True)
+    # 알림을 만든 원본 객체 (예: 'comment:12'). 같은 원본으로 같은 사람에게 알림이 두 번 가지 않도록 합니다.
+    # 원본이 없는 알림은 NULL (유니크 제약에서 NULL끼리는 중복으로 보지 않음)
+    source_key = models.CharField(max_length=100, blank=True, null=True, verbose_name="원본 객체 키")
 
     class Meta:
         ordering = ['-created_at'] 
+        indexes = [
+            # 사용자별 알림 목록 커서 페이지네이션 (user, created_at, id)
+            models.Index(fields=['user', '-created_at', '-id'], name='notification_user_created_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'notification_type', 'source_key'],
+                name='notification_unique_source',
+            ),
+        ]
 
     def __str__(self):
-        return f"[{self.user.username}] {self.message}"
\ No newline at end of file
+        return f"[{self.user.username}] {self.message}"
+
+class NotificationReadState(models.Model):
+    """
+    사용자별 알림 읽음 기준 시각 (워터마크)
+    created_at <= last_read_at 인 알림은 is_read 값과 관계없이 읽은 것으로 봅니다.
+    '모두 읽음'은 알림 행을 수정하지 않고 이 행 하나만 갱신합니다.
+    """
+    user = models.OneToOneField(
+        User,
+        primary_key=True,
+        related_name='notification_read_state',
+        on_delete=models.CASCADE,
+        verbose_name="사용자"
+    )
+    last_read_at = models.DateTimeField(null=True, blank=True, verbose_name="모두 읽음 처리 시각")
+
+    def __str__(self):
+        return f"[{self.user.username}] {self.last_read_at}"
+
+
+class NotificationArchive(models.Model):
+    """
+    보관 기간이 지난 읽은 알림 (python manage.py purge_old_notifications --archive)
+    알림 목록/개수 조회에는 쓰이지 않으며, 원본 테이블을 작게 유지하기 위한 보관용입니다.
+    """
+    user = models.ForeignKey(
+        User,
+        related_name='archived_notifications',
+        on_delete=models.CASCADE,
+        verbose_name="알림을 받은 유저"
+    )
+    message = models.CharField(max_length=255)
+    notification_type = models.CharField(max_length=50)
+    link = models.URLField(blank=True, null=True)
+    source_key = models.CharField(max_length=100, blank=True, null=True)
+    created_at = models.DateTimeField(verbose_name="알림 생성 시각")
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"[{self.user.username}] {self.message} (보관)"
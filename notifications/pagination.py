@@ -0,0 +1,14 @@
+# notifications/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class NotificationCursorPagination(CursorPagination):
+    """
+    알림 목록(API 10.1) 커서 페이지네이션 - 최신순 (created_at, id)
+    - GET /notifications/?cursor=...&page_size=20
+    - 응답: {"next": "...", "previous": "...", "results": [...]}
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,34 @@
+# notifications/read_state.py
+"""
+알림 읽음 상태 계산
+
+알림은 다음 중 하나면 읽은 것으로 봅니다.
+- 개별 읽음 처리된 경우 (Notification.is_read=True)
+- 사용자의 워터마크(NotificationReadState.last_read_at) 이전에 만들어진 경우
+
+목록/개수 조회는 이 기준을 쿼리 안에서 계산하므로 알림 행을 수정하지 않습니다.
+"""
+from django.db.models import BooleanField, Case, F, Q, Value, When
+from django.utils import timezone
+
+from .models import NotificationReadState
+
+
+def unread_q():
+    """Notification 쿼리에서 쓰는 '안 읽은 알림' 조건"""
+    watermark = 'user__notification_read_state__last_read_at'
+    return Q(is_read=False) & (Q(**{f'{watermark}__isnull': True}) | Q(created_at__gt=F(watermark)))
+
+
+def with_read_state(queryset):
+    """각 알림에 실제 읽음 여부(read_state)를 붙입니다."""
+    return queryset.annotate(
+        read_state=Case(When(unread_q(), then=Value(False)), default=Value(True), output_field=BooleanField())
+    )
+
+
+def mark_all_read(user):
+    """워터마크를 지금으로 옮겨, 지금까지 받은 알림을 모두 읽음 처리합니다. (행 하나만 쓰기)"""
+    now = timezone.now()
+    NotificationReadState.objects.update_or_create(user=user, defaults={'last_read_at': now})
+    return now
@@ -0,0 +1,48 @@
+# notifications/retention.py
+"""
+알림 보관 기간 정리
+
+보관 기간(NOTIFICATION_RETENTION_DAYS)이 지난 '읽은' 알림을 정해진 크기의 배치로
+삭제(또는 NotificationArchive로 옮긴 뒤 삭제)합니다. 안 읽은 알림은 남겨 둡니다.
+배치마다 짧은 트랜잭션으로 처리하므로 알림 테이블을 오래 잠그지 않습니다.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Notification, NotificationArchive
+from .read_state import with_read_state
+
+ARCHIVE_FIELDS = ('user_id', 'message', 'notification_type', 'link', 'source_key', 'created_at')
+
+
+def expired_read_notifications(days):
+    """days일보다 오래된 읽은 알림 (개별 읽음 또는 워터마크 이전)"""
+    cutoff = timezone.now() - timedelta(days=days)
+    return with_read_state(Notification.objects.filter(created_at__lt=cutoff)).filter(read_state=True)
+
+
+def purge_batch(ids, archive=False):
+    """ids의 알림을 (archive=True면 보관 테이블로 옮긴 뒤) 삭제합니다."""
+    with transaction.atomic():
+        if archive:
+            rows = Notification.objects.filter(id__in=ids).values(*ARCHIVE_FIELDS)
+            NotificationArchive.objects.bulk_create([NotificationArchive(**row) for row in rows])
+        deleted, _ = Notification.objects.filter(id__in=ids).delete()
+    return deleted
+
+
+def purge_expired_notifications(days, batch_size=1000, archive=False):
+    """보관 기간이 지난 읽은 알림을 batch_size개씩 정리하고, 정리한 개수를 반환합니다."""
+    total = 0
+    while True:
+        ids = list(
+            expired_read_notifications(days).order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        total += purge_batch(ids, archive=archive)
+        if len(ids) < batch_size:
+            break
+    return total
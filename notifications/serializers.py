@@ -5,7 +5,10 @@ from .models import Notification
 class NotificationSerializer(serializers.ModelSerializer):
     """
     API 명세서 10.1: 알림 목록 조회를 위한 Serializer
+    - is_read: 개별 읽음 또는 '모두 읽음' 워터마크 기준의 실제 읽음 여부
+      (read_state.with_read_state()로 조회한 경우 그 값을 사용)
     """
+    is_read = serializers.SerializerMethodField()
 
     class Meta:
         model = Notification
@@ -13,4 +16,7 @@ class NotificationSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'message', 'is_read', 'created_at', 'link', 'notification_type'
         ]
-        read_only_fields = fields
\ No newline at end of file
+        read_only_fields = fields
+
+    def get_is_read(self, obj):
+        return getattr(obj, 'read_state', obj.is_read)
\ No newline at end of file
@@ -0,0 +1,141 @@
+# notifications/streams.py
+"""
+실시간 알림 스트림 (Server-Sent Events, ASGI 전용)
+
+- 알림이 저장되면(dispatch.write_notifications) notification_broker.publish(user_id)로
+  같은 프로세스에서 열려 있는 그 사용자의 스트림을 깨웁니다.
+- 깨어난 스트림은 마지막으로 보낸 알림 id 이후의 알림만 DB에서 읽어 보냅니다.
+  SSE 이벤트 id가 알림 id이므로, 재접속 시 Last-Event-ID로 놓친 알림부터 이어 받습니다.
+- 여러 프로세스로 운영하면 다른 프로세스에서 저장된 알림은 publish가 닿지 않으므로
+  NOTIFICATION_STREAM_POLL_INTERVAL(초)마다 DB를 확인하도록 설정합니다. (0이면 끔)
+- 연결이 끊기지 않았는지 확인할 수 있도록 NOTIFICATION_STREAM_HEARTBEAT 초마다 주석 행을 보냅니다.
+- 연결은 NOTIFICATION_STREAM_MAX_SECONDS 후 서버가 닫고, 클라이언트(EventSource)가 자동 재접속합니다.
+- 스트림은 오래 열려 있으므로 DB 조회는 database_sync_to_async로 실행해, 조회 전후로
+  끊겼거나 오래된 DB 연결을 정리합니다. (close_old_connections)
+"""
+import asyncio
+import json
+import threading
+from collections import defaultdict
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import Notification
+from .serializers import NotificationSerializer
+
+FETCH_LIMIT = 100 # 한 번 깨어났을 때 DB에서 읽는 최대 알림 수
+RETRY_MS = 3000 # 끊겼을 때 EventSource 재접속 대기 시간
+
+
+class Subscription:
+    """스트림 하나의 구독 (새 알림이 있으면 wakeup이 set 됩니다)"""
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.wakeup = asyncio.Event()
+
+    def notify(self):
+        try:
+            self.loop.call_soon_threadsafe(self.wakeup.set)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘 (연결 종료 직후)
+            pass
+
+
+class NotificationBroker:
+    """프로세스 안의 알림 pub/sub. publish는 어느 스레드에서 호출해도 됩니다."""
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        subscription = Subscription(user_id)
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def publish(self, user_id):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            subscription.notify()
+
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+notification_broker = NotificationBroker()
+
+
+def format_event(event_id, data, event='notification'):
+    payload = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False)
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n"
+
+
+@database_sync_to_async
+def latest_notification_id(user_id):
+    return Notification.objects.filter(user_id=user_id).order_by('-id').values_list('id', flat=True).first() or 0
+
+
+@database_sync_to_async
+def notifications_after(user_id, last_id):
+    rows = Notification.objects.filter(user_id=user_id, id__gt=last_id).order_by('id')[:FETCH_LIMIT]
+    return [(row.id, NotificationSerializer(row).data) for row in rows]
+
+
+async def notification_events(user_id, last_event_id=None):
+    """
+    user_id의 알림을 SSE 형식 문자열로 내보내는 비동기 제너레이터
+    last_event_id가 없으면 지금 이후의 알림만, 있으면 그 이후의 알림부터 보냅니다.
+    """
+    loop = asyncio.get_running_loop()
+    heartbeat = settings.NOTIFICATION_STREAM_HEARTBEAT
+    poll_interval = settings.NOTIFICATION_STREAM_POLL_INTERVAL
+    deadline = loop.time() + settings.NOTIFICATION_STREAM_MAX_SECONDS
+
+    subscription = notification_broker.subscribe(user_id)
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        if last_event_id is None:
+            last_event_id = await latest_notification_id(user_id)
+            pending = False
+        else:
+            pending = True # 재접속: 놓친 알림부터 확인
+
+        last_write = loop.time()
+        while loop.time() < deadline:
+            if pending:
+                subscription.wakeup.clear()
+                rows = await notifications_after(user_id, last_event_id)
+                for event_id, data in rows:
+                    last_event_id = event_id
+                    yield format_event(event_id, data)
+                if rows:
+                    last_write = loop.time()
+                if len(rows) == FETCH_LIMIT:
+                    continue
+
+            wait = min(poll_interval or heartbeat, heartbeat, max(0, deadline - loop.time()))
+            try:
+                await asyncio.wait_for(subscription.wakeup.wait(), timeout=wait)
+                pending = True
+            except asyncio.TimeoutError:
+                pending = bool(poll_interval)
+                if loop.time() - last_write >= heartbeat:
+                    yield ": heartbeat\n\n"
+                    last_write = loop.time()
+    finally:
+        notification_broker.unsubscribe(subscription)
@@ -1,3 +1,263 @@
-from django.test import TestCase
+import asyncio
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import User
+from community.models import Post, Comment, Message
+from .counters import unread_count_key
+from .dispatch import notify, write_notifications
+from .models import Notification, NotificationReadState, NotificationArchive
+from .streams import notification_broker, notification_events
+
+
+def create_user(username):
+    return User.objects.create_user(
+        username=username, password='pw', email=f'{username}@example.com', nickname=f'{username}-닉네임'
+    )
+
+
+class NotificationAPITestCase(TestCase):
+    def setUp(self):
+        self.user = create_user('reader')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+
+@override_settings(NOTIFICATION_DISPATCH_ASYNC=False)
+class NotificationDispatchTests(NotificationAPITestCase):
+    """알림은 커밋 후 한 번에, 원본 객체당 한 번만 저장되어야 합니다."""
+
+    def test_message_creates_single_notification(self):
+        sender = create_user('sender')
+        self.client.force_authenticate(user=sender)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('message-list-create'), {'receiver': self.user.id, 'content': '안녕'})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(list(Notification.objects.values_list('user', 'notification_type')), [(self.user.id, 'message')])
+
+    def test_writes_are_deferred_and_batched(self):
+        post = Post.objects.create(author=self.user, title='t', content='c')
+        commenter = create_user('commenter')
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                comments = [Comment.objects.create(post=post, author=commenter, content=str(i)) for i in range(3)]
+                notify(self.user.id, 'comment', 'dup', source=comments[0])
+            self.assertFalse(Notification.objects.exists())
+
+        self.assertEqual(len(callbacks), 1)
+        with CaptureQueriesContext(connection) as ctx:
+            callbacks[0]()
+        statements = [q['sql'].split()[0].upper() for q in ctx.captured_queries]
+        # 이미 있는 알림 확인 1회 + INSERT 1회 + 실제 저장된 행 확인 1회 (savepoint 문장 제외)
+        self.assertEqual([sql for sql in statements if sql in ('SELECT', 'INSERT')], ['SELECT', 'INSERT', 'SELECT'])
+        self.assertEqual(Notification.objects.filter(user=self.user, notification_type='comment').count(), 3)
+
+    def test_rollback_discards_notifications(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    notify(self.user.id, 'comment', 'x', source='comment:1')
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            with transaction.atomic():
+                notify(self.user.id, 'comment', 'y', source='comment:2')
+        self.assertEqual(list(Notification.objects.values_list('message', flat=True)), ['y'])
+
+    @override_settings(NOTIFICATION_COUNT_CACHE_ALIAS='default')
+    def test_duplicate_source_is_ignored_across_transactions(self):
+        sender = create_user('sender')
+        with self.captureOnCommitCallbacks(execute=True):
+            message = Message.objects.create(sender=sender, receiver=self.user, content='hi')
+        cache = caches[settings.NOTIFICATION_COUNT_CACHE_ALIAS]
+        cache.set(unread_count_key(self.user.id), 1)
+        with mock.patch.object(notification_broker, 'publish') as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                notify(self.user.id, 'message', 'again', source=message)
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 1)
+        # 건너뛴 중복 알림은 카운터/실시간 스트림에 반영하지 않음
+        self.assertEqual(cache.get(unread_count_key(self.user.id)), 1)
+        publish.assert_not_called()
+
+    @override_settings(NOTIFICATION_COUNT_CACHE_ALIAS='default')
+    def test_row_saved_after_check_is_not_counted(self):
+        # 중복 확인(_unsaved_only)과 INSERT 사이에 다른 요청이 같은 알림을 먼저 저장한 경우
+        Notification.objects.create(user=self.user, message='first', notification_type='comment', source_key='comment:1')
+        cache = caches[settings.NOTIFICATION_COUNT_CACHE_ALIAS]
+        cache.set(unread_count_key(self.user.id), 1)
+        with mock.patch('notifications.dispatch._unsaved_only', side_effect=lambda notifications: notifications), \
+                mock.patch.object(notification_broker, 'publish') as publish, \
+                self.captureOnCommitCallbacks(execute=True):
+            notify(self.user.id, 'comment', 'second', source='comment:1')
+            notify(self.user.id, 'comment', 'other', source='comment:2')
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(cache.get(unread_count_key(self.user.id)), 2)
+        self.assertEqual(publish.call_count, 1)
+
+    def test_batch_is_dropped_with_rolled_back_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    notify(self.user.id, 'comment', 'lost', source='comment:1')
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            with transaction.atomic():
+                with transaction.atomic():
+                    notify(self.user.id, 'comment', 'a', source='comment:2')
+                notify(self.user.id, 'comment', 'b', source='comment:3')
+        self.assertEqual(sorted(Notification.objects.values_list('message', flat=True)), ['a', 'b'])
+
+
+# 테스트는 한 프로세스에서 실행되므로 locmem 'default' 캐시를 공유 캐시처럼 사용
+@override_settings(NOTIFICATION_DISPATCH_ASYNC=False, NOTIFICATION_COUNT_CACHE_ALIAS='default')
+class UnreadCountTests(NotificationAPITestCase):
+    """안 읽은 알림 수는 캐시 카운터로 응답하고, 읽음 처리에 맞춰 바뀌어야 합니다."""
+
+    def setUp(self):
+        super().setUp()
+        caches[settings.NOTIFICATION_COUNT_CACHE_ALIAS].clear()
+
+    def unread_count(self):
+        return self.client.get(reverse('notification-unread-count')).json()['unread_count']
+
+    def test_counter_follows_create_and_read(self):
+        Notification.objects.create(user=self.user, message='old', notification_type='comment')
+        self.assertEqual(self.unread_count(), 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.unread_count(), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            notify(self.user.id, 'comment', 'a', source='comment:1')
+            notify(self.user.id, 'comment', 'b', source='comment:2')
+        self.assertEqual(self.unread_count(), 3)
+
+        first = Notification.objects.filter(user=self.user).first()
+        self.client.post(reverse('notification-read', args=[first.id]))
+        self.assertEqual(self.unread_count(), 2)
+
+        self.client.post(reverse('notification-read-all'))
+        self.assertEqual(self.unread_count(), 0)
+
+    def test_reconcile_command_fixes_drift(self):
+        Notification.objects.create(user=self.user, message='x', notification_type='comment')
+        cache = caches[settings.NOTIFICATION_COUNT_CACHE_ALIAS]
+        cache.set(unread_count_key(self.user.id), 42)
+        call_command('reconcile_unread_counts', stdout=StringIO())
+        self.assertEqual(self.unread_count(), 1)
+
+    def test_stale_zero_counter_does_not_block_read_all(self):
+        # 다른 프로세스가 저장한 알림을 이 카운터가 모르는 경우
+        Notification.objects.create(user=self.user, message='x', notification_type='comment')
+        caches[settings.NOTIFICATION_COUNT_CACHE_ALIAS].set(unread_count_key(self.user.id), 0)
+        response = self.client.post(reverse('notification-read-all'))
+        self.assertEqual(response.json()['message'], "총 1개의 알림을 모두 읽음 처리했습니다.")
+        self.assertTrue(NotificationReadState.objects.filter(user=self.user).exists())
+
+    @override_settings(NOTIFICATION_COUNT_CACHE_ALIAS=None)
+    def test_without_shared_cache_counts_in_db(self):
+        Notification.objects.create(user=self.user, message='x', notification_type='comment')
+        caches['default'].set(unread_count_key(self.user.id), 42)
+        self.assertEqual(self.unread_count(), 1)
+
+
+class ReadWatermarkTests(NotificationAPITestCase):
+    """'모두 읽음'은 알림 행을 수정하지 않고 워터마크만 옮겨야 합니다."""
+
+    def test_read_all_moves_watermark_only(self):
+        for i in range(3):
+            Notification.objects.create(user=self.user, message=str(i), notification_type='comment')
+
+        self.client.post(reverse('notification-read-all'))
+        self.assertEqual(Notification.objects.filter(is_read=True).count(), 0)
+        self.assertTrue(NotificationReadState.objects.filter(user=self.user).exists())
+
+        Notification.objects.create(user=self.user, message='new', notification_type='comment')
+        self.assertEqual(self.client.get(reverse('notification-unread-count')).json()['unread_count'], 1)
+
+        rows = self.client.get(reverse('notification-list')).json()['results']
+        self.assertEqual([(row['message'], row['is_read']) for row in rows][0], ('new', False))
+        self.assertTrue(all(row['is_read'] for row in rows[1:]))
+
+    def test_read_before_watermark_is_noop(self):
+        notification = Notification.objects.create(user=self.user, message='x', notification_type='comment')
+        self.client.post(reverse('notification-read-all'))
+        response = self.client.post(reverse('notification-read', args=[notification.id]))
+        self.assertEqual(response.json()['message'], "이미 읽음 처리된 알림입니다.")
+
+
+class NotificationRetentionTests(NotificationAPITestCase):
+    """보관 기간이 지난 읽은 알림만 배치로 정리되어야 합니다."""
+
+    def create(self, message, days_ago, is_read=False):
+        notification = Notification.objects.create(user=self.user, message=message, notification_type='comment', is_read=is_read)
+        Notification.objects.filter(id=notification.id).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return notification
+
+    def test_purge_keeps_unread_and_recent(self):
+        for i in range(5):
+            self.create(f'old-read-{i}', 100, is_read=True)
+        self.create('old-unread', 100)
+        self.create('recent-read', 1, is_read=True)
+
+        call_command('purge_old_notifications', '--days', '90', '--batch-size', '2', '--archive', stdout=StringIO())
+
+        self.assertEqual(sorted(Notification.objects.values_list('message', flat=True)), ['old-unread', 'recent-read'])
+        self.assertEqual(NotificationArchive.objects.filter(user=self.user).count(), 5)
+
+    def test_watermark_counts_as_read(self):
+        self.create('old', 100)
+        NotificationReadState.objects.create(user=self.user, last_read_at=timezone.now() - timedelta(days=50))
+        call_command('purge_old_notifications', '--days', '90', stdout=StringIO())
+        self.assertFalse(Notification.objects.exists())
+
+    def test_list_is_cursor_paginated(self):
+        for i in range(3):
+            self.create(str(i), i)
+        page = self.client.get(reverse('notification-list'), {'page_size': 2}).json()
+        self.assertEqual([row['message'] for row in page['results']], ['0', '1'])
+        rest = self.client.get(page['next']).json()
+        self.assertEqual([row['message'] for row in rest['results']], ['2'])
+
+
+@override_settings(NOTIFICATION_DISPATCH_ASYNC=False, NOTIFICATION_STREAM_HEARTBEAT=0.2, NOTIFICATION_STREAM_POLL_INTERVAL=0)
+class NotificationStreamTests(NotificationAPITestCase):
+    """실시간 알림 스트림은 Last-Event-ID 이후 알림과 새로 저장된 알림을 보내야 합니다."""
+
+    async def next_event(self, stream):
+        return await asyncio.wait_for(anext(stream), timeout=2)
+
+    async def test_resume_then_push(self):
+        missed = await Notification.objects.acreate(user=self.user, message='missed', notification_type='comment')
+        stream = notification_events(self.user.id, last_event_id=0)
+        try:
+            self.assertTrue((await self.next_event(stream)).startswith('retry:'))
+            self.assertIn(f"id: {missed.id}\n", await self.next_event(stream))
+
+            await sync_to_async(write_notifications)([
+                Notification(user=self.user, message='live', notification_type='comment', source_key='comment:9')
+            ])
+            event = await self.next_event(stream)
+            self.assertIn('"message": "live"', event)
+
+            self.assertEqual(await self.next_event(stream), ": heartbeat\n\n")
+        finally:
+            await stream.aclose()
+        self.assertEqual(notification_broker.subscriber_count(), 0)
+
+    def test_stream_requires_token(self):
+        self.assertEqual(Client().get(reverse('notification-stream')).status_code, 401)
+        response = Client().get(reverse('notification-stream'), {'token': 'not-a-token'})
+        self.assertEqual(response.status_code, 401)
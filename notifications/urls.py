@@ -1,12 +1,20 @@
 # notifications/urls.py
 from django.urls import path
-from .views import NotificationListView, NotificationReadView, NotificationReadAllView
+from .views import NotificationListView, NotificationReadView, NotificationReadAllView, NotificationUnreadCountView, NotificationStreamView
 
 urlpatterns = [
     # 10.1 알림 목록 조회
     # GET /api/v1/notifications/
     path('', NotificationListView.as_view(), name='notification-list'),
     
+    # 10.3 안 읽은 알림 수 (배지)
+    # GET /api/v1/notifications/unread-count/
+    path('unread-count/', NotificationUnreadCountView.as_view(), name='notification-unread-count'),
+
+    # 10.4 실시간 알림 스트림 (SSE)
+    # GET /api/v1/notifications/stream/
+    path('stream/', NotificationStreamView.as_view(), name='notification-stream'),
+
     # 10.2 모든 알림 읽음 처리
     # POST /api/v1/notifications/read-all/
     path('read-all/', NotificationReadAllView.as_view(), name='notification-read-all'),
@@ -2,28 +2,48 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from users.authentication import raw_token_from_request, user_from_token
 from .models import Notification
 from .serializers import NotificationSerializer
+from .counters import get_unread_count, count_unread_in_db, decrement_unread, reset_unread
+from .read_state import with_read_state, mark_all_read
+from .pagination import NotificationCursorPagination
+from .streams import notification_events
 
 class NotificationListView(generics.ListAPIView):
     """
     API 명세서 10.1: 알림 목록 조회 (GET /notifications/)
     - [수정] 로그인한 본인의 "모든" 알림 목록을 반환합니다.
+    - 최신순 커서 페이지네이션 (?cursor=...&page_size=20, (user, created_at, id) 인덱스 사용)
     """
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated] # ❗️ 로그인 필수
+    pagination_class = NotificationCursorPagination
 
     def get_queryset(self):
         # ❗️ [수정] "is_read=False" 필터를 "삭제"합니다.
         # 프론트엔드가 모든 알림을 받아 직접 '읽음'/'안읽음'을 구분합니다.
-        queryset = Notification.objects.filter(
+        # 읽음 여부(read_state)는 is_read와 읽음 워터마크로 쿼리 안에서 계산합니다.
+        queryset = with_read_state(Notification.objects.filter(
             user=self.request.user
-        ).order_by('-created_at') # 👈 is_read=False 필터 삭제
+        )) # 👈 is_read=False 필터 삭제 (정렬은 NotificationCursorPagination)
         return queryset
 
     # ❗️ [삭제 완료] list 메서드를 삭제했습니다.
-    # generics.ListAPIView가 get_queryset 결과를 
-    # 자동으로 [ ... ] 리스트로 반환해 줍니다.
+    # generics.ListAPIView가 get_queryset 결과를 페이지 단위로 반환해 줍니다.
+
+
+class NotificationUnreadCountView(APIView):
+    """
+    API 명세서 10.3: 안 읽은 알림 수 조회 (GET /notifications/unread-count/)
+    - 알림 배지용. 공유 캐시의 사용자별 카운터(counters.py)를 읽습니다. (설정되지 않았으면 DB에서 셈)
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response({"unread_count": get_unread_count(request.user.id)}, status=status.HTTP_200_OK)
 
 
 class NotificationReadView(APIView):
@@ -36,15 +56,16 @@ class NotificationReadView(APIView):
     def post(self, request, notification_id):
         try:
             # 1. 알림 ID로 객체를 찾되, 본인(request.user)의 알림이 맞는지 확인
-            notification = Notification.objects.get(id=notification_id, user=request.user)
+            notification = with_read_state(Notification.objects.filter(user=request.user)).get(id=notification_id)
             
-            # 2. 이미 읽었다면 추가 작업 없이 성공 응답
-            if notification.is_read:
+            # 2. 이미 읽었다면 (개별 읽음 또는 '모두 읽음' 이전 알림) 추가 작업 없이 성공 응답
+            if notification.read_state:
                 return Response({"message": "이미 읽음 처리된 알림입니다."}, status=status.HTTP_200_OK)
                 
             # 3. 읽음 처리 (is_read=True)
             notification.is_read = True
-            notification.save()
+            notification.save(update_fields=['is_read'])
+            decrement_unread(request.user.id)
             
             return Response({"message": "알림을 읽음 처리했습니다."}, status=status.HTTP_200_OK)
             
@@ -60,14 +81,44 @@ class NotificationReadAllView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
-        # 1. 로그인한 사용자의 "읽지 않은(is_read=False)" 알림만 모두 찾음
-        unread_notifications = Notification.objects.filter(user=request.user, is_read=False)
-        
-        # 2. 읽지 않은 알림이 없으면
-        if not unread_notifications.exists():
+        # 1. 안 읽은 알림 수는 DB에서 확인 (캐시 카운터는 다른 프로세스의 변경을 놓칠 수 있으므로
+        #    읽음 처리 여부를 카운터로 결정하지 않습니다)
+        count = count_unread_in_db(request.user.id)
+
+        # 2. 읽지 않은 알림이 없으면 (어긋난 카운터만 바로잡음)
+        if count == 0:
+            reset_unread(request.user.id)
             return Response({"message": "새로운 알림이 없습니다."}, status=status.HTTP_200_OK)
 
-        # 3. 모두 읽음 처리 (update() 메서드로 한 번에 처리)
-        count = unread_notifications.update(is_read=True)
-        
-        return Response({"message": f"총 {count}개의 알림을 모두 읽음 처리했습니다."}, status=status.HTTP_200_OK)
\ No newline at end of file
+        # 3. 모두 읽음 처리 (알림 행 대신 읽음 워터마크 한 줄만 갱신)
+        mark_all_read(request.user)
+        reset_unread(request.user.id)
+
+        return Response({"message": f"총 {count}개의 알림을 모두 읽음 처리했습니다."}, status=status.HTTP_200_OK)
+
+
+
+class NotificationStreamView(View):
+    """
+    API 명세서 10.4: 실시간 알림 스트림 (GET /notifications/stream/, Server-Sent Events)
+    - ASGI 서버(daphne 등)로 실행해야 합니다. (config/asgi.py, 개발 중에는 runserver도 daphne로 동작)
+    - 인증: Authorization: Bearer <access token> 또는 ?token=<access token> (EventSource용)
+    - 재접속 시 Last-Event-ID 헤더(또는 ?last_event_id=)의 알림 이후부터 이어서 보냅니다.
+    - 이벤트: "event: notification", data는 알림 목록(10.1)의 항목과 같은 형식
+    """
+
+    async def get(self, request):
+        user = await user_from_token(raw_token_from_request(request))
+        if user is None:
+            return JsonResponse({"error": "인증 정보가 없거나 유효하지 않습니다."}, status=status.HTTP_401_UNAUTHORIZED)
+
+        last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+        try:
+            last_event_id = int(last_event_id) if last_event_id else None
+        except ValueError:
+            last_event_id = None
+
+        response = StreamingHttpResponse(notification_events(user.id, last_event_id), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no' # nginx 버퍼링 끄기
+        return response
@@ -4,7 +4,7 @@ from django.contrib import admin
 # ❗️ admin.site.register 데코레이터를 사용하거나,
 # ❗️ 필요한 모델만 import 하는 방식으로 변경합니다.
 
-from .models import Pet, MealLog, WalkLog, HealthLog, CalendarSchedule, CareLog, BcsCheckupResult
+from .models import Pet, MealLog, WalkLog, HealthLog, CalendarSchedule, CareLog, BcsCheckupResult, DailyActivityRollup, DailyNutritionRollup, PetDataVersion, AiCheckupJob
 
 admin.site.register(Pet)
 admin.site.register(MealLog)
@@ -12,4 +12,8 @@ admin.site.register(WalkLog)
 admin.site.register(HealthLog)
 admin.site.register(CalendarSchedule)
 admin.site.register(CareLog)
-admin.site.register(BcsCheckupResult)
\ No newline at end of file
+admin.site.register(BcsCheckupResult)
+admin.site.register(DailyActivityRollup)
+admin.site.register(DailyNutritionRollup)
+admin.site.register(PetDataVersion)
+admin.site.register(AiCheckupJob)
\ No newline at end of file
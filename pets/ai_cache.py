@@ -0,0 +1,150 @@
+# pets/ai_cache.py
+"""
+AI 건강 분석 결과 캐시
+
+같은 종/품종/나이대/성별/중성화 여부와 같은 증상 조합이면 Gemini에 다시 묻지 않고
+이전 분석 결과를 재사용합니다. 캐시 키는 이 입력값들만 정규화해 만든 해시입니다.
+
+- 1차(L1): 프로세스 내 cachetools.TTLCache (TTL + LRU 제거)
+- 2차(L2): Django 캐시 (settings.AI_ANALYSIS_CACHE_ALIAS, locmem/file/DB 등 교체 가능)
+"""
+import hashlib
+import json
+import threading
+from collections import Counter
+from datetime import date
+
+from cachetools import TTLCache
+from django.conf import settings
+from django.core.cache import caches
+
+CACHE_KEY_PREFIX = 'ai-analysis'
+
+# (상한 나이, 구간 이름) - 상한 미만이면 해당 구간
+AGE_BUCKETS = [(1, '0'), (3, '1-2'), (7, '3-6'), (10, '7-9')]
+
+
+def age_bucket(birth_date, today=None):
+    age = ((today or date.today()) - birth_date).days // 365
+    for upper, name in AGE_BUCKETS:
+        if age < upper:
+            return name
+    return '10+'
+
+
+def normalize_text(value):
+    return " ".join(str(value).split()).casefold()
+
+
+def analysis_cache_key(pet, symptoms):
+    """
+    프롬프트 입력값을 정규화해 SHA-256 키를 만듭니다.
+    (증상은 공백/대소문자를 정리하고 중복 제거 후 정렬하므로 순서와 무관)
+    """
+    payload = {
+        'species': normalize_text(pet.species),
+        'breed': normalize_text(pet.breed),
+        'age': age_bucket(pet.birth_date),
+        'gender': normalize_text(pet.gender),
+        'neutered': bool(pet.is_neutered),
+        'symptoms': sorted({normalize_text(s) for s in symptoms}),
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return f"{CACHE_KEY_PREFIX}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+
+def is_cacheable(pet):
+    """특이사항(자유 입력)이 있는 반려동물은 프롬프트가 개별적이므로 캐시하지 않습니다."""
+    return not (pet.special_notes or '').strip()
+
+
+class _CountingTTLCache(TTLCache):
+    """LRU/만료로 밀려난 항목 수를 세는 TTLCache"""
+
+    def __init__(self, *args, on_evict, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_evict = on_evict
+
+    def popitem(self):
+        item = super().popitem()
+        self._on_evict()
+        return item
+
+
+class AnalysisCache:
+    """TTL, LRU 제거, 적중/실패 카운터를 갖는 2단계 분석 결과 캐시"""
+
+    def __init__(self, alias, ttl, max_entries):
+        self.alias = alias
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._stats = Counter()
+        self._local = _CountingTTLCache(maxsize=max_entries, ttl=ttl, on_evict=self._count_eviction)
+
+    def _count_eviction(self):
+        self._stats['evictions'] += 1
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def get(self, key):
+        with self._lock:
+            value = self._local.get(key)
+            if value is not None:
+                self._stats['hits'] += 1
+                self._stats['local_hits'] += 1
+                return value
+
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['hits'] += 1
+            self._local[key] = value
+        return value
+
+    def set(self, key, value):
+        self.backend.set(key, value, timeout=self.ttl)
+        with self._lock:
+            self._local[key] = value
+            self._stats['stores'] += 1
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self._stats['hits'], self._stats['misses']
+            return {
+                'backend': self.alias,
+                'hits': hits,
+                'local_hits': self._stats['local_hits'],
+                'misses': misses,
+                'stores': self._stats['stores'],
+                'evictions': self._stats['evictions'],
+                'local_size': len(self._local),
+                'hit_rate': (hits / (hits + misses)) if (hits + misses) else 0,
+            }
+
+
+_analysis_cache = None
+_analysis_cache_lock = threading.Lock()
+
+
+def get_analysis_cache():
+    """settings 값으로 만든 프로세스 공용 AnalysisCache를 반환합니다."""
+    global _analysis_cache
+    with _analysis_cache_lock:
+        if _analysis_cache is None:
+            _analysis_cache = AnalysisCache(
+                alias=settings.AI_ANALYSIS_CACHE_ALIAS,
+                ttl=settings.AI_ANALYSIS_CACHE_TTL,
+                max_entries=settings.AI_ANALYSIS_CACHE_MAX_ENTRIES,
+            )
+        return _analysis_cache
+
+
+def reset_analysis_cache():
+    """(테스트/설정 변경용) 공용 캐시 인스턴스를 버립니다."""
+    global _analysis_cache
+    with _analysis_cache_lock:
+        _analysis_cache = None
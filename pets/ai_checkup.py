@@ -0,0 +1,201 @@
+# pets/ai_checkup.py
+"""
+API 명세서 7.3: AI 건강 분석 로직
+
+AiCheckupView(동기 모드)와 AI 분석 작업 워커(pets/ai_jobs.py)가 같은 로직을 쓰도록
+Gemini 호출과 주변 병원 검색을 이 모듈로 분리했습니다.
+"""
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import date
+
+from django.conf import settings
+from django.db import connections
+
+from .ai_client import ai_clients
+from .clinics import clinic_notice, search_nearby_clinics
+from .ai_cache import get_analysis_cache, analysis_cache_key, is_cacheable
+
+
+class AiCheckupError(Exception):
+    """AI 분석을 완료하지 못한 경우 (API 키 미설정, 네트워크 오류, 잘못된 응답 등)"""
+
+
+def build_prompt(pet, symptoms):
+    """반려동물 정보와 증상으로 Gemini 프롬프트를 만듭니다."""
+    pet_age = (date.today() - pet.birth_date).days // 365 # 간단한 나이 계산
+    symptoms_str = ", ".join(symptoms) # 리스트를 "구토, 설사" 같은 문자열로 변경
+
+    # AI에게 JSON 형식으로 응답하도록 강력하게 요청하는 프롬프트
+    return f"""
+            당신은 수의사 역할을 하는 반려동물 건강 AI 어시스턴트입니다.
+            아래 반려동물 정보와 주요 증상을 바탕으로, '의심 질환'과 '보호자 대처 방안'을 분석해주세요.
+
+            [반려동물 정보]
+            - 종류: {pet.species}
+            - 품종: {pet.breed}
+            - 나이: {pet_age}살
+            - 성별: {pet.gender}
+            - 중성화 여부: {'예' if pet.is_neutered else '아니오'}
+            - 특이사항: {pet.special_notes or '없음'}
+
+            [주요 증상]
+            {symptoms_str}
+
+            [요청]
+            분석한 결과를 반드시 다음의 JSON 형식으로만 응답해주세요.
+            다른 설명이나 마크다운 표기(```json) 없이 순수한 JSON 객체만 반환해야 합니다.
+            'recommendations'는 반드시 3개 이상의 항목으로 구성된 리스트(배열)여야 합니다.
+
+            {{
+              "analysis": {{
+                "issue_title": "(AI가 판단한 '의심 질환'의 요약 제목. 예: '복합적 문제' 또는 '급성 위장염 의심')",
+                "description": "(프론트엔드 디자인의 '의심 질환' 박스에 들어갈 상세 설명. 예: '선택하신 '구토', '설사' 증상은...')"
+              }},
+              "recommendations": [
+                "(프론트엔드 디자인의 '권장 대처 방안' 리스트의 첫 번째 항목. 예: '유산균을 급여하고 식단을 점검해주세요.')",
+                "(두 번째 항목. 예: '신선한 물을 마실 수 있도록 수분 섭취를...')"
+              ]
+            }}
+            """
+
+
+def fallback_analysis(symptoms):
+    """AI 할당량 초과 등으로 분석할 수 없을 때 반환하는 기본 안내"""
+    symptoms_str = ", ".join(symptoms)
+    return {
+        "analysis": {
+            "issue_title": f"{symptoms_str} 관련 주의 사항",
+            "description": f"선택하신 증상({symptoms_str})은 반려동물에게 불편함을 줄 수 있습니다. 증상이 지속되거나 악화될 경우 즉시 수의사와 상담하시기 바랍니다."
+        },
+        "recommendations": [
+            "증상이 24시간 이상 지속되면 동물병원 방문을 권장합니다.",
+            "충분한 수분 섭취를 유지하고, 편안한 환경을 제공해주세요.",
+            "급격한 식단 변화는 피하고, 평소 식사량을 유지해주세요."
+        ]
+    }
+
+
+def analyze_symptoms(pet, symptoms):
+    """
+    Gemini로 증상을 분석해 analysis_result(dict)를 반환합니다.
+    같은 입력의 분석 결과가 캐시에 있으면 Gemini를 호출하지 않습니다.
+    할당량 초과(429) 시에는 fallback_analysis()를 반환하고(캐시하지 않음),
+    그 밖의 오류는 AiCheckupError로 알립니다.
+    """
+    cache = get_analysis_cache() if is_cacheable(pet) else None
+    cache_key = analysis_cache_key(pet, symptoms) if cache else None
+    if cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    try:
+        # 1. AI 모델 준비 (API 키 설정과 모델 객체는 프로세스 안에서 재사용)
+        model = ai_clients.get_model()
+
+        # 2. 프롬프트 준비
+        prompt = build_prompt(pet, symptoms)
+
+        # 3. AI 모델 호출 (429 에러 처리)
+        try:
+            ai_response = model.generate_content(prompt, request_options={'timeout': settings.AI_ANALYSIS_TIMEOUT})
+        except Exception as api_error:
+            error_message = str(api_error).lower()
+            if "429" in error_message or "quota" in error_message or "resource" in error_message:
+                # 할당량 초과 시 샘플 데이터 반환
+                return fallback_analysis(symptoms)
+            raise
+
+        # 4. AI 응답 "청소" 후 JSON 파싱
+        ai_text_cleaned = ai_response.text.strip().strip("```json").strip("```").strip()
+        try:
+            analysis_result = json.loads(ai_text_cleaned)
+        except json.JSONDecodeError:
+            raise ValueError(f"AI가 JSON 형식이 아닌 응답을 반환했습니다: {ai_response.text}")
+
+        if cache:
+            cache.set(cache_key, analysis_result)
+        return analysis_result
+
+    except Exception as e:
+        # API 키가 잘못되었거나, 네트워크 오류, 모델 호출 한도 초과 등
+        raise AiCheckupError(str(e)) from e
+
+
+def find_clinics(location):
+    """요청의 location({'lat': .., 'lng': ..})으로 주변 동물병원 목록을 반환합니다."""
+    # 1. location이 제대로 왔는지 확인
+    if not location or 'lat' not in location or 'lng' not in location:
+        return [clinic_notice("위치 정보 없음", "사용자 위치 정보(lat, lng)가 전송되지 않았습니다.")]
+
+    try:
+        # 2. 위도(lat), 경도(lng) 값을 float(숫자)으로 변환
+        lat = float(location['lat'])
+        lng = float(location['lng'])
+    except (ValueError, TypeError):
+        # lat, lng가 숫자가 아닐 경우
+        return [clinic_notice("위치 정보 오류", "위치 정보(lat, lng) 형식이 잘못되었습니다.")]
+
+    return search_nearby_clinics(lat, lng)
+
+
+# Gemini 분석과 Kakao 병원 검색을 동시에 실행하기 위한 공용 스레드 풀
+_executor = ThreadPoolExecutor(max_workers=settings.AI_CHECKUP_MAX_WORKERS, thread_name_prefix='ai-checkup')
+
+
+def _in_worker_thread(func, *args):
+    """스레드 풀에서 실행할 때, 스레드가 연 DB 연결(DB 캐시 등)을 정리합니다."""
+    try:
+        return func(*args)
+    finally:
+        connections.close_all()
+
+
+def _wait(future, deadline):
+    """deadline(time.monotonic 기준)까지 결과를 기다립니다. 시간 초과 시 TimeoutError."""
+    return future.result(timeout=max(0, deadline - time.monotonic()))
+
+
+def run_checkup(pet, symptoms, location):
+    """
+    AI 분석 결과와 주변 병원 목록을 조합해 API 7.3 응답 본문을 만듭니다.
+
+    두 외부 호출은 서로 독립적이므로 동시에 실행하고, 각각의 제한 시간
+    (AI_ANALYSIS_TIMEOUT, CLINIC_SEARCH_TIMEOUT)이 지나면 그 부분만 기본값으로 채워
+    나머지 결과와 함께 반환합니다. 이때 응답의 'timed_out'에 시간 초과된 항목이 담깁니다.
+    (AI 분석 자체가 실패하면 AiCheckupError 발생)
+
+    공용 스레드 풀이 붐벼 아직 시작하지 못한 작업은 결과를 더 기다리지 않을 때 취소해,
+    시간이 지난 뒤에 뒤늦게 실행되며 작업자 스레드를 차지하지 않게 합니다.
+    """
+    started = time.monotonic()
+    analysis_future = _executor.submit(_in_worker_thread, analyze_symptoms, pet, symptoms)
+    clinics_future = _executor.submit(_in_worker_thread, find_clinics, location)
+
+    timed_out = []
+    try:
+        try:
+            analysis_result = _wait(analysis_future, started + settings.AI_ANALYSIS_TIMEOUT)
+        except FutureTimeoutError:
+            analysis_result = fallback_analysis(symptoms)
+            timed_out.append('analysis_result')
+
+        try:
+            clinics_list = _wait(clinics_future, started + settings.CLINIC_SEARCH_TIMEOUT)
+        except FutureTimeoutError:
+            clinics_list = [clinic_notice("병원 검색 지연", "주변 병원 검색이 지연되고 있습니다. 잠시 후 다시 시도해주세요.")]
+            timed_out.append('nearby_clinics')
+    finally:
+        # 대기열에 남은 작업만 취소됩니다. (이미 끝났거나 실행 중인 작업은 그대로)
+        analysis_future.cancel()
+        clinics_future.cancel()
+
+    response_data = {
+        "analysis_result": analysis_result,
+        "nearby_clinics": clinics_list
+    }
+    if timed_out:
+        response_data["timed_out"] = timed_out
+    return response_data
@@ -0,0 +1,74 @@
+# pets/ai_client.py
+"""
+Google Gemini 클라이언트 레지스트리
+
+genai.configure()는 API 키가 바뀔 때만 한 번 호출하고, GenerativeModel 객체와
+list_models() 결과(TTL)를 프로세스 안에서 재사용합니다. 여러 스레드에서 동시에 써도 안전합니다.
+모델 목록 새로고침(네트워크 호출)은 별도 잠금으로 한 번에 하나만 하고, 그동안 get_model()은 기다리지 않습니다.
+"""
+import threading
+import time
+
+from django.conf import settings
+import google.generativeai as genai
+
+
+class AiClientRegistry:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._list_lock = threading.Lock() # 모델 목록 새로고침 전용 (네트워크 호출 중 _lock을 잡지 않음)
+        self._configured_key = None
+        self._models = {}
+        self._model_names = None
+        self._model_names_expires_at = 0
+
+    def _configure(self):
+        """settings의 API 키로 genai를 설정합니다. (키가 바뀐 경우에만 다시 설정)"""
+        api_key = settings.GOOGLE_GEMINI_API_KEY
+        if not api_key:
+            # settings.py에 키가 없거나 환경 변수가 로드되지 않은 경우
+            raise ValueError("GOOGLE_GEMINI_API_KEY가 설정되지 않았습니다.")
+        if api_key != self._configured_key:
+            genai.configure(api_key=api_key)
+            self._configured_key = api_key
+            self._models.clear()
+            self._model_names = None
+
+    def get_model(self, name=None):
+        """모델 이름별로 GenerativeModel 객체를 하나만 만들어 재사용합니다."""
+        name = name or settings.AI_MODEL_NAME
+        with self._lock:
+            self._configure()
+            if name not in self._models:
+                self._models[name] = genai.GenerativeModel(name)
+            return self._models[name]
+
+    def list_generation_models(self):
+        """'generateContent'를 지원하는 모델 이름 목록 (AI_MODEL_LIST_TTL초 동안 캐시)"""
+        with self._list_lock:
+            with self._lock:
+                self._configure()
+                configured_key = self._configured_key
+                if self._model_names is not None and time.monotonic() < self._model_names_expires_at:
+                    return list(self._model_names)
+
+            model_names = [
+                m.name for m in genai.list_models()
+                if 'generateContent' in m.supported_generation_methods
+            ]
+            with self._lock:
+                # 가져오는 동안 키가 바뀌었거나 reset() 되었으면 저장하지 않음
+                if self._configured_key == configured_key:
+                    self._model_names = model_names
+                    self._model_names_expires_at = time.monotonic() + settings.AI_MODEL_LIST_TTL
+            return list(model_names)
+
+    def reset(self):
+        """(테스트/키 교체용) 설정과 캐시를 모두 비웁니다."""
+        with self._lock:
+            self._configured_key = None
+            self._models.clear()
+            self._model_names = None
+
+
+ai_clients = AiClientRegistry()
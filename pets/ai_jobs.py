@@ -0,0 +1,98 @@
+# pets/ai_jobs.py
+"""
+AI 건강 분석(API 7.3) 비동기 작업 큐
+
+별도의 메시지 브로커 없이 AiCheckupJob 테이블을 큐로 사용합니다.
+- 웹 요청: enqueue_checkup()으로 작업을 등록하고 바로 202를 반환
+- 워커: `python manage.py run_ai_checkup_worker`가 claim_next_job()으로 작업을 하나씩 가져와 처리
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AiCheckupJob
+from .ai_checkup import run_checkup, AiCheckupError
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_checkup(pet, symptoms, location):
+    """AI 분석 작업을 대기열에 등록합니다."""
+    return AiCheckupJob.objects.create(pet=pet, symptoms=symptoms, location=location)
+
+
+def claim_next_job():
+    """
+    가장 오래 기다린 'pending' 작업 하나를 'running'으로 바꾸며 가져옵니다.
+    조건부 UPDATE(status='pending'일 때만)로 선점하므로, 워커를 여러 개 띄워도
+    같은 작업을 두 번 처리하지 않습니다.
+    시도 횟수(attempts)도 같은 UPDATE에서 올리므로, 처리 중 워커가 죽어도 횟수가 남습니다.
+    """
+    candidates = AiCheckupJob.objects.filter(status='pending').order_by('created_at').values_list('id', flat=True)[:5]
+    for job_id in candidates:
+        claimed = AiCheckupJob.objects.filter(id=job_id, status='pending').update(
+            status='running', started_at=timezone.now(), attempts=F('attempts') + 1
+        )
+        if claimed:
+            return AiCheckupJob.objects.select_related('pet').get(id=job_id)
+    return None
+
+
+def requeue_stale_jobs():
+    """
+    워커가 처리 도중 종료되어 'running'에 멈춘 작업을 다시 대기열에 넣습니다.
+    (최대 시도 횟수를 넘긴 작업은 실패 처리)
+    """
+    deadline = timezone.now() - timedelta(seconds=settings.AI_CHECKUP_JOB_STALE_SECONDS)
+    stale = AiCheckupJob.objects.filter(status='running', started_at__lt=deadline)
+    stale.filter(attempts__gte=settings.AI_CHECKUP_JOB_MAX_ATTEMPTS).update(
+        status='failed', error="분석 시간이 초과되었습니다.", finished_at=timezone.now()
+    )
+    return stale.update(status='pending', started_at=None)
+
+
+def process_job(job):
+    """claim_next_job()으로 가져온 작업 하나를 실행하고 결과(또는 오류)를 저장합니다."""
+    try:
+        job.result = run_checkup(job.pet, job.symptoms, job.location)
+        job.status = 'done'
+        job.error = ''
+    except AiCheckupError as e:
+        job.status = 'failed'
+        job.error = f"AI 분석 중 오류 발생: {e}"
+    except Exception as e:
+        logger.exception("AI 분석 작업 #%s 처리 중 예외 발생", job.id)
+        if job.attempts < settings.AI_CHECKUP_JOB_MAX_ATTEMPTS:
+            # 일시적인 오류일 수 있으므로 다시 대기열로
+            job.status = 'pending'
+            job.started_at = None
+            job.save(update_fields=['status', 'started_at'])
+            return job
+        job.status = 'failed'
+        job.error = f"AI 분석 중 오류 발생: {e}"
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'result', 'error', 'finished_at'])
+    return job
+
+
+def run_worker(poll_interval=1.0, once=False):
+    """
+    대기열이 빌 때까지 작업을 처리하고, 비면 poll_interval초 쉬었다가 다시 확인합니다.
+    once=True이면 대기열을 한 번 비운 뒤 종료합니다. (처리한 작업 수 반환)
+    """
+    processed = 0
+    while True:
+        requeue_stale_jobs()
+        job = claim_next_job()
+        while job is not None:
+            process_job(job)
+            processed += 1
+            job = claim_next_job()
+        if once:
+            return processed
+        time.sleep(poll_interval)
@@ -4,3 +4,5 @@ from django.apps import AppConfig
 class PetsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'pets'
+    def ready(self):
+        import pets.signals
@@ -0,0 +1,163 @@
+# pets/bulk.py
+"""
+기록(Log) 일괄 저장
+
+모바일 앱이 오프라인 중 쌓아 둔 기록을 한 번에 보낼 때 사용합니다.
+- 기존 Serializer를 many=True로 사용해 항목별로 검증합니다.
+- 하나라도 잘못되면 아무것도 저장하지 않고, 잘못된 항목의 index와 오류를 돌려줍니다.
+- 모델별로 bulk_create 한 번, 하나의 트랜잭션으로 저장합니다.
+  (bulk_create는 시그널을 실행하지 않으므로, 시그널이 하던 후처리는 after_create에서 직접 합니다)
+- MySQL에서는 bulk_create가 id를 채우지 않으므로, 같은 트랜잭션에서 방금 넣은 행을 다시 읽어
+  응답의 items[].id를 채웁니다. (fill_ids)
+"""
+from collections import defaultdict, deque
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import CareLog, HealthLog, MealLog, WalkLog
+from .rollups import apply_meal_logs, apply_walk_logs
+from .serializers import CareLogSerializer, HealthLogSerializer, MealLogSerializer, WalkLogSerializer
+from .versioning import bump_pet_version
+
+
+class BulkLogError(Exception):
+    """
+    일괄 저장 요청이 잘못된 경우
+    message: 요청 전체에 대한 오류, errors: [{"index": 0, "errors": {...}}, ...] 항목별 오류
+    """
+
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        self.message = message
+        self.errors = errors or []
+
+
+class BulkLogWriter:
+    """반려동물 한 마리의 기록을 일괄 검증/저장합니다. (모델별 하위 클래스)"""
+    model = None
+    serializer_class = None
+
+    def __init__(self, pet):
+        self.pet = pet
+
+    def extra_fields(self):
+        """Serializer가 받지 않고 서버에서 채우는 필드"""
+        return {'pet': self.pet}
+
+    def check_items(self, validated_items):
+        """검증을 통과한 항목들 사이의 추가 검사. 항목별 오류 목록을 반환합니다."""
+        return []
+
+    def after_create(self, objects):
+        pass
+
+    def last_id(self):
+        """저장 전 마지막 id. bulk_create가 id를 돌려주는 DB(PostgreSQL/SQLite)에서는 필요 없으므로 None"""
+        if connection.features.can_return_rows_from_bulk_insert:
+            return None
+        return self.model.objects.aggregate(last_id=Max('pk'))['last_id'] or 0
+
+    def fill_ids(self, objects, last_id):
+        """
+        bulk_create가 id를 채우지 않은 경우(MySQL), last_id 이후에 생긴 이 반려동물의 행을 다시 읽어
+        값이 같은 행의 id를 id 순서대로 짝지어 채웁니다.
+        MySQL 기본 격리 수준(REPEATABLE READ)에서는 last_id를 읽은 시점의 스냅샷을 쓰므로,
+        그 사이 다른 요청이 커밋한 행은 보이지 않습니다.
+        """
+        if last_id is None:
+            return
+        fields = [field.attname for field in self.model._meta.concrete_fields if not field.primary_key]
+        ids = defaultdict(deque)
+        rows = self.model.objects.filter(pet=self.pet, pk__gt=last_id).order_by('pk').values_list('pk', *fields)
+        for pk, *values in rows:
+            ids[tuple(values)].append(pk)
+        for obj in objects:
+            matched = ids.get(tuple(getattr(obj, name) for name in fields))
+            if matched:
+                obj.pk = matched.popleft()
+
+    def validate(self, items):
+        if not isinstance(items, list) or not items:
+            raise BulkLogError("기록 목록(items)이 비어 있거나 배열이 아닙니다.")
+        if len(items) > settings.PET_LOG_BULK_MAX_ITEMS:
+            raise BulkLogError(f"한 번에 최대 {settings.PET_LOG_BULK_MAX_ITEMS}개까지 저장할 수 있습니다.")
+
+        serializer = self.serializer_class(data=items, many=True)
+        if not serializer.is_valid():
+            errors = [
+                {"index": index, "errors": item_errors}
+                for index, item_errors in enumerate(serializer.errors) if item_errors
+            ]
+            raise BulkLogError("잘못된 기록이 있어 저장하지 않았습니다.", errors)
+
+        errors = self.check_items(serializer.validated_data)
+        if errors:
+            raise BulkLogError("잘못된 기록이 있어 저장하지 않았습니다.", errors)
+        return serializer.validated_data
+
+    def save(self, items):
+        """items를 검증 후 모두 저장하고, 저장된 객체 목록을 반환합니다. (실패 시 BulkLogError)"""
+        validated_items = self.validate(items)
+        extra = self.extra_fields()
+        objects = [self.model(**attrs, **extra) for attrs in validated_items]
+        try:
+            with transaction.atomic():
+                last_id = self.last_id()
+                objects = self.model.objects.bulk_create(objects)
+                self.fill_ids(objects, last_id)
+                self.after_create(objects)
+                bump_pet_version(self.pet.id) # 데이터 버전(ETag) 갱신도 시그널 대신 직접
+        except IntegrityError:
+            # check_items 확인 뒤 다른 요청이 같은 기록을 먼저 저장한 경우 (유니크 제약)
+            raise BulkLogError("이미 저장된 기록과 겹치는 항목이 있어 저장하지 않았습니다. 목록을 새로고침한 뒤 다시 시도해 주세요.")
+        return objects
+
+
+class WalkLogBulkWriter(BulkLogWriter):
+    model = WalkLog
+    serializer_class = WalkLogSerializer
+
+    def after_create(self, objects):
+        # 일일 활동 집계(DailyActivityRollup) 반영 (signals.py의 post_save 대신)
+        apply_walk_logs(objects)
+
+
+class MealLogBulkWriter(BulkLogWriter):
+    model = MealLog
+    serializer_class = MealLogSerializer
+
+    def after_create(self, objects):
+        # 일일 식사 집계(DailyNutritionRollup) 반영
+        apply_meal_logs(objects)
+
+
+class HealthLogBulkWriter(BulkLogWriter):
+    model = HealthLog
+    serializer_class = HealthLogSerializer
+
+
+class CareLogBulkWriter(BulkLogWriter):
+    """케어리스트 항목은 단건 생성(API 4.2)과 같이 오늘 날짜로 저장합니다."""
+    model = CareLog
+    serializer_class = CareLogSerializer
+
+    def extra_fields(self):
+        return {'pet': self.pet, 'log_date': timezone.now().date()}
+
+    def check_items(self, validated_items):
+        # (pet, log_date, content) 유니크 제약: 요청 안의 중복과 이미 있는 항목을 미리 알려줍니다.
+        log_date = self.extra_fields()['log_date']
+        contents = [attrs['content'] for attrs in validated_items]
+        existing = set(
+            CareLog.objects.filter(pet=self.pet, log_date=log_date, content__in=contents)
+            .values_list('content', flat=True)
+        )
+        errors, seen = [], set()
+        for index, content in enumerate(contents):
+            if content in existing or content in seen:
+                errors.append({"index": index, "errors": {"content": ["오늘 케어리스트에 이미 있는 항목입니다."]}})
+            seen.add(content)
+        return errors
@@ -0,0 +1,96 @@
+# pets/calendar.py
+"""
+API 명세서 6.1 (월별 일정) / 6.4 (월 그리드 요약) 조회 모듈
+
+일정 조회는 schedule_date__year / __month 대신 [그 달 1일, 다음 달 1일) 범위로 거릅니다.
+YEAR()/MONTH() 함수로 감싼 조건은 MySQL에서 (pet, schedule_date) 인덱스를 쓰지 못하지만,
+범위 조건은 schedule_pet_date_idx 인덱스 범위 스캔으로 처리됩니다.
+"""
+from datetime import date
+
+from django.conf import settings
+from django.db.models import Count
+
+
+class CalendarParamError(ValueError):
+    """year/month/months 쿼리 파라미터 오류 (메시지를 그대로 400 응답에 사용)"""
+
+
+def add_months(year, month, count):
+    """(year, month)에서 count 개월 뒤의 (year, month)"""
+    index = year * 12 + (month - 1) + count
+    return index // 12, index % 12 + 1
+
+
+def month_range(year, month, months=1):
+    """year년 month월부터 months개월을 덮는 [first_day, end_day) 날짜 범위"""
+    end_year, end_month = add_months(year, month, months)
+    return date(year, month, 1), date(end_year, end_month, 1)
+
+
+def parse_year_month(params):
+    """쿼리 파라미터에서 (year, month)를 꺼냅니다. 잘못된 값이면 CalendarParamError"""
+    year = params.get('year')
+    month = params.get('month')
+    if not year or not month:
+        raise CalendarParamError("year와 month 쿼리 파라미터가 필요합니다.")
+    try:
+        year = int(year)
+        month = int(month)
+    except ValueError:
+        raise CalendarParamError("year와 month는 숫자여야 합니다.")
+    if not (1 <= month <= 12 and date.min.year <= year < date.max.year):
+        raise CalendarParamError("year 또는 month 값이 올바르지 않습니다.")
+    return year, month
+
+
+def parse_month_count(params):
+    """months 쿼리 파라미터 (기본 CALENDAR_GRID_DEFAULT_MONTHS, 최대 CALENDAR_GRID_MAX_MONTHS)"""
+    months = params.get('months', settings.CALENDAR_GRID_DEFAULT_MONTHS)
+    try:
+        months = int(months)
+    except (TypeError, ValueError):
+        raise CalendarParamError("months는 숫자여야 합니다.")
+    if not 1 <= months <= settings.CALENDAR_GRID_MAX_MONTHS:
+        raise CalendarParamError(f"months는 1~{settings.CALENDAR_GRID_MAX_MONTHS} 사이여야 합니다.")
+    return months
+
+
+def month_schedules(pet, year, month):
+    """year년 month월의 일정 (날짜순)"""
+    first_day, next_month = month_range(year, month)
+    return pet.schedules.filter(
+        schedule_date__gte=first_day,
+        schedule_date__lt=next_month,
+    ).order_by('schedule_date', 'id')
+
+
+def build_month_grid(pet, year, month, months):
+    """
+    year년 month월부터 months개월의 날짜별 일정 수와 카테고리를 GROUP BY 쿼리 한 번으로 집계합니다.
+    일정이 없는 날은 포함하지 않습니다.
+    """
+    first_day, end_day = month_range(year, month, months)
+    rows = (
+        pet.schedules.filter(schedule_date__gte=first_day, schedule_date__lt=end_day)
+        .order_by('schedule_date', 'category')
+        .values_list('schedule_date', 'category')
+        .annotate(count=Count('id'))
+    )
+
+    grid = []
+    month_days = {}
+    for offset in range(months):
+        grid_year, grid_month = add_months(year, month, offset)
+        days = []
+        month_days[(grid_year, grid_month)] = days
+        grid.append({'year': grid_year, 'month': grid_month, 'days': days})
+
+    for schedule_date, category, count in rows:
+        days = month_days[(schedule_date.year, schedule_date.month)]
+        if not days or days[-1]['date'] != schedule_date:
+            days.append({'date': schedule_date, 'count': 0, 'categories': []})
+        days[-1]['count'] += count
+        days[-1]['categories'].append(category)
+
+    return grid
@@ -0,0 +1,295 @@
+# pets/clinics.py
+"""
+주변 동물병원 검색 (Kakao 로컬 API)
+
+가까이 있는 사용자들이 매번 Kakao API를 호출하지 않도록, 위치를 격자(tile)로 나누어
+타일별 병원 목록을 캐시합니다. 거리는 캐시된 병원 좌표와 사용자의 정확한 위치로
+서버에서 다시 계산하고 정렬합니다.
+
+- Kakao 검색은 중심에서 가까운 순으로 최대 45곳까지만 주므로, 타일 목록이 잘렸다면 캐시에
+  실제로 덮은 반경(covered_radius)을 함께 저장합니다. 사용자에게 보여줄 가까운 RESULT_LIMIT곳을
+  타일 목록만으로 확정할 수 없으면(병원이 밀집한 지역) 타일을 CLINIC_DENSE_TILE_SPLIT로 나눈
+  작은 타일의 캐시를 쓰고, 그래도 부족할 때만 사용자 위치로 한 페이지(15곳)를 다시 검색합니다.
+- 한 번의 검색(타일 조회 + 필요 시 사용자 기준 재검색)은 CLINIC_FETCH_DEADLINE(초) 안에 끝냅니다.
+- 응답 항목은 결과/오류/결과 없음 모두 같은 키 {"id", "name", "subtitle", "address", "phone", "distance"}
+- 검색 백엔드: settings.CLINIC_SEARCH_BACKEND (기본 KakaoClinicBackend, 테스트용 FakeClinicBackend)
+- 타일 캐시: settings.CLINIC_TILE_CACHE_ALIAS / CLINIC_TILE_CACHE_TTL
+"""
+import math
+import threading
+import time
+
+import requests
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+from .http_client import get_http_client
+
+SEARCH_RADIUS_M = 2000 # 사용자 기준 검색 반경 (2km)
+RESULT_LIMIT = 15 # 응답에 담는 최대 병원 수
+EARTH_RADIUS_M = 6371000
+
+
+class ClinicSearchError(Exception):
+    """병원 검색 백엔드 호출 실패 (name: 화면에 표시할 오류 제목)"""
+
+    def __init__(self, name, detail):
+        super().__init__(detail)
+        self.name = name
+
+
+# --- 검색 백엔드 ---
+
+class KakaoClinicBackend:
+    """Kakao 키워드 검색 API로 특정 지점 주변 '동물병원'을 찾습니다."""
+    url = "https://dapi.kakao.com/v2/local/search/keyword.json"
+    page_size = 15 # Kakao API 최대값
+    max_pages = 3
+
+    def search(self, lat, lng, radius, deadline=None, max_pages=None):
+        """
+        (lat, lng) 반경 radius(m) 이내의 병원 목록을 가까운 순으로 반환합니다.
+        max_pages를 주면 그 페이지 수까지만 요청합니다. (기본 self.max_pages)
+        반환값: (places, complete)
+        - places 각 항목: {"id", "name", "address", "phone", "lat", "lng"}
+        - complete: 반경 안의 병원을 모두 받았는지 (페이지 제한이나 deadline으로 멈추면 False)
+        deadline(time.monotonic 기준)이 지나면 더 이상 다음 페이지를 요청하지 않습니다.
+        """
+        api_key = settings.KAKAO_API_KEY
+        if not api_key:
+            raise ClinicSearchError("API 키 미설정", "Kakao API 키가 서버에 설정되지 않았습니다.")
+
+        headers = {"Authorization": f"KakaoAK {api_key}"}
+        places = []
+        complete = False
+        try:
+            for page in range(1, (max_pages or self.max_pages) + 1):
+                if places and deadline is not None and time.monotonic() >= deadline:
+                    break
+                params = {
+                    "query": "동물병원",
+                    "y": str(lat),
+                    "x": str(lng),
+                    "radius": min(int(radius), 20000), # Kakao API 최대 반경 20km
+                    "sort": "distance",
+                    "size": self.page_size,
+                    "page": page,
+                }
+                response = get_http_client().get(
+                    self.url, headers=headers, params=params, timeout=3, deadline=deadline,
+                )
+                response.raise_for_status()
+                data = response.json()
+
+                for doc in data.get("documents", []):
+                    places.append({
+                        "id": doc.get("id"),
+                        "name": doc.get("place_name"),
+                        "address": doc.get("road_address_name") or doc.get("address_name") or "주소 정보 없음",
+                        "phone": doc.get("phone") or "전화번호 정보 없음",
+                        "lat": float(doc.get("y")),
+                        "lng": float(doc.get("x")),
+                    })
+                if data.get("meta", {}).get("is_end", True):
+                    complete = True
+                    break
+        except requests.exceptions.RequestException as e:
+            if places:
+                # 앞 페이지는 받았으므로 그만큼만 사용합니다. (complete=False)
+                return places, False
+            raise ClinicSearchError("API 호출 오류", f"Kakao API 호출 중 오류 발생: {e}")
+        except (TypeError, ValueError) as e:
+            raise ClinicSearchError("오류", f"처리 중 알 수 없는 오류 발생: {e}")
+        return places, complete
+
+
+class FakeClinicBackend:
+    """
+    테스트용 검색 백엔드. 외부 API 대신 self.places에서 반경 안의 병원을 가까운 순으로 돌려주고,
+    호출 기록을 self.calls에 (lat, lng, radius, max_pages)로 남깁니다.
+    max_results를 주면 Kakao처럼 그 개수에서 잘라내고, max_pages는 page_size 단위로 자릅니다.
+    """
+    page_size = KakaoClinicBackend.page_size
+
+    def __init__(self, places=None, max_results=None):
+        self.places = list(places or [])
+        self.max_results = max_results
+        self.calls = []
+
+    def search(self, lat, lng, radius, deadline=None, max_pages=None):
+        self.calls.append((lat, lng, radius, max_pages))
+        found = sorted(
+            (p for p in self.places if haversine_m(lat, lng, p["lat"], p["lng"]) <= radius),
+            key=lambda p: haversine_m(lat, lng, p["lat"], p["lng"]),
+        )
+        limits = [n for n in (self.max_results, max_pages and max_pages * self.page_size) if n]
+        if limits and len(found) > min(limits):
+            return found[:min(limits)], False
+        return found, True
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_clinic_backend():
+    """settings.CLINIC_SEARCH_BACKEND에 지정된 백엔드 인스턴스를 (경로별로 하나만) 반환합니다."""
+    path = settings.CLINIC_SEARCH_BACKEND
+    with _backends_lock:
+        if path not in _backends:
+            _backends[path] = import_string(path)()
+        return _backends[path]
+
+
+# --- 좌표/타일 계산 ---
+
+def haversine_m(lat1, lng1, lat2, lng2):
+    """두 좌표 사이의 거리(m)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = math.radians(lat2 - lat1)
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def tile_for(lat, lng, size=None):
+    """(lat, lng)가 속한 격자 타일 번호 (위도/경도를 size도 단위로 내림)"""
+    size = size or settings.CLINIC_TILE_SIZE_DEG
+    return (math.floor(lat / size), math.floor(lng / size))
+
+
+def tile_center(tile, size=None):
+    size = size or settings.CLINIC_TILE_SIZE_DEG
+    return ((tile[0] + 0.5) * size, (tile[1] + 0.5) * size)
+
+
+def tile_search_radius(tile, size=None):
+    """
+    타일 안의 어느 지점에서든 SEARCH_RADIUS_M 이내의 병원이 모두 포함되도록,
+    타일 중심 기준 검색 반경 = 검색 반경 + 타일 반대각선 길이
+    """
+    size = size or settings.CLINIC_TILE_SIZE_DEG
+    center_lat, center_lng = tile_center(tile, size)
+    corner_lat, corner_lng = tile[0] * size, tile[1] * size
+    return SEARCH_RADIUS_M + math.ceil(haversine_m(center_lat, center_lng, corner_lat, corner_lng))
+
+
+def tile_cache_key(tile, size=None):
+    size = size or settings.CLINIC_TILE_SIZE_DEG
+    return f"clinic-tile:v2:{size}:{tile[0]}:{tile[1]}"
+
+
+def covered_radius(center_lat, center_lng, places, radius, complete):
+    """
+    검색 결과가 빠짐없이 덮는 중심 기준 반경(m).
+    잘린 결과(가까운 순)는 마지막 병원까지의 거리까지만 믿을 수 있습니다.
+    """
+    if complete:
+        return radius
+    if not places:
+        return 0
+    return max(haversine_m(center_lat, center_lng, p["lat"], p["lng"]) for p in places)
+
+
+def get_tile_places(lat, lng, deadline=None, size=None):
+    """
+    (lat, lng)가 속한 타일(한 변 size도, 기본 CLINIC_TILE_SIZE_DEG)의 병원 목록을 캐시에서,
+    없으면 백엔드에서 가져옵니다.
+    반환값: {"center": (lat, lng), "places": [...], "covered_radius": m, "complete": bool}
+    deadline에 걸려 도중에 멈춘 결과는 다음 요청이 다시 받도록 캐시하지 않습니다.
+    """
+    size = size or settings.CLINIC_TILE_SIZE_DEG
+    tile = tile_for(lat, lng, size)
+    cache = caches[settings.CLINIC_TILE_CACHE_ALIAS]
+    key = tile_cache_key(tile, size)
+
+    entry = cache.get(key)
+    if entry is None:
+        center_lat, center_lng = tile_center(tile, size)
+        radius = tile_search_radius(tile, size)
+        backend = get_clinic_backend()
+        places, complete = backend.search(center_lat, center_lng, radius, deadline=deadline)
+        entry = {
+            "center": (center_lat, center_lng),
+            "places": places,
+            "covered_radius": covered_radius(center_lat, center_lng, places, radius, complete),
+            "complete": complete,
+        }
+        timed_out = deadline is not None and time.monotonic() >= deadline
+        if complete or not timed_out:
+            cache.set(key, entry, timeout=settings.CLINIC_TILE_CACHE_TTL)
+    return entry
+
+
+def tile_covers_user(lat, lng, entry):
+    """
+    타일 목록만으로 사용자의 가까운 RESULT_LIMIT곳(반경 2km 이내)을 빠짐없이 정할 수 있는지.
+    사용자에서 k번째(k=RESULT_LIMIT) 가까운 캐시 병원까지의 거리를 d라 하면, 사용자 기준 d 이내의
+    병원은 모두 타일 중심 기준 dist(사용자, 중심) + d 이내에 있으므로, 그 값이 covered_radius
+    이하이면 캐시에 빠진 더 가까운 병원이 없습니다. (k곳이 안 되면 d = 2km)
+    """
+    center_lat, center_lng = entry["center"]
+    distances = sorted(
+        d for d in (haversine_m(lat, lng, p["lat"], p["lng"]) for p in entry["places"])
+        if d <= SEARCH_RADIUS_M
+    )
+    needed = distances[RESULT_LIMIT - 1] if len(distances) >= RESULT_LIMIT else SEARCH_RADIUS_M
+    return haversine_m(lat, lng, center_lat, center_lng) + needed <= entry["covered_radius"]
+
+
+def clinic_notice(name, detail):
+    """결과 대신 보여줄 안내 항목 (오류/결과 없음). 병원 항목과 같은 키를 씁니다."""
+    return {"id": 0, "name": name, "subtitle": detail, "address": detail, "phone": "", "distance": 0}
+
+
+def search_nearby_clinics(lat, lng):
+    """
+    사용자 위치(lat, lng) 반경 2km 이내 동물병원을 가까운 순으로 반환합니다.
+    (프론트엔드 디자인에 맞게 'subtitle' 필드 포함)
+    """
+    deadline = time.monotonic() + settings.CLINIC_FETCH_DEADLINE
+    try:
+        entry = get_tile_places(lat, lng, deadline=deadline)
+        # 밀집 지역이라 타일 목록이 잘렸으면, 더 작은 타일의 목록을 씁니다.
+        if not entry["complete"] and not tile_covers_user(lat, lng, entry) and time.monotonic() < deadline:
+            size = settings.CLINIC_TILE_SIZE_DEG / settings.CLINIC_DENSE_TILE_SPLIT
+            try:
+                entry = get_tile_places(lat, lng, deadline=deadline, size=size)
+            except ClinicSearchError:
+                pass
+        places = entry["places"]
+        # 그래도 가까운 병원이 빠졌을 수 있으면, 사용자 위치로 한 페이지만 다시 검색
+        # (가까운 순 한 페이지 = RESULT_LIMIT곳이면 응답에 충분합니다.)
+        if not tile_covers_user(lat, lng, entry) and time.monotonic() < deadline:
+            try:
+                places, _ = get_clinic_backend().search(
+                    lat, lng, SEARCH_RADIUS_M, deadline=deadline,
+                    max_pages=math.ceil(RESULT_LIMIT / KakaoClinicBackend.page_size),
+                )
+            except ClinicSearchError:
+                if not places:
+                    raise
+    except ClinicSearchError as e:
+        return [clinic_notice(e.name, str(e))]
+
+    clinics = []
+    for place in places:
+        distance = haversine_m(lat, lng, place["lat"], place["lng"])
+        if distance > SEARCH_RADIUS_M:
+            continue
+        clinics.append({
+            "id": place["id"],
+            "name": place["name"],
+            # 디자인이 요구하는 "부제목" 문자열 (예: "제주시 연동 123-45 | 064-123-4567")
+            "subtitle": f"{place['address']} | {place['phone']}",
+            "address": place["address"],
+            "phone": place["phone"], # "전화" 버튼 클릭 시 사용할 원본 전화번호
+            "distance": int(distance),
+        })
+
+    if not clinics:
+        return [clinic_notice("검색 결과 없음", "2km 이내에 '동물병원' 검색 결과가 없습니다.")]
+
+    clinics.sort(key=lambda clinic: clinic["distance"])
+    return clinics[:RESULT_LIMIT]
@@ -0,0 +1,90 @@
+# pets/dashboard.py
+"""
+API 명세서 4.1 (대시보드) 데이터 조립 모듈
+
+대시보드는 가장 많이 호출되는 API이므로, 요청 한 번에 필요한 DB 왕복 횟수를
+고정된 개수(DASHBOARD_QUERY_BUDGET)로 묶어 둡니다.
+- 1회: 반려동물 조회 + 데이터 버전 (pets/versioning.py, ETag가 같으면 여기서 304로 끝남)
+- 3회: 오늘의 케어 항목, 다가오는 일정 2개, 최근 체중 기록 2개 (prefetch)
+  오늘의 케어 완료/전체 개수는 가져온 오늘의 케어 항목으로 계산합니다.
+"""
+from django.db.models import Prefetch, prefetch_related_objects
+
+from .models import Pet, CareLog, CalendarSchedule, HealthLog
+from .serializers import CareLogSerializer, CalendarScheduleSerializer
+
+# 대시보드 한 번 조회 시 허용되는 최대 쿼리 수 (tests.py의 회귀 테스트가 이 값을 검사합니다)
+DASHBOARD_QUERY_BUDGET = 4
+
+UPCOMING_SCHEDULE_COUNT = 2
+RECENT_WEIGHT_COUNT = 2
+
+
+def dashboard_prefetches(today):
+    """대시보드에 필요한 하위 기록들을 한 번씩만 가져오는 Prefetch 목록"""
+    return [
+        Prefetch(
+            'care_logs',
+            queryset=CareLog.objects.filter(log_date=today),
+            to_attr='today_care_items',
+        ),
+        Prefetch(
+            'schedules',
+            queryset=CalendarSchedule.objects.filter(schedule_date__gte=today).order_by('schedule_date')[:UPCOMING_SCHEDULE_COUNT],
+            to_attr='upcoming_schedules',
+        ),
+        Prefetch(
+            'health_logs',
+            queryset=HealthLog.objects.filter(weight__isnull=False).order_by('-log_date')[:RECENT_WEIGHT_COUNT],
+            to_attr='recent_weights',
+        ),
+    ]
+
+
+def build_dashboard(pet, today):
+    """
+    소유자 확인이 끝난 pet을 받아 care_list, upcoming_schedules, health_trend 섹션을 조립합니다.
+    (하위 기록 prefetch는 ETag 확인 뒤, 여기서 실행됩니다)
+    """
+    prefetch_related_objects([pet], *dashboard_prefetches(today))
+
+    # 1. 오늘의 케어 리스트 (API 4.1 - care_list)
+    care_items = pet.today_care_items
+    care_completed = sum(1 for item in care_items if item.is_complete)
+    care_list_data = {
+        "items": CareLogSerializer(care_items, many=True).data,
+        "completion_rate": (care_completed / len(care_items)) if care_items else 0
+    }
+
+    # 2. 다가오는 일정 (API 4.1 - upcoming_schedules)
+    schedule_data = CalendarScheduleSerializer(pet.upcoming_schedules, many=True).data
+
+    # 3. 건강 추세 (API 4.1 - health_trend)
+    recent_weights = pet.recent_weights  # 최신순
+    last_health_log = recent_weights[0] if recent_weights else None
+
+    weight_graph_data = [
+        {"month": log.log_date.strftime("%m월"), "weight": log.weight} for log in reversed(recent_weights)
+    ]
+    if not weight_graph_data:  # 건강 기록이 없을 경우 Pet의 기본 체중 사용
+        weight_graph_data = [
+            {"month": today.strftime("%m월"), "weight": pet.weight}
+        ]
+
+    recent_change_str = "변동 없음"
+    if len(recent_weights) >= 2:
+        change = recent_weights[0].weight - recent_weights[1].weight
+        recent_change_str = f"{'+' if change > 0 else ''}{change:.1f}kg"
+    elif last_health_log:
+        recent_change_str = f"{last_health_log.weight}kg (최근)"
+
+    health_trend_data = {
+        "recent_change": recent_change_str,
+        "graph_data": weight_graph_data
+    }
+
+    return {
+        "care_list": care_list_data,
+        "upcoming_schedules": schedule_data,
+        "health_trend": health_trend_data,
+    }
@@ -0,0 +1,262 @@
+# pets/http_client.py
+"""
+외부 HTTP API(Kakao 등) 호출용 공용 클라이언트
+
+- requests.Session 하나를 프로세스에서 재사용 (keep-alive, 연결 풀)
+- 재시도 예산(RetryBudget): 전체 요청 대비 재시도 비율을 제한하고, 지수 백오프로 재시도
+- 호스트별 서킷 브레이커: 연속 실패가 쌓이면 잠시 호출을 막고 바로 실패 처리
+- 호스트별 지연 시간(latency) 지표 기록 (GET /pets/cache/stats/ 의 outbound_http, 관리자 전용)
+
+사용 예)
+    from .http_client import get_http_client
+    response = get_http_client().get(url, headers=..., params=..., timeout=3)
+"""
+import random
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+# 다시 시도하면 성공할 수 있는 예외 (그 밖의 RequestException은 실패로 기록만 하고 바로 던집니다)
+RETRY_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """서킷이 열려 있어 호출하지 않은 경우 (기존 RequestException 처리 코드로 함께 잡힙니다)"""
+
+
+class RetryBudget:
+    """
+    요청마다 ratio만큼 토큰을 적립하고, 재시도 한 번에 토큰 1개를 씁니다.
+    장애 상황에서 재시도가 트래픽을 몇 배로 불리는 것을 막습니다.
+    """
+
+    def __init__(self, ratio, max_tokens):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self):
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """연속 failure_threshold번 실패하면 cooldown초 동안 호출을 막습니다. (이후 한 번 시험 호출 허용)"""
+
+    def __init__(self, failure_threshold, cooldown):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if time.monotonic() - self._opened_at >= self.cooldown:
+                return 'half-open'
+            return 'open'
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.cooldown:
+                # half-open: 시험 호출 하나만 통과시키고, 결과가 나올 때까지 다시 연 상태로 둠
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class LatencyMetrics:
+    """호스트별 호출 수, 오류 수, 지연 시간(ms) 통계"""
+
+    def __init__(self, window=500):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.rejected = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._recent = deque(maxlen=window)
+
+    def record(self, elapsed_ms, ok):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self._recent.append(elapsed_ms)
+        if not ok:
+            self.errors += 1
+
+    def snapshot(self):
+        """record()와 같은 잠금(OutboundHttpClient._lock) 안에서 호출해야 합니다."""
+        recent = sorted(self._recent)
+
+        def percentile(p):
+            return round(recent[min(len(recent) - 1, int(len(recent) * p))], 1) if recent else 0
+
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'retries': self.retries,
+            'rejected': self.rejected,
+            'avg_ms': round(self.total_ms / self.count, 1) if self.count else 0,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'max_ms': round(self.max_ms, 1),
+        }
+
+
+class OutboundHttpClient:
+    """연결 풀, 재시도 예산, 서킷 브레이커, 지연 시간 지표를 갖춘 HTTP 클라이언트"""
+
+    def __init__(self, pool_connections, pool_maxsize, max_retries, backoff_base,
+                 retry_budget_ratio, retry_budget_max, breaker_threshold, breaker_cooldown):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.budget = RetryBudget(retry_budget_ratio, retry_budget_max)
+        self._breaker_args = (breaker_threshold, breaker_cooldown)
+        self._breakers = {}
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _host_state(self, host):
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(*self._breaker_args)
+                self._metrics[host] = LatencyMetrics()
+            return self._breakers[host], self._metrics[host]
+
+    def _backoff(self, attempt):
+        delay = self.backoff_base * (2 ** attempt)
+        return delay + random.uniform(0, delay)
+
+    def request(self, method, url, max_retries=None, deadline=None, **kwargs):
+        """
+        session.request()와 같은 인자를 받습니다.
+        deadline(time.monotonic 기준)을 주면 재시도를 포함한 전체 호출이 그 시각을 넘기지 않도록
+        시도마다 timeout을 남은 시간으로 줄이고, 남은 시간이 없으면 재시도하지 않습니다.
+        실패 시 requests.exceptions.RequestException (서킷이 열려 있으면 CircuitOpenError)
+        """
+        host = urlparse(url).netloc
+        breaker, metrics = self._host_state(host)
+        max_retries = self.max_retries if max_retries is None else max_retries
+
+        if not breaker.allow():
+            with self._lock:
+                metrics.rejected += 1
+            raise CircuitOpenError(f"{host} 호출이 일시적으로 차단되었습니다. (연속 실패)")
+
+        self.budget.deposit()
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            if deadline is not None:
+                remaining = deadline - started
+                if remaining <= 0:
+                    raise requests.exceptions.Timeout(f"{host} 호출 제한 시간을 넘었습니다.")
+                kwargs['timeout'] = min(kwargs.get('timeout') or remaining, remaining)
+            response, error = None, None
+            try:
+                response = self.session.request(method, url, **kwargs)
+                ok = response.status_code not in RETRY_STATUS_CODES and response.status_code < 500
+            except requests.exceptions.RequestException as e:
+                error, ok = e, False
+            elapsed_ms = (time.monotonic() - started) * 1000
+
+            with self._lock:
+                metrics.record(elapsed_ms, ok)
+
+            if ok:
+                breaker.record_success()
+                return response
+
+            if error is not None:
+                retryable = isinstance(error, RETRY_EXCEPTIONS)
+            else:
+                retryable = response.status_code in RETRY_STATUS_CODES
+            backoff = self._backoff(attempt)
+            in_time = deadline is None or time.monotonic() + backoff < deadline
+            if retryable and attempt < max_retries and in_time and self.budget.withdraw():
+                with self._lock:
+                    metrics.retries += 1
+                time.sleep(backoff)
+                attempt += 1
+                continue
+
+            breaker.record_failure()
+            if error is not None:
+                raise error
+            return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def metrics(self):
+        """호스트별 지표와 서킷 상태"""
+        # record()가 deque에 추가하는 도중 정렬하지 않도록, 스냅샷은 잠금 안에서 만듭니다.
+        with self._lock:
+            snapshots = {host: metrics.snapshot() for host, metrics in self._metrics.items()}
+            breakers = dict(self._breakers)
+        return {
+            host: {**snapshot, 'circuit': breakers[host].state}
+            for host, snapshot in snapshots.items()
+        }
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """settings 값으로 만든 프로세스 공용 OutboundHttpClient를 반환합니다."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OutboundHttpClient(
+                pool_connections=settings.OUTBOUND_HTTP_POOL_CONNECTIONS,
+                pool_maxsize=settings.OUTBOUND_HTTP_POOL_MAXSIZE,
+                max_retries=settings.OUTBOUND_HTTP_MAX_RETRIES,
+                backoff_base=settings.OUTBOUND_HTTP_BACKOFF_BASE,
+                retry_budget_ratio=settings.OUTBOUND_HTTP_RETRY_BUDGET_RATIO,
+                retry_budget_max=settings.OUTBOUND_HTTP_RETRY_BUDGET_MAX,
+                breaker_threshold=settings.OUTBOUND_HTTP_BREAKER_THRESHOLD,
+                breaker_cooldown=settings.OUTBOUND_HTTP_BREAKER_COOLDOWN,
+            )
+        return _client
@@ -0,0 +1,21 @@
+# pets/management/commands/rebuild_nutrition_rollups.py
+from django.core.management.base import BaseCommand
+
+from pets.rollups import rebuild_nutrition_rollups
+
+
+class Command(BaseCommand):
+    """
+    MealLog 원본으로부터 DailyNutritionRollup(일일 식사 집계)을 다시 계산합니다.
+    - 전체: python manage.py rebuild_nutrition_rollups
+    - 특정 반려동물: python manage.py rebuild_nutrition_rollups --pet 3 --pet 7
+    """
+    help = "MealLog 기록으로 DailyNutritionRollup 집계 테이블을 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pet', type=int, action='append', dest='pet_ids', help="재계산할 반려동물 ID (여러 번 지정 가능)")
+        parser.add_argument('--batch-size', type=int, default=1000, help="bulk_create 배치 크기")
+
+    def handle(self, *args, **options):
+        count = rebuild_nutrition_rollups(pet_ids=options['pet_ids'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"일일 식사 집계 {count}건을 다시 계산했습니다."))
@@ -0,0 +1,22 @@
+# pets/management/commands/run_ai_checkup_worker.py
+from django.core.management.base import BaseCommand
+
+from pets.ai_jobs import run_worker
+
+
+class Command(BaseCommand):
+    """
+    AI 건강 분석(API 7.3) 비동기 작업 워커
+    - 계속 실행: python manage.py run_ai_checkup_worker
+    - 대기열만 비우고 종료 (cron 등): python manage.py run_ai_checkup_worker --once
+    """
+    help = "AiCheckupJob 대기열의 AI 건강 분석 작업을 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="대기 중인 작업을 모두 처리한 뒤 종료")
+        parser.add_argument('--poll-interval', type=float, default=1.0, help="대기열이 비었을 때 다시 확인하기까지 대기 시간(초)")
+
+    def handle(self, *args, **options):
+        self.stdout.write("AI 건강 분석 워커를 시작합니다.")
+        processed = run_worker(poll_interval=options['poll_interval'], once=options['once'])
+        self.stdout.write(self.style.SUCCESS(f"작업 {processed}건을 처리했습니다."))
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.7 on 2026-10-16 23:58
+
+import django.db.models.deletion
+import pets.models
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_activity_rollups(apps, schema_editor):
+    WalkLog = apps.get_model('pets', 'WalkLog')
+    DailyActivityRollup = apps.get_model('pets', 'DailyActivityRollup')
+    totals = WalkLog.objects.values('pet_id', 'log_date').annotate(
+        total_duration=Sum('duration'),
+        total_distance=Sum('distance'),
+        count=Count('id'),
+    ).order_by()
+    DailyActivityRollup.objects.bulk_create(
+        (
+            DailyActivityRollup(
+                pet_id=row['pet_id'],
+                date=row['log_date'],
+                total_duration=row['total_duration'] or 0,
+                total_distance=row['total_distance'] or 0,
+                count=row['count'],
+            )
+            for row in totals.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0004_remove_bcscheckupresult_result_stage_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='carelog',
+            name='log_date',
+            field=models.DateField(default=pets.models.get_current_date, verbose_name='해당 날짜'),
+        ),
+        migrations.AlterField(
+            model_name='healthlog',
+            name='log_type',
+            field=models.CharField(choices=[('예방접종', '예방접종'), ('병원 방문', '병원 방문'), ('투약', '투약'), ('기타', '기타')], max_length=50, verbose_name='기록 종류'),
+        ),
+        migrations.AlterField(
+            model_name='meallog',
+            name='log_date',
+            field=models.DateField(default=pets.models.get_current_date, verbose_name='기록 날짜'),
+        ),
+        migrations.AlterField(
+            model_name='walklog',
+            name='log_date',
+            field=models.DateField(default=pets.models.get_current_date, verbose_name='기록 날짜'),
+        ),
+        migrations.AlterField(
+            model_name='walklog',
+            name='log_type',
+            field=models.CharField(choices=[('산책', '산책'), ('놀이', '놀이'), ('훈련', '훈련'), ('외출', '외출'), ('기타', '기타')], default='산책', max_length=50, verbose_name='활동 종류'),
+        ),
+        migrations.CreateModel(
+            name='DailyActivityRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='집계 날짜')),
+                ('total_duration', models.IntegerField(default=0, verbose_name='총 활동 시간(분)')),
+                ('total_distance', models.FloatField(default=0, verbose_name='총 이동 거리(km)')),
+                ('count', models.IntegerField(default=0, verbose_name='활동 기록 수')),
+                ('pet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_rollups', to='pets.pet')),
+            ],
+            options={
+                'unique_together': {('pet', 'date')},
+            },
+        ),
+        migrations.RunPython(backfill_activity_rollups, migrations.RunPython.noop),
+    ]
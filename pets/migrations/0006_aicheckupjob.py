@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0005_dailyactivityrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AiCheckupJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('symptoms', models.JSONField(verbose_name='증상 목록')),
+                ('location', models.JSONField(blank=True, null=True, verbose_name='사용자 위치')),
+                ('status', models.CharField(choices=[('pending', '대기 중'), ('running', '분석 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=20, verbose_name='상태')),
+                ('result', models.JSONField(blank=True, null=True, verbose_name='분석 결과')),
+                ('error', models.TextField(blank=True, default='', verbose_name='오류 내용')),
+                ('attempts', models.IntegerField(default=0, verbose_name='시도 횟수')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='분석 시작 시각')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='분석 완료 시각')),
+                ('pet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ai_checkup_jobs', to='pets.pet')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'created_at'], name='aicheckupjob_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0006_aicheckupjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bcscheckupresult',
+            index=models.Index(fields=['pet', '-checkup_date'], name='bcs_pet_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='calendarschedule',
+            index=models.Index(fields=['pet', 'schedule_date'], name='schedule_pet_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='healthlog',
+            index=models.Index(fields=['pet', 'log_date', 'weight'], name='healthlog_pet_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='meallog',
+            index=models.Index(fields=['pet', 'log_date', 'created_at'], name='meallog_pet_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='walklog',
+            index=models.Index(fields=['pet', '-log_date', '-created_at'], name='walklog_pet_date_idx'),
+        ),
+    ]
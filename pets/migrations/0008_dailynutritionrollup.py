@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_nutrition_rollups(apps, schema_editor):
+    MealLog = apps.get_model('pets', 'MealLog')
+    DailyNutritionRollup = apps.get_model('pets', 'DailyNutritionRollup')
+    totals = MealLog.objects.values('pet_id', 'log_date', 'food_type').annotate(
+        total_calorie=Sum('calorie'),
+        total_quantity_g=Sum('quantity_g'),
+        count=Count('id'),
+    ).order_by()
+    DailyNutritionRollup.objects.bulk_create(
+        (
+            DailyNutritionRollup(
+                pet_id=row['pet_id'],
+                date=row['log_date'],
+                food_type=row['food_type'],
+                total_calorie=row['total_calorie'] or 0,
+                total_quantity_g=row['total_quantity_g'] or 0,
+                count=row['count'],
+            )
+            for row in totals.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0007_pet_log_date_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyNutritionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='집계 날짜')),
+                ('food_type', models.CharField(choices=[('사료', '사료'), ('간식', '간식'), ('특식', '특식'), ('영양제', '영양제')], max_length=50, verbose_name='종류')),
+                ('total_calorie', models.FloatField(default=0, verbose_name='총 칼로리(kcal)')),
+                ('total_quantity_g', models.FloatField(default=0, verbose_name='총 양(g)')),
+                ('count', models.IntegerField(default=0, verbose_name='식사 기록 수')),
+                ('pet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='nutrition_rollups', to='pets.pet')),
+            ],
+            options={
+                'unique_together': {('pet', 'date', 'food_type')},
+            },
+        ),
+        migrations.RunPython(backfill_nutrition_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_pet_data_versions(apps, schema_editor):
+    Pet = apps.get_model('pets', 'Pet')
+    PetDataVersion = apps.get_model('pets', 'PetDataVersion')
+    PetDataVersion.objects.bulk_create(
+        (PetDataVersion(pet_id=pet_id) for pet_id in Pet.objects.values_list('id', flat=True).iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0008_dailynutritionrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PetDataVersion',
+            fields=[
+                ('pet', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='data_version', serialize=False, to='pets.pet')),
+                ('version', models.PositiveBigIntegerField(default=1, verbose_name='데이터 버전')),
+            ],
+        ),
+        migrations.RunPython(create_pet_data_versions, migrations.RunPython.noop),
+    ]
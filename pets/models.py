@@ -16,6 +16,7 @@ ACTIVITY_TYPES = [('산책', '산책'), ('놀이', '놀이'), ('훈련', '훈련
 HEALTH_LOG_TYPES = [('예방접종', '예방접종'), ('병원 방문', '병원 방문'), ('투약', '투약'), ('기타', '기타')]
 CALENDAR_CATEGORIES = [('병원/약', '병원/약'), ('미용', '미용'), ('행사', '행사'), ('기타', '기타')]
 CARE_LOG_TYPES = [('양치질', '양치질'), ('빗질', '빗질'), ('목욕', '목욕'), ('발톱깎기', '발톱깎기'), ('기타', '기타')]
+AI_CHECKUP_JOB_STATUSES = [('pending', '대기 중'), ('running', '분석 중'), ('done', '완료'), ('failed', '실패')]
 
 
 # --- 모델 정의 ---
@@ -49,6 +50,12 @@ class MealLog(models.Model):
     calorie = models.FloatField(verbose_name="칼로리(kcal)")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 반려동물별 날짜 범위 조회 + 날짜/작성순 정렬
+            models.Index(fields=['pet', 'log_date', 'created_at'], name='meallog_pet_date_idx'),
+        ]
+
     def __str__(self):
         return f"{self.log_date} {self.pet.name} 식사: {self.food_name}"
 
@@ -61,6 +68,12 @@ class WalkLog(models.Model):
     distance = models.FloatField(blank=True, null=True, verbose_name="이동 거리(km, 선택)")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 활동 페이지(API 5.1) 최근 기록: pet 기준 최신순 (log_date, created_at)
+            models.Index(fields=['pet', '-log_date', '-created_at'], name='walklog_pet_date_idx'),
+        ]
+
     def __str__(self):
         return f"{self.log_date} {self.pet.name} 활동: {self.log_type}"
 
@@ -77,6 +90,14 @@ class HealthLog(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 건강 페이지(API 7.1) 최근 기록, 체중 그래프/대시보드 체중 추세: pet 기준 날짜순
+            # weight까지 포함해 'weight IS NOT NULL' 조건을 테이블을 읽지 않고 인덱스에서 거릅니다.
+            # (MySQL은 부분 인덱스를 지원하지 않으므로 일반 복합 인덱스로 둡니다)
+            models.Index(fields=['pet', 'log_date', 'weight'], name='healthlog_pet_date_idx'),
+        ]
+
     def __str__(self):
         return f"{self.log_date} {self.pet.name} 건강 기록: {self.log_type}"
 
@@ -88,6 +109,12 @@ class CalendarSchedule(models.Model):
     category = models.CharField(max_length=50, choices=CALENDAR_CATEGORIES, verbose_name="카테고리")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 월별 일정(API 6.1), 다가오는 일정(대시보드): pet 기준 날짜 범위
+            models.Index(fields=['pet', 'schedule_date'], name='schedule_pet_date_idx'),
+        ]
+
     def __str__(self):
         return f"{self.pet.name} 일정 ({self.schedule_date}) - {self.content}"
 
@@ -100,6 +127,7 @@ class CareLog(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
+        # (pet, log_date, content) 유니크 인덱스가 pet + 날짜 조회에도 쓰이므로 별도 인덱스는 두지 않습니다.
         unique_together = ('pet', 'log_date', 'content')
 
     def __str__(self):
@@ -118,7 +146,75 @@ class BcsCheckupResult(models.Model):
 
     checkup_date = models.DateTimeField(auto_now_add=True, verbose_name="진단 일시")
 
+    class Meta:
+        indexes = [
+            # 건강 페이지의 최신 BCS 결과
+            models.Index(fields=['pet', '-checkup_date'], name='bcs_pet_date_idx'),
+        ]
+
     def __str__(self):
         # [수정] __str__도 새 필드를 반영하도록 변경
         return f"{self.pet.name} BCS 결과 ({self.checkup_date.date()}) - {self.stage_number}단계: {self.stage_text}"
 
+
+class DailyActivityRollup(models.Model):
+    """반려동물별 일일 활동 집계 모델 (WalkLog 생성/수정/삭제 시 증분 갱신)"""
+    pet = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name='activity_rollups')
+    date = models.DateField(verbose_name="집계 날짜")
+    total_duration = models.IntegerField(default=0, verbose_name="총 활동 시간(분)")
+    total_distance = models.FloatField(default=0, verbose_name="총 이동 거리(km)")
+    count = models.IntegerField(default=0, verbose_name="활동 기록 수")
+
+    class Meta:
+        unique_together = ('pet', 'date')
+
+    def __str__(self):
+        return f"{self.pet.name} 활동 집계 ({self.date}) - {self.total_duration}분"
+
+class DailyNutritionRollup(models.Model):
+    """반려동물별 일일 식사 집계 모델 - 종류(food_type)별 (MealLog 생성/수정/삭제 시 증분 갱신)"""
+    pet = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name='nutrition_rollups')
+    date = models.DateField(verbose_name="집계 날짜")
+    food_type = models.CharField(max_length=50, choices=MEAL_TYPES, verbose_name="종류")
+    total_calorie = models.FloatField(default=0, verbose_name="총 칼로리(kcal)")
+    total_quantity_g = models.FloatField(default=0, verbose_name="총 양(g)")
+    count = models.IntegerField(default=0, verbose_name="식사 기록 수")
+
+    class Meta:
+        unique_together = ('pet', 'date', 'food_type')
+
+    def __str__(self):
+        return f"{self.pet.name} 식사 집계 ({self.date}, {self.food_type}) - {self.total_calorie}kcal"
+
+class PetDataVersion(models.Model):
+    """
+    반려동물별 데이터 버전 (Pet 또는 기록이 바뀔 때마다 1씩 증가, pets/versioning.py 참고)
+    조회 API의 ETag를 이 값으로 만들어, 바뀐 것이 없으면 304로 응답합니다.
+    """
+    pet = models.OneToOneField(Pet, on_delete=models.CASCADE, primary_key=True, related_name='data_version')
+    version = models.PositiveBigIntegerField(default=1, verbose_name="데이터 버전")
+
+    def __str__(self):
+        return f"{self.pet.name} 데이터 버전 {self.version}"
+
+class AiCheckupJob(models.Model):
+    """AI 건강 분석 비동기 작업 모델 (DB 기반 작업 큐, pets/ai_jobs.py 참고)"""
+    pet = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name='ai_checkup_jobs')
+    symptoms = models.JSONField(verbose_name="증상 목록") # 예: ["구토", "설사"]
+    location = models.JSONField(blank=True, null=True, verbose_name="사용자 위치") # 예: {"lat": .., "lng": ..}
+    status = models.CharField(max_length=20, choices=AI_CHECKUP_JOB_STATUSES, default='pending', verbose_name="상태")
+    result = models.JSONField(blank=True, null=True, verbose_name="분석 결과")
+    error = models.TextField(blank=True, default='', verbose_name="오류 내용")
+    attempts = models.IntegerField(default=0, verbose_name="시도 횟수")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True, verbose_name="분석 시작 시각")
+    finished_at = models.DateTimeField(blank=True, null=True, verbose_name="분석 완료 시각")
+
+    class Meta:
+        indexes = [
+            # 워커가 "대기 중인 가장 오래된 작업"을 찾을 때 사용
+            models.Index(fields=['status', 'created_at'], name='aicheckupjob_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.pet.name} AI 분석 작업 #{self.id} ({self.status})"
@@ -0,0 +1,110 @@
+# pets/page_cache.py
+"""
+반려동물별 페이지 응답 캐시 (건강 7.1 / 활동 5.1 / 월별 일정 6.1)
+
+ETag(pets/versioning.py)가 맞지 않아 200으로 응답해야 할 때도, 같은 데이터 버전이면
+한 번 만든 응답 데이터를 Django 캐시(settings.PET_PAGE_CACHE_ALIAS)에서 그대로 돌려줍니다.
+- 키: (반려동물, 데이터 버전, 화면 이름, 파라미터). 기록이 바뀌면 버전이 올라가므로
+  이전 버전의 응답은 다시 읽히지 않습니다.
+- 버전이 오르면(커밋 후) 그 반려동물의 캐시 항목을 키 목록(index)으로 찾아 바로 지웁니다.
+  키 목록 갱신은 원자적이지 않으므로, 놓친 항목은 PET_PAGE_CACHE_TTL 후 만료됩니다.
+- locmem 캐시로 바로 동작하며, 여러 서버로 운영하면 Redis/Memcached 같은 공유 캐시로 지정하세요.
+- 적중/실패/저장/삭제 횟수는 프로세스별로 세며, GET /pets/cache/stats/ (관리자)로 확인합니다.
+"""
+import hashlib
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+
+CACHE_KEY_PREFIX = 'pet-page'
+
+
+class PetPageCache:
+    """반려동물별 페이지 응답 캐시 (적중/실패 카운터 포함)"""
+
+    def __init__(self, alias, ttl):
+        self.alias = alias
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._stats = Counter()
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def _count(self, name, value=1):
+        with self._lock:
+            self._stats[name] += value
+
+    def key(self, pet_id, version, view_name, params=()):
+        raw = ':'.join(str(param) for param in params)
+        digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+        return f"{CACHE_KEY_PREFIX}:{pet_id}:{version}:{view_name}:{digest}"
+
+    def index_key(self, pet_id):
+        """pet_id의 캐시 키 목록을 저장하는 키"""
+        return f"{CACHE_KEY_PREFIX}-index:{pet_id}"
+
+    def get_or_build(self, pet_id, version, view_name, params, build):
+        """캐시된 응답 데이터를 반환합니다. 없으면 build()로 만들어 저장합니다."""
+        key = self.key(pet_id, version, view_name, params)
+        data = self.backend.get(key)
+        if data is not None:
+            self._count('hits')
+            return data
+
+        self._count('misses')
+        data = build()
+        self.backend.set(key, data, timeout=self.ttl)
+        index_key = self.index_key(pet_id)
+        keys = self.backend.get(index_key) or []
+        if key not in keys:
+            self.backend.set(index_key, keys + [key], timeout=self.ttl)
+        self._count('stores')
+        return data
+
+    def invalidate(self, pet_id):
+        """pet_id의 캐시 항목을 모두 지웁니다."""
+        index_key = self.index_key(pet_id)
+        keys = self.backend.get(index_key) or []
+        if keys:
+            self.backend.delete_many(keys)
+        self.backend.delete(index_key)
+        self._count('evictions', len(keys))
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self._stats['hits'], self._stats['misses']
+            return {
+                'backend': self.alias,
+                'hits': hits,
+                'misses': misses,
+                'stores': self._stats['stores'],
+                'evictions': self._stats['evictions'],
+                'hit_rate': (hits / (hits + misses)) if (hits + misses) else 0,
+            }
+
+
+_page_cache = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache():
+    """settings 값으로 만든 프로세스 공용 PetPageCache를 반환합니다."""
+    global _page_cache
+    with _page_cache_lock:
+        if _page_cache is None:
+            _page_cache = PetPageCache(
+                alias=settings.PET_PAGE_CACHE_ALIAS,
+                ttl=settings.PET_PAGE_CACHE_TTL,
+            )
+        return _page_cache
+
+
+def reset_page_cache():
+    """(테스트/설정 변경용) 공용 캐시 인스턴스를 버립니다."""
+    global _page_cache
+    with _page_cache_lock:
+        _page_cache = None
@@ -0,0 +1,162 @@
+# pets/rollups.py
+"""
+기록(Log) 모델을 날짜별로 미리 합산해 두는 집계(rollup) 테이블 관리 함수들
+
+- 활동 페이지(API 5.1)는 매번 WalkLog를 SUM 하는 대신 DailyActivityRollup을 읽습니다.
+- 식사 페이지(API 5.4)는 MealLog 대신 DailyNutritionRollup(날짜 + 종류별)을 읽습니다.
+- 집계 값은 pets/signals.py에서 기록 변경 시 증분(delta)으로 갱신하고, 어긋난 경우
+  `python manage.py rebuild_activity_rollups` / `rebuild_nutrition_rollups`로 다시 계산합니다.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+
+from .models import WalkLog, MealLog, DailyActivityRollup, DailyNutritionRollup
+
+
+def walk_log_delta(duration, distance, sign=1):
+    """WalkLog 한 건이 집계에 더하는(빼는) 값"""
+    return {
+        'total_duration': sign * (duration or 0),
+        'total_distance': sign * (distance or 0),
+        'count': sign,
+    }
+
+
+def apply_activity_delta(pet_id, day, delta):
+    """
+    (pet, day) 집계 행에 delta를 원자적으로(F 표현식) 더합니다. 행이 없으면 새로 만듭니다.
+    빼는 delta(기록 삭제/수정 전 값)는 행이 있을 때만 반영하고, 새 행을 만들지 않습니다.
+    """
+    updates = {field: F(field) + value for field, value in delta.items()}
+    rollups = DailyActivityRollup.objects.filter(pet_id=pet_id, date=day)
+    if rollups.update(**updates) or delta['count'] < 0:
+        return
+    try:
+        with transaction.atomic():
+            DailyActivityRollup.objects.create(pet_id=pet_id, date=day, **delta)
+    except IntegrityError:
+        # 동시에 다른 요청이 먼저 행을 만든 경우
+        rollups.update(**updates)
+
+
+def apply_walk_logs(logs):
+    """
+    bulk_create로 저장한 WalkLog들(시그널이 실행되지 않음)을 집계에 반영합니다.
+    같은 (pet, 날짜)의 기록은 합쳐서 한 번만 갱신합니다.
+    """
+    deltas = {}
+    for log in logs:
+        delta = walk_log_delta(log.duration, log.distance)
+        total = deltas.setdefault((log.pet_id, log.log_date), dict.fromkeys(delta, 0))
+        for field, value in delta.items():
+            total[field] += value
+    for (pet_id, day), delta in deltas.items():
+        apply_activity_delta(pet_id, day, delta)
+
+
+def rebuild_activity_rollups(pet_ids=None, batch_size=1000):
+    """
+    WalkLog 원본에서 DailyActivityRollup을 다시 계산합니다.
+    pet_ids가 주어지면 해당 반려동물들만 재계산합니다.
+    """
+    logs = WalkLog.objects.all()
+    rollups = DailyActivityRollup.objects.all()
+    if pet_ids is not None:
+        logs = logs.filter(pet_id__in=pet_ids)
+        rollups = rollups.filter(pet_id__in=pet_ids)
+
+    totals = logs.values('pet_id', 'log_date').annotate(
+        total_duration=Sum('duration'),
+        total_distance=Sum('distance'),
+        count=Count('id'),
+    ).order_by()
+
+    with transaction.atomic():
+        rollups.delete()
+        created = DailyActivityRollup.objects.bulk_create(
+            (
+                DailyActivityRollup(
+                    pet_id=row['pet_id'],
+                    date=row['log_date'],
+                    total_duration=row['total_duration'] or 0,
+                    total_distance=row['total_distance'] or 0,
+                    count=row['count'],
+                )
+                for row in totals.iterator()
+            ),
+            batch_size=batch_size,
+        )
+    return len(created)
+
+
+
+# --- 식사(MealLog) -> DailyNutritionRollup ---
+
+def meal_log_delta(calorie, quantity_g, sign=1):
+    """MealLog 한 건이 집계에 더하는(빼는) 값"""
+    return {
+        'total_calorie': sign * (calorie or 0),
+        'total_quantity_g': sign * (quantity_g or 0),
+        'count': sign,
+    }
+
+
+def apply_nutrition_delta(pet_id, day, food_type, delta):
+    """
+    (pet, day, food_type) 집계 행에 delta를 원자적으로 더합니다. 행이 없으면 새로 만듭니다.
+    빼는 delta는 행이 있을 때만 반영합니다. (apply_activity_delta와 같음)
+    """
+    updates = {field: F(field) + value for field, value in delta.items()}
+    rollups = DailyNutritionRollup.objects.filter(pet_id=pet_id, date=day, food_type=food_type)
+    if rollups.update(**updates) or delta['count'] < 0:
+        return
+    try:
+        with transaction.atomic():
+            DailyNutritionRollup.objects.create(pet_id=pet_id, date=day, food_type=food_type, **delta)
+    except IntegrityError:
+        rollups.update(**updates)
+
+
+def apply_meal_logs(logs):
+    """bulk_create로 저장한 MealLog들을 집계에 반영합니다. (같은 pet/날짜/종류는 합쳐서 한 번)"""
+    deltas = {}
+    for log in logs:
+        delta = meal_log_delta(log.calorie, log.quantity_g)
+        total = deltas.setdefault((log.pet_id, log.log_date, log.food_type), dict.fromkeys(delta, 0))
+        for field, value in delta.items():
+            total[field] += value
+    for (pet_id, day, food_type), delta in deltas.items():
+        apply_nutrition_delta(pet_id, day, food_type, delta)
+
+
+def rebuild_nutrition_rollups(pet_ids=None, batch_size=1000):
+    """MealLog 원본에서 DailyNutritionRollup을 다시 계산합니다."""
+    logs = MealLog.objects.all()
+    rollups = DailyNutritionRollup.objects.all()
+    if pet_ids is not None:
+        logs = logs.filter(pet_id__in=pet_ids)
+        rollups = rollups.filter(pet_id__in=pet_ids)
+
+    totals = logs.values('pet_id', 'log_date', 'food_type').annotate(
+        total_calorie=Sum('calorie'),
+        total_quantity_g=Sum('quantity_g'),
+        count=Count('id'),
+    ).order_by()
+
+    with transaction.atomic():
+        rollups.delete()
+        created = DailyNutritionRollup.objects.bulk_create(
+            (
+                DailyNutritionRollup(
+                    pet_id=row['pet_id'],
+                    date=row['log_date'],
+                    food_type=row['food_type'],
+                    total_calorie=row['total_calorie'] or 0,
+                    total_quantity_g=row['total_quantity_g'] or 0,
+                    count=row['count'],
+                )
+                for row in totals.iterator()
+            ),
+            batch_size=batch_size,
+        )
+    return len(created)
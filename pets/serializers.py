@@ -1,7 +1,7 @@
 # pets/serializers.py
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
-from .models import Pet, CareLog, CalendarSchedule, WalkLog, HealthLog, BcsCheckupResult, MealLog
+from .models import Pet, CareLog, CalendarSchedule, WalkLog, HealthLog, BcsCheckupResult, MealLog, AiCheckupJob
 from datetime import date
 
 class PetSerializer(serializers.ModelSerializer):
@@ -84,6 +84,15 @@ class WalkLogSerializer(serializers.ModelSerializer):
         fields = ['id', 'log_type', 'duration', 'distance', 'log_date']
         read_only_fields = ['id']
         
+class MealLogSerializer(serializers.ModelSerializer):
+    """
+    API 명세서 5.4, 5.5: 식사 기록(MealLog)을 위한 Serializer
+    """
+    class Meta:
+        model = MealLog
+        fields = ['id', 'log_date', 'food_type', 'food_name', 'quantity_g', 'calorie']
+        read_only_fields = ['id']
+
 class HealthLogSerializer(serializers.ModelSerializer):
     """
     API 명세서 7.2: 건강 기록(HealthLog)을 위한 Serializer
@@ -108,4 +117,16 @@ class BcsCheckupResultSerializer(serializers.ModelSerializer):
         # 'stage_number', 'stage_text', 'checkup_date'는 
         # 서버에서 계산하고 저장하므로 읽기 전용
         read_only_fields = ['id', 'stage_number', 'stage_text', 'checkup_date']
-        # --- ⬆️ [수정] ---
\ No newline at end of file
+        # --- ⬆️ [수정] ---
+
+class AiCheckupJobSerializer(serializers.ModelSerializer):
+    """
+    API 명세서 7.3 (비동기 모드): AI 건강 분석 작업 상태/결과 조회를 위한 Serializer
+    - status가 'done'이면 result에 7.3 응답 본문(analysis_result, nearby_clinics)이 담깁니다.
+    """
+    job_id = serializers.ReadOnlyField(source='id')
+
+    class Meta:
+        model = AiCheckupJob
+        fields = ['job_id', 'status', 'result', 'error', 'created_at', 'started_at', 'finished_at']
+        read_only_fields = fields
@@ -0,0 +1,117 @@
+# pets/signals.py
+from django.db.models import QuerySet
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Pet, CareLog, CalendarSchedule, HealthLog, WalkLog, MealLog, BcsCheckupResult
+from .rollups import walk_log_delta, apply_activity_delta, meal_log_delta, apply_nutrition_delta
+from .versioning import bump_pet_version
+
+# 바뀌면 반려동물 데이터 버전(ETag)을 올려야 하는 기록 모델
+VERSIONED_LOG_MODELS = [CareLog, CalendarSchedule, HealthLog, WalkLog, MealLog, BcsCheckupResult]
+
+
+def is_direct_delete(sender, origin):
+    """
+    기록(sender) 자체를 지운 경우인지 확인합니다.
+    Pet(또는 사용자) 삭제로 함께 지워지는 기록이면 집계/버전 행도 같이 지워지므로
+    post_delete에서 갱신하면 안 됩니다. (지워지는 중인 pet을 참조하는 행이 다시 생김)
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return origin is None or origin_model is sender
+
+
+# --- WalkLog -> DailyActivityRollup 증분 갱신 ---
+@receiver(pre_save, sender=WalkLog)
+def remember_previous_walk_log(sender, instance, **kwargs):
+    """
+    수정(UPDATE)일 경우, 저장 전의 값을 기억해 두었다가
+    post_save에서 이전 날짜의 집계에서 빼줍니다.
+    """
+    instance._rollup_previous = None
+    if instance.pk:
+        instance._rollup_previous = (
+            WalkLog.objects.filter(pk=instance.pk)
+            .values('pet_id', 'log_date', 'duration', 'distance')
+            .first()
+        )
+
+
+@receiver(post_save, sender=WalkLog)
+def update_activity_rollup_on_save(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_rollup_previous', None)
+    if not created and previous:
+        apply_activity_delta(
+            previous['pet_id'], previous['log_date'],
+            walk_log_delta(previous['duration'], previous['distance'], sign=-1),
+        )
+    apply_activity_delta(instance.pet_id, instance.log_date, walk_log_delta(instance.duration, instance.distance))
+
+
+@receiver(post_delete, sender=WalkLog)
+def update_activity_rollup_on_delete(sender, instance, origin=None, **kwargs):
+    if not is_direct_delete(sender, origin):
+        return
+    apply_activity_delta(
+        instance.pet_id, instance.log_date,
+        walk_log_delta(instance.duration, instance.distance, sign=-1),
+    )
+
+
+
+# --- MealLog -> DailyNutritionRollup 증분 갱신 ---
+@receiver(pre_save, sender=MealLog)
+def remember_previous_meal_log(sender, instance, **kwargs):
+    """수정(UPDATE)일 경우 저장 전의 값을 기억해 두었다가 post_save에서 이전 집계에서 빼줍니다."""
+    instance._rollup_previous = None
+    if instance.pk:
+        instance._rollup_previous = (
+            MealLog.objects.filter(pk=instance.pk)
+            .values('pet_id', 'log_date', 'food_type', 'calorie', 'quantity_g')
+            .first()
+        )
+
+
+@receiver(post_save, sender=MealLog)
+def update_nutrition_rollup_on_save(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_rollup_previous', None)
+    if not created and previous:
+        apply_nutrition_delta(
+            previous['pet_id'], previous['log_date'], previous['food_type'],
+            meal_log_delta(previous['calorie'], previous['quantity_g'], sign=-1),
+        )
+    apply_nutrition_delta(
+        instance.pet_id, instance.log_date, instance.food_type,
+        meal_log_delta(instance.calorie, instance.quantity_g),
+    )
+
+
+@receiver(post_delete, sender=MealLog)
+def update_nutrition_rollup_on_delete(sender, instance, origin=None, **kwargs):
+    if not is_direct_delete(sender, origin):
+        return
+    apply_nutrition_delta(
+        instance.pet_id, instance.log_date, instance.food_type,
+        meal_log_delta(instance.calorie, instance.quantity_g, sign=-1),
+    )
+
+
+
+# --- Pet / 기록 변경 -> PetDataVersion 증가 (pets/versioning.py) ---
+@receiver(post_save, sender=Pet)
+def bump_version_on_pet_save(sender, instance, **kwargs):
+    bump_pet_version(instance.pk)
+
+
+def bump_version_on_log_save(sender, instance, **kwargs):
+    bump_pet_version(instance.pet_id)
+
+
+def bump_version_on_log_delete(sender, instance, origin=None, **kwargs):
+    if is_direct_delete(sender, origin):
+        bump_pet_version(instance.pet_id)
+
+
+for model in VERSIONED_LOG_MODELS:
+    post_save.connect(bump_version_on_log_save, sender=model, dispatch_uid=f'bump-version-save-{model.__name__}')
+    post_delete.connect(bump_version_on_log_delete, sender=model, dispatch_uid=f'bump-version-delete-{model.__name__}')
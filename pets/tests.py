@@ -1,3 +1,796 @@
-from django.test import TestCase
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import User
+from .models import Pet, CareLog, CalendarSchedule, HealthLog, WalkLog, MealLog, BcsCheckupResult, DailyActivityRollup, DailyNutritionRollup, PetDataVersion, AiCheckupJob
+from .dashboard import DASHBOARD_QUERY_BUDGET
+from .rollups import rebuild_activity_rollups, rebuild_nutrition_rollups
+from .ai_jobs import claim_next_job, requeue_stale_jobs, run_worker
+from .ai_cache import analysis_cache_key, get_analysis_cache, reset_analysis_cache
+from .page_cache import get_page_cache, reset_page_cache
+from .ai_checkup import analyze_symptoms, find_clinics, run_checkup
+from .ai_client import ai_clients
+from .clinics import get_clinic_backend, haversine_m, search_nearby_clinics
+from .http_client import OutboundHttpClient, CircuitOpenError
+from .bulk import CareLogBulkWriter
+
+
+def create_pet(owner, **kwargs):
+    defaults = {
+        'name': '초코',
+        'species': '강아지',
+        'breed': '푸들',
+        'birth_date': date(2020, 1, 1),
+        'gender': '수컷',
+        'is_neutered': True,
+        'weight': 5.0,
+    }
+    defaults.update(kwargs)
+    return Pet.objects.create(owner=owner, **defaults)
+
+
+class PetAPITestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='owner', password='pw', email='owner@example.com', nickname='주인'
+        )
+        self.pet = create_pet(self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.today = timezone.now().date()
+        caches[settings.PET_PAGE_CACHE_ALIAS].clear()
+
+
+class DashboardQueryCountTests(PetAPITestCase):
+    """API 4.1 대시보드가 데이터 양과 상관없이 고정된 쿼리 수로 응답하는지 확인합니다."""
+
+    def seed(self, n, start=0):
+        for i in range(start, start + n):
+            CareLog.objects.create(pet=self.pet, log_date=self.today, content=f'할 일 {i}', is_complete=(i % 2 == 0))
+            CalendarSchedule.objects.create(pet=self.pet, schedule_date=self.today + timedelta(days=i), content=f'일정 {i}', category='기타')
+            HealthLog.objects.create(pet=self.pet, log_date=self.today - timedelta(days=i), log_type='기타', content='체중 측정', weight=5.0 + i)
+
+    def test_dashboard_query_budget(self):
+        url = reverse('dashboard', args=[self.pet.id])
+        seeded = 0
+        for n in (0, 3, 20):
+            self.seed(n, start=seeded)
+            seeded += n
+            with self.assertNumQueries(DASHBOARD_QUERY_BUDGET):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+    def test_dashboard_content(self):
+        self.seed(3)
+        response = self.client.get(reverse('dashboard', args=[self.pet.id]))
+        data = response.json()
+        self.assertEqual(len(data['care_list']['items']), 3)
+        self.assertAlmostEqual(data['care_list']['completion_rate'], 2 / 3)
+        self.assertEqual(
+            [s['schedule_date'] for s in data['upcoming_schedules']],
+            [str(self.today), str(self.today + timedelta(days=1))],
+        )
+        self.assertEqual(data['health_trend']['recent_change'], '-1.0kg')
+
+    def test_dashboard_other_owner(self):
+        other = User.objects.create_user(username='other', password='pw', email='other@example.com', nickname='남')
+        pet = create_pet(other)
+        response = self.client.get(reverse('dashboard', args=[pet.id]))
+        self.assertEqual(response.status_code, 404)
+
+
+class ActivityRollupTests(PetAPITestCase):
+    """WalkLog 변경이 DailyActivityRollup에 증분 반영되는지 확인합니다."""
+
+    def rollup(self, day):
+        return DailyActivityRollup.objects.filter(pet=self.pet, date=day).values('total_duration', 'total_distance', 'count').first()
+
+    def test_incremental_create_update_delete(self):
+        yesterday = self.today - timedelta(days=1)
+        first = WalkLog.objects.create(pet=self.pet, log_date=self.today, duration=30, distance=1.5)
+        WalkLog.objects.create(pet=self.pet, log_date=self.today, duration=20)
+        self.assertEqual(self.rollup(self.today), {'total_duration': 50, 'total_distance': 1.5, 'count': 2})
+
+        first.log_date = yesterday
+        first.duration = 40
+        first.save()
+        self.assertEqual(self.rollup(self.today), {'total_duration': 20, 'total_distance': 0, 'count': 1})
+        self.assertEqual(self.rollup(yesterday), {'total_duration': 40, 'total_distance': 1.5, 'count': 1})
+
+        first.delete()
+        self.assertEqual(self.rollup(yesterday)['count'], 0)
+
+    def test_rebuild_matches_incremental(self):
+        for i in range(5):
+            WalkLog.objects.create(pet=self.pet, log_date=self.today - timedelta(days=i % 3), duration=10 + i, distance=0.5)
+        incremental = list(DailyActivityRollup.objects.filter(count__gt=0).order_by('date').values('date', 'total_duration', 'count'))
+        rebuild_activity_rollups()
+        rebuilt = list(DailyActivityRollup.objects.order_by('date').values('date', 'total_duration', 'count'))
+        self.assertEqual(incremental, rebuilt)
+
+    def test_deleting_pet_and_user_with_logs(self):
+        other_pet = create_pet(self.user, name='두부')
+        for pet in (self.pet, other_pet):
+            WalkLog.objects.create(pet=pet, log_date=self.today, duration=30)
+            MealLog.objects.create(pet=pet, log_date=self.today, food_type='사료', food_name='사료', quantity_g=100, calorie=350)
+
+        response = self.client.delete(reverse('pet-detail', args=[self.pet.id]))
+        self.assertEqual(response.status_code, 204)
+        connection.check_constraints()
+
+        self.user.delete()
+        connection.check_constraints()
+        self.assertFalse(DailyActivityRollup.objects.exists())
+        self.assertFalse(DailyNutritionRollup.objects.exists())
+
+    def test_missing_rollup_is_not_recreated_negative(self):
+        log = WalkLog.objects.create(pet=self.pet, log_date=self.today, duration=30)
+        DailyActivityRollup.objects.all().delete()
+        log.delete()
+        self.assertFalse(DailyActivityRollup.objects.exists())
+
+        meal = MealLog.objects.create(pet=self.pet, log_date=self.today, food_type='사료', food_name='사료', quantity_g=100, calorie=350)
+        DailyNutritionRollup.objects.all().delete()
+        meal.delete()
+        self.assertFalse(DailyNutritionRollup.objects.exists())
+
+    def test_activity_page_reads_rollups(self):
+        WalkLog.objects.create(pet=self.pet, log_date=self.today, duration=30, distance=2.0)
+        WalkLog.objects.create(pet=self.pet, log_date=self.today - timedelta(days=2), duration=15)
+        response = self.client.get(reverse('activity-page', args=[self.pet.id]))
+        data = response.json()
+        self.assertEqual(data['today_summary'], {'duration': 30, 'distance': 2.0})
+        self.assertEqual([d['duration'] for d in data['weekly_analysis']], [0, 0, 0, 0, 15, 0, 30])
+
+
+@override_settings(AI_CHECKUP_ASYNC=True)
+class AiCheckupJobTests(PetAPITestCase):
+    """API 7.3 비동기 모드: 작업 등록 -> 워커 처리 -> 상태 조회"""
+
+    def test_enqueue_and_poll(self):
+        response = self.client.post(
+            reverse('ai-checkup', args=[self.pet.id]),
+            {'symptoms': ['구토'], 'location': {'lat': 33.5, 'lng': 126.5}},
+            format='json',
+        )
+        self.assertEqual(response.status_code, 202)
+        status_url = response.json()['status_url']
+        self.assertEqual(self.client.get(status_url).json()['status'], 'pending')
+
+        result = {'analysis_result': {'analysis': {}, 'recommendations': []}, 'nearby_clinics': []}
+        with mock.patch('pets.ai_jobs.run_checkup', return_value=result) as run_checkup:
+            self.assertEqual(run_worker(once=True), 1)
+        run_checkup.assert_called_once()
+
+        data = self.client.get(status_url).json()
+        self.assertEqual(data['status'], 'done')
+        self.assertEqual(data['result'], result)
+
+    @override_settings(AI_CHECKUP_JOB_MAX_ATTEMPTS=2)
+    def test_crashed_job_stops_after_max_attempts(self):
+        job = self.pet.ai_checkup_jobs.create(symptoms=['구토'])
+        for expected_attempts in (1, 2):
+            # 워커가 작업을 가져간 뒤 결과를 저장하지 못하고 죽은 경우
+            self.assertEqual(claim_next_job().id, job.id)
+            job.refresh_from_db()
+            self.assertEqual(job.attempts, expected_attempts)
+            AiCheckupJob.objects.filter(id=job.id).update(started_at=timezone.now() - timedelta(hours=1))
+            requeue_stale_jobs()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'failed')
+        self.assertIsNone(claim_next_job())
+
+    def test_job_of_other_owner(self):
+        other = User.objects.create_user(username='other', password='pw', email='other@example.com', nickname='남')
+        job = create_pet(other).ai_checkup_jobs.create(symptoms=['구토'])
+        response = self.client.get(reverse('ai-checkup-job', args=[job.id]))
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(GOOGLE_GEMINI_API_KEY='test-key')
+class AnalysisCacheTests(PetAPITestCase):
+    """같은 입력의 AI 분석은 캐시에서 재사용되어야 합니다."""
+
+    def setUp(self):
+        super().setUp()
+        reset_analysis_cache()
+        self.addCleanup(reset_analysis_cache)
+        caches[settings.AI_ANALYSIS_CACHE_ALIAS].clear()
+
+    def test_key_ignores_symptom_order_and_spacing(self):
+        self.assertEqual(
+            analysis_cache_key(self.pet, ['구토', ' 설사 ']),
+            analysis_cache_key(self.pet, ['설사', '구토', '구토']),
+        )
+        self.assertNotEqual(
+            analysis_cache_key(self.pet, ['구토']),
+            analysis_cache_key(self.pet, ['설사']),
+        )
+
+    @mock.patch('pets.ai_client.genai')
+    def test_second_call_hits_cache(self, genai):
+        ai_clients.reset()
+        self.addCleanup(ai_clients.reset)
+        genai.GenerativeModel.return_value.generate_content.return_value.text = '{"analysis": {}, "recommendations": []}'
+        other_pet = create_pet(self.user, name='보리')  # 같은 종/품종/나이대
+
+        first = analyze_symptoms(self.pet, ['구토', '설사'])
+        second = analyze_symptoms(other_pet, ['설사', '구토'])
+
+        self.assertEqual(first, second)
+        self.assertEqual(genai.GenerativeModel.return_value.generate_content.call_count, 1)
+        stats = get_analysis_cache().stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+
+class ConcurrentCheckupTests(PetAPITestCase):
+    """AI 분석과 병원 검색이 동시에 실행되고, 제한 시간을 넘긴 쪽만 기본값으로 대체되는지 확인합니다."""
+
+    def slow(self, seconds, value):
+        def call(*args):
+            time.sleep(seconds)
+            return value
+        return call
+
+    @override_settings(AI_ANALYSIS_TIMEOUT=2, CLINIC_SEARCH_TIMEOUT=2)
+    def test_calls_run_in_parallel(self):
+        analysis = {'analysis': {}, 'recommendations': []}
+        with mock.patch('pets.ai_checkup.analyze_symptoms', self.slow(0.3, analysis)), \
+                mock.patch('pets.ai_checkup.find_clinics', self.slow(0.3, [])):
+            started = time.monotonic()
+            data = run_checkup(self.pet, ['구토'], None)
+            elapsed = time.monotonic() - started
+        self.assertLess(elapsed, 0.55)
+        self.assertEqual(data, {'analysis_result': analysis, 'nearby_clinics': []})
+
+    @override_settings(AI_ANALYSIS_TIMEOUT=0.2, CLINIC_SEARCH_TIMEOUT=2)
+    def test_partial_result_on_timeout(self):
+        clinics = [{'id': 1, 'name': '동물병원'}]
+        with mock.patch('pets.ai_checkup.analyze_symptoms', self.slow(1, {})), \
+                mock.patch('pets.ai_checkup.find_clinics', self.slow(0, clinics)):
+            data = run_checkup(self.pet, ['구토'], None)
+        self.assertEqual(data['timed_out'], ['analysis_result'])
+        self.assertEqual(data['nearby_clinics'], clinics)
+        self.assertIn('구토', data['analysis_result']['analysis']['issue_title'])
+
+    @override_settings(AI_ANALYSIS_TIMEOUT=0.2, CLINIC_SEARCH_TIMEOUT=0.2)
+    def test_queued_calls_cancelled_when_pool_saturated(self):
+        # 다른 요청들이 작업자 2개를 모두 차지해, 이번 요청의 작업이 대기열에서 시간을 다 쓴 경우
+        executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(executor.shutdown)
+        release = threading.Event()
+        for _ in range(2):
+            executor.submit(release.wait, 5)
+
+        with mock.patch('pets.ai_checkup._executor', executor), \
+                mock.patch('pets.ai_checkup.analyze_symptoms') as analyze, \
+                mock.patch('pets.ai_checkup.find_clinics') as find:
+            data = run_checkup(self.pet, ['구토'], None)
+            release.set()
+            executor.shutdown(wait=True)
+
+        self.assertEqual(data['timed_out'], ['analysis_result', 'nearby_clinics'])
+        # 취소되었으므로 작업자가 비어도 뒤늦게 실행되지 않음
+        analyze.assert_not_called()
+        find.assert_not_called()
+
+
+@override_settings(CLINIC_SEARCH_BACKEND='pets.clinics.FakeClinicBackend')
+class ClinicTileCacheTests(TestCase):
+    """가까운 사용자들은 같은 타일 캐시를 공유하고, 거리는 각자의 위치로 다시 계산되어야 합니다."""
+
+    def setUp(self):
+        caches[settings.CLINIC_TILE_CACHE_ALIAS].clear()
+        self.backend = get_clinic_backend()
+        self.backend.calls.clear()
+        self.backend.places = [
+            {'id': '1', 'name': '연동 동물병원', 'address': '제주시 연동', 'phone': '064-111-1111', 'lat': 33.4890, 'lng': 126.4983},
+            {'id': '2', 'name': '노형 동물병원', 'address': '제주시 노형동', 'phone': '064-222-2222', 'lat': 33.4845, 'lng': 126.4810},
+            {'id': '3', 'name': '서귀포 동물병원', 'address': '서귀포시', 'phone': '064-333-3333', 'lat': 33.2541, 'lng': 126.5600},
+        ]
+
+    def test_nearby_users_share_tile(self):
+        near_first = search_nearby_clinics(33.4885, 126.4975)
+        near_second = search_nearby_clinics(33.4812, 126.4905)  # 같은 타일, 약 1km 떨어진 위치
+
+        self.assertEqual(len(self.backend.calls), 1)
+        self.assertEqual([c['id'] for c in near_first], ['1', '2'])
+        self.assertLess(near_first[0]['distance'], 100)
+        for clinics in (near_first, near_second):
+            distances = [c['distance'] for c in clinics]
+            self.assertEqual(distances, sorted(distances))
+        self.assertNotEqual(near_first[0]['distance'], next(c['distance'] for c in near_second if c['id'] == '1'))
+
+    def test_no_result(self):
+        clinics = search_nearby_clinics(37.5665, 126.9780)
+        self.assertEqual(clinics[0]['name'], '검색 결과 없음')
+
+    def test_notice_and_result_share_shape(self):
+        result = search_nearby_clinics(33.4885, 126.4975)[0]
+        no_result = search_nearby_clinics(37.5665, 126.9780)[0]
+        invalid = find_clinics({'lat': 'x', 'lng': 1})[0]
+        self.assertEqual(set(result), set(no_result))
+        self.assertEqual(set(result), set(invalid))
+
+    def test_truncated_tile_searches_around_user(self):
+        # 타일 중심 근처에 병원이 몰려 있어 타일 목록이 잘리면, 가장자리 사용자의 가까운 병원이 빠질 수 있음
+        self.backend.max_results = 2
+        self.backend.places = [
+            {'id': str(i), 'name': f'중심 {i}', 'address': '제주시', 'phone': '', 'lat': 33.4851 + i * 0.0001, 'lng': 126.4951}
+            for i in range(3)
+        ] + [
+            {'id': 'edge', 'name': '가장자리 동물병원', 'address': '제주시', 'phone': '', 'lat': 33.4809, 'lng': 126.4909},
+        ]
+        try:
+            clinics = search_nearby_clinics(33.4808, 126.4908)
+        finally:
+            self.backend.max_results = None
+
+        # 타일 → 작은 타일 → 사용자 위치(한 페이지) 순으로 다시 검색
+        self.assertEqual(len(self.backend.calls), 3)
+        self.assertEqual(self.backend.calls[2], (33.4808, 126.4908, 2000, 1))
+        self.assertEqual(clinics[0]['id'], 'edge')
+        distances = [c['distance'] for c in clinics]
+        self.assertEqual(distances, sorted(distances))
+
+    def test_dense_tile_is_shared(self):
+        # 약 200m 간격으로 150곳이 모인 지역: 타일 중심 검색은 45곳에서 잘림
+        self.backend.max_results = 45
+        self.backend.places = [
+            {'id': f'{i}-{j}', 'name': '동물병원', 'address': '제주시', 'phone': '', 'lat': 33.470 + i * 0.002, 'lng': 126.485 + j * 0.002}
+            for i in range(15) for j in range(10)
+        ]
+        users = [
+            (base_lat + (k % 5) * 0.0004, base_lng + (k // 5) * 0.0004)
+            for base_lat, base_lng in ((33.4802, 126.4902), (33.4877, 126.4977))
+            for k in range(10)
+        ]
+        try:
+            results = [search_nearby_clinics(lat, lng) for lat, lng in users]
+        finally:
+            self.backend.max_results = None
+
+        # 20명이 타일 1번 + 작은 타일 2번만 검색하고, 사용자 위치 재검색은 없음
+        self.assertEqual(len(self.backend.calls), 3)
+        self.assertTrue(all(call[3] is None for call in self.backend.calls))
+        for (lat, lng), clinics in zip(users, results):
+            expected = sorted(
+                int(haversine_m(lat, lng, p['lat'], p['lng'])) for p in self.backend.places
+            )[:15]
+            self.assertEqual([c['distance'] for c in clinics], expected)
+
+
+class OutboundHttpClientTests(TestCase):
+    """재시도 예산과 서킷 브레이커 동작 확인 (실제 네트워크 호출 없이 session.request를 대체)"""
+
+    def make_client(self, **kwargs):
+        options = dict(
+            pool_connections=1, pool_maxsize=1, max_retries=2, backoff_base=0,
+            retry_budget_ratio=0.2, retry_budget_max=10, breaker_threshold=2, breaker_cooldown=60,
+        )
+        options.update(kwargs)
+        return OutboundHttpClient(**options)
+
+    def response(self, status_code):
+        response = mock.Mock()
+        response.status_code = status_code
+        return response
+
+    def test_retries_then_succeeds(self):
+        client = self.make_client()
+        with mock.patch.object(client.session, 'request', side_effect=[self.response(503), self.response(200)]):
+            self.assertEqual(client.get('https://api.example.com/x').status_code, 200)
+        metrics = client.metrics()['api.example.com']
+        self.assertEqual((metrics['count'], metrics['retries'], metrics['circuit']), (2, 1, 'closed'))
+
+    def test_circuit_opens_after_failures(self):
+        client = self.make_client(max_retries=0)
+        with mock.patch.object(client.session, 'request', return_value=self.response(503)) as request:
+            client.get('https://api.example.com/x')
+            client.get('https://api.example.com/x')
+            with self.assertRaises(CircuitOpenError):
+                client.get('https://api.example.com/x')
+        self.assertEqual(request.call_count, 2)
+
+    def test_retry_budget_limits_retries(self):
+        client = self.make_client(retry_budget_max=1, breaker_threshold=100)
+        with mock.patch.object(client.session, 'request', return_value=self.response(503)) as request:
+            client.get('https://api.example.com/x')
+            client.get('https://api.example.com/x')
+        # 첫 요청만 예산으로 1번 재시도, 두 번째 요청은 예산 부족으로 재시도 없음
+        self.assertEqual(request.call_count, 3)
+
+    def test_other_request_errors_recorded(self):
+        client = self.make_client(max_retries=0, breaker_threshold=1)
+        error = requests.exceptions.ChunkedEncodingError('끊긴 응답')
+        with mock.patch.object(client.session, 'request', side_effect=error):
+            with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+                client.get('https://api.example.com/x')
+        metrics = client.metrics()['api.example.com']
+        self.assertEqual((metrics['count'], metrics['errors'], metrics['circuit']), (1, 1, 'open'))
+
+    def test_deadline_caps_timeout_and_skips_retry(self):
+        client = self.make_client(backoff_base=10)
+        with mock.patch.object(client.session, 'request', return_value=self.response(503)) as request:
+            client.get('https://api.example.com/x', timeout=3, deadline=time.monotonic() + 1)
+        # 재시도 대기(10초)가 deadline을 넘으므로 재시도하지 않고, timeout은 남은 시간으로 줄어듦
+        self.assertEqual(request.call_count, 1)
+        self.assertLessEqual(request.call_args.kwargs['timeout'], 1)
+
+
+@override_settings(GOOGLE_GEMINI_API_KEY='test-key')
+class AiClientRegistryTests(TestCase):
+    """Gemini 설정/모델 객체/모델 목록을 요청마다 다시 만들지 않는지 확인합니다."""
+
+    def setUp(self):
+        ai_clients.reset()
+        self.addCleanup(ai_clients.reset)
+
+    @mock.patch('pets.ai_client.genai')
+    def test_configure_and_model_reused(self, genai):
+        first = ai_clients.get_model()
+        second = ai_clients.get_model()
+        self.assertIs(first, second)
+        genai.configure.assert_called_once_with(api_key='test-key')
+        genai.GenerativeModel.assert_called_once_with(settings.AI_MODEL_NAME)
+
+    @mock.patch('pets.ai_client.genai')
+    def test_model_list_cached(self, genai):
+        genai.list_models.return_value = [
+            SimpleNamespace(name='models/a', supported_generation_methods=['generateContent']),
+            SimpleNamespace(name='models/b', supported_generation_methods=['embedContent']),
+        ]
+        self.assertEqual(ai_clients.list_generation_models(), ['models/a'])
+        self.assertEqual(ai_clients.list_generation_models(), ['models/a'])
+        genai.list_models.assert_called_once()
+
+    @mock.patch('pets.ai_client.genai')
+    def test_model_list_refresh_does_not_block_get_model(self, genai):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_list_models():
+            started.set()
+            release.wait(5)
+            return []
+
+        genai.list_models.side_effect = slow_list_models
+        refresh = threading.Thread(target=ai_clients.list_generation_models)
+        refresh.start()
+        try:
+            self.assertTrue(started.wait(5))
+            # 목록을 가져오는 동안에도 get_model()은 바로 반환되어야 함
+            getter = threading.Thread(target=ai_clients.get_model)
+            getter.start()
+            getter.join(1)
+            self.assertFalse(getter.is_alive())
+        finally:
+            release.set()
+            refresh.join()
+
+
+def query_plan(queryset):
+    """
+    queryset의 실행 계획(EXPLAIN) 문자열 (MySQL/SQLite는 사용한 인덱스 이름이 포함됨)
+    PostgreSQL은 테스트 데이터가 적으면 순차 스캔을 고르므로, 인덱스 사용 가능 여부만 보도록 끕니다.
+    """
+    if connection.vendor == 'postgresql':
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            return queryset.explain()
+    return queryset.explain()
+
+
+class PetLogIndexPlanTests(PetAPITestCase):
+    """반려동물별 기록 페이지의 주요 조회가 (pet, 날짜) 복합 인덱스를 쓰는지 확인합니다."""
+
+    @classmethod
+    def setUpTestData(cls):
+        owner = User.objects.create_user(username='seed', password='pw', email='seed@example.com', nickname='시드')
+        start = date(2024, 1, 1)
+        for pet in [create_pet(owner, name=f'시드{i}') for i in range(3)]:
+            days = [start + timedelta(days=d) for d in range(120)]
+            MealLog.objects.bulk_create(MealLog(pet=pet, log_date=d, food_type='사료', food_name='사료', quantity_g=100, calorie=350) for d in days)
+            WalkLog.objects.bulk_create(WalkLog(pet=pet, log_date=d, duration=30) for d in days)
+            HealthLog.objects.bulk_create(
+                HealthLog(pet=pet, log_date=d, log_type='기타', content='기록', weight=5.0 if i % 3 == 0 else None)
+                for i, d in enumerate(days)
+            )
+            CalendarSchedule.objects.bulk_create(CalendarSchedule(pet=pet, schedule_date=d, content='일정', category='기타') for d in days)
+            BcsCheckupResult.objects.bulk_create(BcsCheckupResult(pet=pet, answers=[1, 2, 1]) for _ in range(10))
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = query_plan(queryset)
+        self.assertIn(index_name, plan, msg=f"{index_name} 인덱스를 사용하지 않습니다:\n{plan}")
+
+    def test_walk_recent_logs(self):
+        # ActivityPageView: 최근 활동 기록 5개
+        self.assertUsesIndex(WalkLog.objects.filter(pet=self.pet).order_by('-log_date', '-created_at')[:5], 'walklog_pet_date_idx')
+
+    def test_health_weight_graph(self):
+        # HealthPageView / 대시보드: 체중 기록
+        self.assertUsesIndex(HealthLog.objects.filter(pet=self.pet, weight__isnull=False).order_by('log_date'), 'healthlog_pet_date_idx')
+
+    def test_health_recent_logs(self):
+        self.assertUsesIndex(HealthLog.objects.filter(pet=self.pet).order_by('-log_date')[:5], 'healthlog_pet_date_idx')
+
+    def test_upcoming_schedules(self):
+        queryset = CalendarSchedule.objects.filter(pet=self.pet, schedule_date__gte=self.today).order_by('schedule_date')[:2]
+        self.assertUsesIndex(queryset, 'schedule_pet_date_idx')
+
+    def test_latest_bcs(self):
+        self.assertUsesIndex(BcsCheckupResult.objects.filter(pet=self.pet).order_by('-checkup_date')[:1], 'bcs_pet_date_idx')
+
+    def test_meal_date_range(self):
+        queryset = MealLog.objects.filter(pet=self.pet, log_date__range=(self.today - timedelta(days=6), self.today)).order_by('log_date', 'created_at')
+        self.assertUsesIndex(queryset, 'meallog_pet_date_idx')
+
+
+class BulkLogCreateTests(PetAPITestCase):
+    """기록 일괄 저장 API는 모두 저장하거나, 잘못된 항목을 알려주고 아무것도 저장하지 않아야 합니다."""
+
+    def post(self, name, items):
+        return self.client.post(reverse(name, args=[self.pet.id]), items, format='json')
+
+    def test_walk_logs_saved_in_one_insert_with_rollups(self):
+        items = [
+            {'log_type': '산책', 'duration': 30, 'distance': 1.0, 'log_date': str(self.today)},
+            {'log_type': '놀이', 'duration': 15, 'log_date': str(self.today)},
+            {'log_type': '산책', 'duration': 20, 'log_date': str(self.today - timedelta(days=1))},
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post('walklog-bulk-create', {'items': items})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['created'], 3)
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT') and 'pets_walklog' in q['sql']]
+        self.assertEqual(len(inserts), 1)
+
+        rollup = DailyActivityRollup.objects.get(pet=self.pet, date=self.today)
+        self.assertEqual((rollup.total_duration, rollup.count), (45, 2))
+
+    def test_ids_filled_when_bulk_insert_returns_none(self):
+        # MySQL처럼 bulk_create가 id를 돌려주지 않아도 응답의 id는 실제 저장된 행이어야 합니다.
+        items = [
+            {'log_type': '산책', 'duration': 30, 'log_date': str(self.today)},
+            {'log_type': '산책', 'duration': 30, 'log_date': str(self.today)},
+            {'log_type': '놀이', 'duration': 10, 'log_date': str(self.today)},
+        ]
+        features = type(connection.features)
+        with mock.patch.object(features, 'can_return_rows_from_bulk_insert', new_callable=mock.PropertyMock, return_value=False):
+            response = self.post('walklog-bulk-create', items)
+        self.assertEqual(response.status_code, 201)
+        returned = [(item['id'], item['log_type'], item['duration']) for item in response.json()['items']]
+        saved = list(WalkLog.objects.filter(pet=self.pet).order_by('id').values_list('id', 'log_type', 'duration'))
+        self.assertEqual(returned, saved)
+
+    def test_invalid_item_rejects_whole_batch(self):
+        items = [
+            {'log_date': str(self.today), 'log_type': '기타', 'content': '정상'},
+            {'log_date': 'not-a-date', 'log_type': '기타', 'content': '오류'},
+        ]
+        response = self.post('healthlog-bulk-create', items)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([e['index'] for e in response.json()['errors']], [1])
+        self.assertFalse(HealthLog.objects.exists())
+
+    def test_care_log_duplicates_reported(self):
+        CareLog.objects.create(pet=self.pet, log_date=self.today, content='양치질')
+        response = self.post('carelog-bulk-create', [{'content': '빗질'}, {'content': '양치질'}, {'content': '빗질'}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([e['index'] for e in response.json()['errors']], [1, 2])
+
+        response = self.post('carelog-bulk-create', [{'content': '빗질'}, {'content': '목욕'}])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(CareLog.objects.filter(pet=self.pet, log_date=self.today).count(), 3)
+
+    def test_concurrent_duplicate_is_reported(self):
+        # 중복 확인(check_items)과 저장 사이에 다른 요청이 같은 항목을 저장한 경우
+        CareLog.objects.create(pet=self.pet, log_date=self.today, content='빗질')
+        with mock.patch.object(CareLogBulkWriter, 'check_items', return_value=[]):
+            response = self.post('carelog-bulk-create', [{'content': '빗질'}, {'content': '목욕'}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(CareLog.objects.filter(pet=self.pet).count(), 1)
+
+    @override_settings(PET_LOG_BULK_MAX_ITEMS=2)
+    def test_item_limit(self):
+        response = self.post('carelog-bulk-create', [{'content': str(i)} for i in range(3)])
+        self.assertEqual(response.status_code, 400)
+
+    def test_other_users_pet(self):
+        other = User.objects.create_user(username='other', password='pw', email='other@example.com', nickname='남')
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self.post('carelog-bulk-create', [{'content': 'x'}]).status_code, 404)
+
+
+class MealLogTests(PetAPITestCase):
+    """식사 기록 API와 일일 식사 집계(DailyNutritionRollup)의 증분 갱신을 확인합니다."""
+
+    def meal(self, **kwargs):
+        data = {'log_date': str(self.today), 'food_type': '사료', 'food_name': '연어 사료', 'quantity_g': 100, 'calorie': 350}
+        data.update(kwargs)
+        return data
+
+    def rollups(self):
+        return {
+            (r.date, r.food_type): (r.total_calorie, r.count)
+            for r in DailyNutritionRollup.objects.filter(pet=self.pet, count__gt=0)
+        }
+
+    def test_crud_keeps_rollups_in_sync(self):
+        yesterday = self.today - timedelta(days=1)
+        response = self.client.post(reverse('meallog-create', args=[self.pet.id]), self.meal(), format='json')
+        self.assertEqual(response.status_code, 201)
+        log_id = response.json()['id']
+        self.client.post(reverse('meallog-create', args=[self.pet.id]), self.meal(food_type='간식', calorie=50), format='json')
+        self.assertEqual(self.rollups(), {(self.today, '사료'): (350, 1), (self.today, '간식'): (50, 1)})
+
+        self.client.patch(reverse('meallog-detail', args=[log_id]), {'log_date': str(yesterday)}, format='json')
+        self.assertEqual(self.rollups(), {(yesterday, '사료'): (350, 1), (self.today, '간식'): (50, 1)})
+
+        self.client.delete(reverse('meallog-detail', args=[log_id]))
+        self.assertEqual(self.rollups(), {(self.today, '간식'): (50, 1)})
+
+    def test_bulk_and_rebuild_match(self):
+        items = [self.meal(calorie=100 + i, log_date=str(self.today - timedelta(days=i % 2))) for i in range(4)]
+        self.assertEqual(self.client.post(reverse('meallog-bulk-create', args=[self.pet.id]), items, format='json').status_code, 201)
+        incremental = self.rollups()
+        rebuild_nutrition_rollups()
+        self.assertEqual(self.rollups(), incremental)
+        self.assertEqual(incremental[(self.today, '사료')], (100 + 102, 2))
+
+    def test_meal_page(self):
+        MealLog.objects.create(pet=self.pet, log_date=self.today, food_type='사료', food_name='a', quantity_g=80, calorie=300)
+        MealLog.objects.create(pet=self.pet, log_date=self.today, food_type='간식', food_name='b', quantity_g=10, calorie=40)
+        MealLog.objects.create(pet=self.pet, log_date=self.today - timedelta(days=10), food_type='사료', food_name='c', quantity_g=80, calorie=300)
+
+        with self.assertNumQueries(3):
+            data = self.client.get(reverse('meal-page', args=[self.pet.id])).json()
+        self.assertEqual((data['today_summary']['calorie'], data['today_summary']['quantity_g']), (340, 90))
+        self.assertEqual([row['food_type'] for row in data['today_summary']['by_food_type']], ['간식', '사료'])
+        self.assertEqual(len(data['weekly_trend']), 7)
+        self.assertEqual(len(data['monthly_trend']), 30)
+        self.assertEqual(sum(day['calorie'] for day in data['monthly_trend']), 640)
+        self.assertEqual(len(data['recent_logs']), 3)
+
+
+class CalendarMonthTests(PetAPITestCase):
+    """월별 일정은 날짜 범위 조건으로, 월 그리드는 GROUP BY 쿼리 한 번으로 조회해야 합니다."""
+
+    def schedule(self, day, category='기타'):
+        return CalendarSchedule.objects.create(pet=self.pet, schedule_date=day, content='일정', category=category)
+
+    def test_month_list_uses_date_range(self):
+        for day in [date(2024, 1, 31), date(2024, 2, 1), date(2024, 2, 29), date(2024, 3, 1)]:
+            self.schedule(day)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('calendar-list', args=[self.pet.id]), {'year': 2024, 'month': 2})
+        self.assertEqual([row['schedule_date'] for row in response.json()], ['2024-02-01', '2024-02-29'])
+        schedule_sql = ctx.captured_queries[-1]['sql']
+        self.assertNotIn('strftime', schedule_sql.lower())
+        self.assertNotIn('extract', schedule_sql.lower())
+
+        queryset = CalendarSchedule.objects.filter(pet=self.pet, schedule_date__gte=date(2024, 2, 1), schedule_date__lt=date(2024, 3, 1))
+        self.assertIn('schedule_pet_date_idx', query_plan(queryset))
+
+    def test_month_list_rejects_bad_params(self):
+        url = reverse('calendar-list', args=[self.pet.id])
+        self.assertEqual(self.client.get(url, {'year': 2024}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'year': 2024, 'month': 13}).status_code, 400)
+
+    def test_grid_spans_months_in_one_query(self):
+        self.schedule(date(2024, 11, 30), '병원/약')
+        self.schedule(date(2024, 12, 25), '병원/약')
+        self.schedule(date(2024, 12, 25), '기타')
+        self.schedule(date(2024, 12, 25), '기타')
+        self.schedule(date(2025, 1, 2))
+        self.schedule(date(2025, 2, 1))
+
+        url = reverse('calendar-grid', args=[self.pet.id])
+        with self.assertNumQueries(2):
+            months = self.client.get(url, {'year': 2024, 'month': 12, 'months': 2}).json()['months']
+        self.assertEqual([(m['year'], m['month']) for m in months], [(2024, 12), (2025, 1)])
+        self.assertEqual(months[0]['days'], [{'date': '2024-12-25', 'count': 3, 'categories': ['기타', '병원/약']}])
+        self.assertEqual(months[1]['days'], [{'date': '2025-01-02', 'count': 1, 'categories': ['기타']}])
+
+        self.assertEqual(len(self.client.get(url, {'year': 2024, 'month': 12}).json()['months']), settings.CALENDAR_GRID_DEFAULT_MONTHS)
+        self.assertEqual(self.client.get(url, {'year': 2024, 'month': 12, 'months': 0}).status_code, 400)
+
+
+class PetDataVersionTests(PetAPITestCase):
+    """기록이 바뀌면 데이터 버전이 오르고, 바뀐 것이 없으면 조회 API가 기록 조회 없이 304로 응답해야 합니다."""
+
+    def version(self):
+        return PetDataVersion.objects.get(pet=self.pet).version
+
+    def test_signals_and_bulk_bump_version(self):
+        start = self.version()
+        log = HealthLog.objects.create(pet=self.pet, log_date=self.today, log_type='기타', content='x', weight=5.0)
+        log.delete()
+        self.client.post(reverse('walklog-bulk-create', args=[self.pet.id]), [{'log_date': str(self.today), 'duration': 10}], format='json')
+        self.assertEqual(self.version(), start + 3)
+
+    def test_deleting_pet_with_logs(self):
+        CareLog.objects.create(pet=self.pet, log_date=self.today, content='양치')
+        self.pet.delete()
+        connection.check_constraints()
+        self.assertFalse(PetDataVersion.objects.exists())
+
+    def test_conditional_get(self):
+        urls = [
+            (reverse('dashboard', args=[self.pet.id]), {}),
+            (reverse('activity-page', args=[self.pet.id]), {}),
+            (reverse('health-page', args=[self.pet.id]), {}),
+            (reverse('calendar-list', args=[self.pet.id]), {'year': self.today.year, 'month': self.today.month}),
+        ]
+        for url, params in urls:
+            with self.subTest(url=url):
+                etag = self.client.get(url, params)['ETag']
+                with self.assertNumQueries(1):
+                    response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response['ETag'], etag)
+
+                CalendarSchedule.objects.create(pet=self.pet, schedule_date=self.today, content='병원', category='병원/약')
+                response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response['ETag'], etag)
+
+
+class PetPageCacheTests(PetAPITestCase):
+    """같은 데이터 버전의 페이지는 캐시에서 응답하고, 기록이 바뀌면 캐시 항목이 지워져야 합니다."""
+
+    def setUp(self):
+        super().setUp()
+        reset_page_cache()
+        self.addCleanup(reset_page_cache)
+
+    def test_hit_then_invalidate(self):
+        url = reverse('health-page', args=[self.pet.id])
+        HealthLog.objects.create(pet=self.pet, log_date=self.today, log_type='기타', content='체중', weight=5.0)
+        first = self.client.get(url).json()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url).json(), first)
+
+        backend = caches[settings.PET_PAGE_CACHE_ALIAS]
+        index_key = get_page_cache().index_key(self.pet.id)
+        self.assertEqual(len(backend.get(index_key)), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            HealthLog.objects.create(pet=self.pet, log_date=self.today, log_type='기타', content='체중', weight=5.5)
+        self.assertIsNone(backend.get(index_key))
+        self.assertEqual(len(self.client.get(url).json()['weight_graph']), 2)
+
+        stats = get_page_cache().stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions']), (1, 2, 1))
+
+    def test_keys_include_view_and_params(self):
+        self.client.get(reverse('calendar-list', args=[self.pet.id]), {'year': 2024, 'month': 1})
+        self.client.get(reverse('calendar-list', args=[self.pet.id]), {'year': 2024, 'month': 2})
+        self.client.get(reverse('activity-page', args=[self.pet.id]))
+        with self.assertNumQueries(1):
+            self.client.get(reverse('activity-page', args=[self.pet.id]))
+        self.assertEqual(get_page_cache().stats()['hits'], 1)
+        self.assertEqual(get_page_cache().stats()['stores'], 3)
+
+    def test_stats_endpoint_is_admin_only(self):
+        url = reverse('cache-stats')
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.user.is_staff = True
+        self.user.save()
+        data = self.client.get(url).json()
+        self.assertEqual(set(data), {'pet_pages', 'ai_analysis', 'outbound_http'})
+        self.assertIn('evictions', data['pet_pages'])
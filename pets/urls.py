@@ -5,15 +5,24 @@ from .views import (
     DashboardView, 
     CareLogViewSet,
     WalkLogViewSet,
+    WalkLogBulkCreateView,
+    HealthLogBulkCreateView,
+    CareLogBulkCreateView,
+    MealLogViewSet,
+    MealLogBulkCreateView,
+    MealPageView,
     ActivityPageView,
     # ❗️ [수정] 캘린더 View 2개 import 추가
     CalendarScheduleListView,
+    CalendarMonthGridView,
     CalendarScheduleViewSet,
     HealthLogViewSet,
     HealthPageView,
     AiCheckupView,
+    AiCheckupJobView,
     BcsCheckupView,
-    ListMyModelsView
+    ListMyModelsView,
+    CacheStatsView
 )
 
 # 1. 라우터 생성
@@ -39,6 +48,10 @@ urlpatterns = [
     # 3.3 케어리스트 생성 (API 4.2)
     # POST /care-list/<pet_id>/
     path('care-list/<int:pet_id>/', CareLogViewSet.as_view({'post': 'create'}), name='carelog-create'),
+
+    # 케어리스트 일괄 생성
+    # POST /care-list/<pet_id>/bulk/
+    path('care-list/<int:pet_id>/bulk/', CareLogBulkCreateView.as_view(), name='carelog-bulk-create'),
     
     # 3.4 활동 페이지 조회 (API 5.1)
     # GET /activities/<pet_id>/
@@ -50,6 +63,10 @@ urlpatterns = [
     # POST /activities/logs/<pet_id>/
     path('activities/logs/<int:pet_id>/', WalkLogViewSet.as_view({'post': 'create'}), name='walklog-create'), 
 
+    # 활동 기록 일괄 생성
+    # POST /activities/logs/<pet_id>/bulk/
+    path('activities/logs/<int:pet_id>/bulk/', WalkLogBulkCreateView.as_view(), name='walklog-bulk-create'),
+
     # 3.6 활동 기록 수정/삭제/상세조회 (API 5.3)
     # GET, PUT, DELETE /activities/logs/items/<log_id>/
     # (pk는 WalkLog의 id를 의미합니다)
@@ -60,11 +77,38 @@ urlpatterns = [
         'delete': 'destroy'
     }), name='walklog-detail'),
 
+    # --- 식사 기록(MealLog) URL ---
+
+    # 식사 페이지 조회 (API 5.4)
+    # GET /meals/<pet_id>/
+    path('meals/<int:pet_id>/', MealPageView.as_view(), name='meal-page'),
+
+    # 식사 기록 생성 (API 5.5)
+    # POST /meals/logs/<pet_id>/
+    path('meals/logs/<int:pet_id>/', MealLogViewSet.as_view({'post': 'create'}), name='meallog-create'),
+
+    # 식사 기록 일괄 생성
+    # POST /meals/logs/<pet_id>/bulk/
+    path('meals/logs/<int:pet_id>/bulk/', MealLogBulkCreateView.as_view(), name='meallog-bulk-create'),
+
+    # 식사 기록 수정/삭제/상세조회 (API 5.5)
+    # GET, PUT, DELETE /meals/logs/items/<log_id>/
+    path('meals/logs/items/<int:pk>/', MealLogViewSet.as_view({
+        'get': 'retrieve',
+        'put': 'update',
+        'patch': 'partial_update',
+        'delete': 'destroy'
+    }), name='meallog-detail'),
+
     # --- [수정] 캘린더 API URL 추가 ---
 
     # 3.7 월별 일정 조회 (API 6.1)
     # GET /calendar/<pet_id>/?year=YYYY&month=MM
     path('calendar/<int:pet_id>/', CalendarScheduleListView.as_view(), name='calendar-list'),
+
+    # 월 그리드 요약 (API 6.4)
+    # GET /calendar/<pet_id>/grid/?year=YYYY&month=MM&months=3
+    path('calendar/<int:pet_id>/grid/', CalendarMonthGridView.as_view(), name='calendar-grid'),
     
     # 3.8 일정 생성 (API 6.2)
     # POST /calendar/schedules/<pet_id>/
@@ -87,6 +131,9 @@ urlpatterns = [
     
     # 7.2 건강 기록 생성 (HealthLogViewSet의 create 액션)
     path('health/logs/<int:pet_id>/', HealthLogViewSet.as_view({'post': 'create'}), name='healthlog-create'),
+
+    # 7.2 건강 기록 일괄 생성
+    path('health/logs/<int:pet_id>/bulk/', HealthLogBulkCreateView.as_view(), name='healthlog-bulk-create'),
     
     # 7.2 건강 기록 수정/삭제/상세조회 (HealthLogViewSet의 나머지 액션)
     path('health/logs/items/<int:pk>/', HealthLogViewSet.as_view({
@@ -98,6 +145,10 @@ urlpatterns = [
     
     # 7.3 AI 건강 분석
     path('health/ai-checkup/<int:pet_id>/', AiCheckupView.as_view(), name='ai-checkup'),
+
+    # 7.3 AI 건강 분석 작업 상태/결과 조회 (비동기 모드)
+    # GET /api/v1/pets/health/ai-checkup/jobs/<job_id>/
+    path('health/ai-checkup/jobs/<int:job_id>/', AiCheckupJobView.as_view(), name='ai-checkup-job'),
     
     # 7.4 BCS 자가 진단
     path('health/bcs-checkup/<int:pet_id>/', BcsCheckupView.as_view(), name='bcs-checkup'),
@@ -105,4 +156,8 @@ urlpatterns = [
     # ⬇️ 2. [추가] 이 URL을 맨 아래에 추가 ⬇️
     # GET /api/v1/pets/health/list-my-models/
     path('health/list-my-models/', ListMyModelsView.as_view(), name='list-my-models'),
+
+    # 캐시 통계 (관리자 전용, pets/page_cache.py / pets/ai_cache.py)
+    # GET /api/v1/pets/cache/stats/
+    path('cache/stats/', CacheStatsView.as_view(), name='cache-stats'),
 ]
\ No newline at end of file
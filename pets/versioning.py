@@ -0,0 +1,78 @@
+# pets/versioning.py
+"""
+반려동물별 데이터 버전과 조건부 GET (ETag / If-None-Match)
+
+앱이 다시 열릴 때마다 대시보드/활동/건강/캘린더를 새로 요청하지만, 대부분은 바뀐 것이 없습니다.
+- Pet 또는 그 기록(케어/일정/건강/산책/식사/BCS)이 저장·삭제되면 PetDataVersion.version을
+  1 올립니다. (pets/signals.py, 일괄 저장은 pets/bulk.py)
+- 조회 API는 (반려동물, 버전, 화면, 날짜, 파라미터)로 ETag를 만들고, 요청의 If-None-Match와
+  같으면 기록을 조회하지 않고 304로 응답합니다. (소유자 확인 + 버전 조회 쿼리 1회)
+- 날짜가 바뀌면 '오늘' 기준 데이터가 달라지므로 ETag에 오늘 날짜를 포함합니다.
+- 버전이 오르면 커밋 후 그 반려동물의 페이지 응답 캐시(pets/page_cache.py)도 지웁니다.
+"""
+import hashlib
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import Pet, PetDataVersion
+from .page_cache import get_page_cache
+
+
+def bump_pet_version(pet_id):
+    """pet_id의 데이터 버전을 원자적으로(F 표현식) 1 올립니다. 행이 없으면 새로 만듭니다."""
+    versions = PetDataVersion.objects.filter(pet_id=pet_id)
+    if not versions.update(version=F('version') + 1):
+        if not Pet.objects.filter(id=pet_id).exists():
+            return
+        try:
+            with transaction.atomic():
+                PetDataVersion.objects.create(pet_id=pet_id, version=1)
+        except IntegrityError:
+            # 동시에 다른 요청이 먼저 행을 만든 경우
+            versions.update(version=F('version') + 1)
+    transaction.on_commit(lambda: get_page_cache().invalidate(pet_id))
+
+
+def owned_pet_with_version(user, pet_id):
+    """소유자 확인과 데이터 버전 조회를 한 번의 쿼리로 합니다. 없거나 권한이 없으면 None"""
+    return Pet.objects.filter(id=pet_id, owner=user).select_related('data_version').first()
+
+
+def pet_version(pet):
+    """owned_pet_with_version()으로 가져온 pet의 데이터 버전 (행이 아직 없으면 0)"""
+    try:
+        return pet.data_version.version
+    except PetDataVersion.DoesNotExist:
+        return 0
+
+
+def pet_etag(pet, view_name, *parts):
+    """(반려동물, 데이터 버전, 화면 이름, parts)로 만든 강한 ETag (따옴표 포함)"""
+    source = ':'.join(str(part) for part in (pet.id, pet_version(pet), view_name, *parts))
+    return quote_etag(hashlib.md5(source.encode()).hexdigest())
+
+
+def etag_matches(request, etag):
+    """요청의 If-None-Match가 etag와 일치하는지 (W/ 약한 비교, '*' 포함)"""
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    candidates = parse_etags(header)
+    if candidates == ['*']:
+        return True
+    return any(candidate.removeprefix('W/') == etag for candidate in candidates)
+
+
+def not_modified(etag):
+    return with_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+
+
+def with_etag(response, etag):
+    """응답에 ETag를 달고, 클라이언트가 매번 재검증(If-None-Match)하도록 합니다."""
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
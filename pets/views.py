@@ -3,79 +3,29 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 # ❗️ [수정] HealthLog, BcsCheckupResult 등 모든 모델 import
-from .models import Pet, CareLog, CalendarSchedule, HealthLog, WalkLog, BcsCheckupResult
+from .models import Pet, CareLog, CalendarSchedule, HealthLog, WalkLog, MealLog, BcsCheckupResult, DailyActivityRollup, DailyNutritionRollup, AiCheckupJob
 # ❗️ [수정] HealthLogSerializer, BcsCheckupResultSerializer 등 모든 시리얼라이저 import
 from .serializers import (
     PetSerializer, CareLogSerializer, CalendarScheduleSerializer, 
-    WalkLogSerializer, HealthLogSerializer, BcsCheckupResultSerializer
+    WalkLogSerializer, HealthLogSerializer, BcsCheckupResultSerializer,
+    AiCheckupJobSerializer, MealLogSerializer
 )
 from django.utils import timezone
 from django.db.models import Sum, Avg
 from datetime import date # d_day 계산을 위해 import
 from rest_framework.exceptions import ValidationError # 예외 처리를 위해 import
 from django.conf import settings # 1. settings.py의 API 키를 가져오기 위해
-import google.generativeai as genai # 2. Google AI 라이브러리
-import json # 3. AI 응답(JSON)을 파싱하기 위해
-import requests
-
-# --- ⬇️ Kakao API 헬퍼 함수 (AiCheckupView 클래스 *위에* 추가) ⬇️ ---
-def search_nearby_clinics(api_key, lat, lng):
-    """
-    Kakao 키워드 검색 API를 사용해 주변 동물병원을 검색합니다.
-    (수정: 프론트엔드 디자인에 맞게 'subtitle' 필드 추가)
-    """
-    if not api_key:
-        # (오류 반환 형식도 디자인에 맞게 수정)
-        return [{"id": 0, "name": "API 키 미설정", "subtitle": "Kakao API 키가 서버에 설정되지 않았습니다.", "phone": ""}]
-
-    url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-    headers = {"Authorization": f"KakaoAK {api_key}"}
-    params = {
-        "query": "동물병원",
-        "y": str(lat),
-        "x": str(lng),
-        "radius": 2000,
-        "sort": "distance",
-    }
-    
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=3)
-        response.raise_for_status() 
-        data = response.json()
-
-        clinics = []
-        # API 명세서에 맞게 데이터 가공
-        for doc in data.get("documents", []):
-            
-            # --- ⬇️ [수정] 이 부분이 변경되었습니다 ⬇️ ---
-            
-            # 1. 주소와 전화번호를 가져옵니다.
-            address = doc.get("road_address_name") or doc.get("address_name") or "주소 정보 없음"
-            phone = doc.get("phone") or "전화번호 정보 없음"
-            
-            # 2. 디자인이 요구하는 "부제목" 문자열을 생성합니다.
-            #    (예: "제주시 연동 123-45 | 064-123-4567")
-            subtitle_string = f"{address} | {phone}"
-
-            # 3. 'subtitle' 필드에 담아 반환합니다.
-            clinics.append({
-                "id": doc.get("id"),
-                "name": doc.get("place_name"),
-                "subtitle": subtitle_string,  # ⬅️ "부제목" 필드
-                "phone": phone,               # ⬅️ "전화" 버튼 클릭 시 사용할 원본 전화번호
-                "distance": int(doc.get("distance")) 
-            })
-            # --- ⬆️ [수정] 여기까지 ⬆️ ---
-        
-        if not clinics:
-            return [{"id": 0, "name": "검색 결과 없음", "subtitle": "2km 이내에 '동물병원' 검색 결과가 없습니다.", "phone": ""}]
-        
-        return clinics
-
-    except requests.exceptions.RequestException as e:
-        return [{"id": 0, "name": "API 호출 오류", "subtitle": f"Kakao API 호출 중 오류 발생: {e}", "phone": ""}]
-    except Exception as e:
-        return [{"id": 0, "name": "오류", "subtitle": f"처리 중 알 수 없는 오류 발생: {e}", "phone": ""}]
+from django.urls import reverse
+from .dashboard import build_dashboard
+from .versioning import owned_pet_with_version, pet_version, pet_etag, etag_matches, not_modified, with_etag
+from .page_cache import get_page_cache
+from .ai_cache import get_analysis_cache
+from .http_client import get_http_client
+from .calendar import CalendarParamError, parse_year_month, parse_month_count, month_schedules, build_month_grid
+from .ai_checkup import run_checkup, AiCheckupError
+from .ai_jobs import enqueue_checkup
+from .ai_client import ai_clients
+from .bulk import BulkLogError, WalkLogBulkWriter, HealthLogBulkWriter, CareLogBulkWriter, MealLogBulkWriter
 
 # --- 권한 설정 ---
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -179,60 +129,20 @@ class DashboardView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, pet_id):
-        # 1. 요청 보낸 사용자가 pet_id의 주인인지 확인
-        try:
-            pet = Pet.objects.get(id=pet_id, owner=request.user)
-        except Pet.DoesNotExist:
-            return Response({"error": "반려동물 정보를 찾을 수 없거나 권한이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
-
         today = timezone.now().date()
 
-        # 2. 오늘의 케어 리스트 (API 4.1 - care_list)
-        care_items = CareLog.objects.filter(pet=pet, log_date=today)
-        care_serializer = CareLogSerializer(care_items, many=True)
-        total_care_count = care_items.count()
-        completed_care_count = care_items.filter(is_complete=True).count()
-        care_list_data = {
-            "items": care_serializer.data,
-            "completion_rate": (completed_care_count / total_care_count) if total_care_count > 0 else 0
-        }
+        # 1. 요청 보낸 사용자가 pet_id의 주인인지 확인 (데이터 버전 포함)
+        pet = owned_pet_with_version(request.user, pet_id)
+        if pet is None:
+            return Response({"error": "반려동물 정보를 찾을 수 없거나 권한이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        # 3. 다가오는 일정 (API 4.1 - upcoming_schedules)
-        upcoming_schedules = CalendarSchedule.objects.filter(
-            pet=pet, 
-            schedule_date__gte=today # 오늘 날짜(today)와 같거나 큰(gte) 일정
-        ).order_by('schedule_date')[:2] # 가까운 순서대로 2개만
-        schedule_serializer = CalendarScheduleSerializer(upcoming_schedules, many=True)
-
-        # 4. 건강 추세 (API 4.1 - health_trend)
-        # HealthLog에서 가장 최근 체중을 가져옵니다.
-        last_health_log = HealthLog.objects.filter(pet=pet, weight__isnull=False).order_by('-log_date').first()
-        last_weight = last_health_log.weight if last_health_log else pet.weight # 최근 기록이 없으면 Pet의 기본 체중
-        
-        # ❗️ [개선] HealthLog에서 최근 12개월간의 월별 평균 체중을 계산합니다.
-        # 이 로직은 실제로는 더 복잡하지만, 여기서는 간단한 예시로 최근 2개 기록을 보여줍니다.
-        recent_weights = HealthLog.objects.filter(pet=pet, weight__isnull=False).order_by('-log_date')[:2]
-        
-        weight_graph_data = [
-            {"month": log.log_date.strftime("%m월"), "weight": log.weight} for log in reversed(recent_weights)
-        ]
-        if not weight_graph_data: # 건강 기록이 없을 경우
-             weight_graph_data = [
-                { "month": today.strftime("%m월"), "weight": pet.weight }
-             ]
-
-        # 최근 체중 변화 계산 로직 (예시)
-        recent_change_str = "변동 없음"
-        if len(recent_weights) >= 2:
-            change = recent_weights[0].weight - recent_weights[1].weight
-            recent_change_str = f"{'+' if change > 0 else ''}{change:.1f}kg"
-        elif last_health_log:
-             recent_change_str = f"{last_health_log.weight}kg (최근)"
-        
-        health_trend_data = {
-            "recent_change": recent_change_str, 
-            "graph_data": weight_graph_data
-        }
+        # 바뀐 것이 없으면 기록을 조회하지 않고 304 (pets/versioning.py)
+        etag = pet_etag(pet, 'dashboard', today)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        # 2~4. 케어 리스트, 다가오는 일정, 건강 추세 (pets/dashboard.py에서 한 번에 조립)
+        dashboard_data = build_dashboard(pet, today)
 
 # 5. 음식 가이드 (API 4.1 - food_guide)
         # ❗️ [수정] 랜덤으로 팁을 제공하도록 로직 변경
@@ -274,13 +184,11 @@ class DashboardView(APIView):
         # --- 6. 모든 데이터를 API 명세서 형식에 맞춰 조합 ---
         # ❗️ [수정 완료] 이 블록을 왼쪽으로 당겨서 들여쓰기를 맞췄습니다.
         response_data = {
-            "care_list": care_list_data,
-            "upcoming_schedules": schedule_serializer.data,
-            "health_trend": health_trend_data,
+            **dashboard_data,
             "food_guide": food_guide_data
         }
 
-        return Response(response_data, status=status.HTTP_200_OK)
+        return with_etag(Response(response_data, status=status.HTTP_200_OK), etag)
 
 # --- Activity API (API 5.x) ---
 
@@ -317,6 +225,54 @@ class WalkLogViewSet(viewsets.ModelViewSet):
             raise ValidationError("URL에서 pet_id를 찾을 수 없습니다.")
 
 
+class PetLogBulkCreateView(APIView):
+    """
+    기록 일괄 저장 공통 View (오프라인 중 쌓인 기록을 한 번에 전송)
+    - Request Body: [{...}, {...}] 또는 {"items": [{...}, ...]} (항목 형식은 단건 생성 API와 동일)
+    - 201: {"created": 2, "items": [...]}
+    - 400: {"error": "...", "errors": [{"index": 1, "errors": {...}}]} (하나라도 잘못되면 모두 저장하지 않음)
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    writer_class = None
+
+    def post(self, request, pet_id):
+        try:
+            pet = Pet.objects.get(id=pet_id, owner=request.user)
+        except Pet.DoesNotExist:
+            return Response({"error": "반려동물 정보를 찾을 수 없거나 권한이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        items = request.data.get('items') if isinstance(request.data, dict) else request.data
+        try:
+            objects = self.writer_class(pet).save(items)
+        except BulkLogError as e:
+            return Response({"error": e.message, "errors": e.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "created": len(objects),
+            "items": self.writer_class.serializer_class(objects, many=True).data,
+        }, status=status.HTTP_201_CREATED)
+
+
+class WalkLogBulkCreateView(PetLogBulkCreateView):
+    """API 명세서 5.2: 활동 기록 일괄 생성 - POST /pets/activities/logs/{pet_id}/bulk/"""
+    writer_class = WalkLogBulkWriter
+
+
+class HealthLogBulkCreateView(PetLogBulkCreateView):
+    """API 명세서 7.2: 건강 기록 일괄 생성 - POST /pets/health/logs/{pet_id}/bulk/"""
+    writer_class = HealthLogBulkWriter
+
+
+class MealLogBulkCreateView(PetLogBulkCreateView):
+    """API 명세서 5.5: 식사 기록 일괄 생성 - POST /pets/meals/logs/{pet_id}/bulk/"""
+    writer_class = MealLogBulkWriter
+
+
+class CareLogBulkCreateView(PetLogBulkCreateView):
+    """API 명세서 4.2: 케어리스트 항목 일괄 생성 (오늘 날짜) - POST /pets/care-list/{pet_id}/bulk/"""
+    writer_class = CareLogBulkWriter
+
+
 class ActivityPageView(APIView):
     """
     API 명세서 5.1: 활동 페이지 정보 조회 View
@@ -325,34 +281,48 @@ class ActivityPageView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, pet_id):
-        try:
-            pet = Pet.objects.get(id=pet_id, owner=request.user)
-        except Pet.DoesNotExist:
+        pet = owned_pet_with_version(request.user, pet_id)
+        if pet is None:
             return Response({"error": "반려동물 정보를 찾을 수 없거나 권한이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
         today = timezone.now().date()
 
-        # 1. 오늘의 활동 요약 (today_summary)
-        today_logs = WalkLog.objects.filter(pet=pet, log_date=today)
-        today_summary_agg = today_logs.aggregate(
-            total_duration=Sum('duration'),
-            total_distance=Sum('distance')
+        # 바뀐 것이 없으면 기록을 조회하지 않고 304 (pets/versioning.py)
+        etag = pet_etag(pet, 'activity', today)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        # 같은 데이터 버전의 응답이 캐시에 있으면 그대로 반환 (pets/page_cache.py)
+        response_data = get_page_cache().get_or_build(
+            pet.id, pet_version(pet), 'activity', (today,), lambda: self.build_page(pet, today)
         )
+        return with_etag(Response(response_data, status=status.HTTP_200_OK), etag)
+
+    def build_page(self, pet, today):
+        """활동 페이지 응답 데이터 (캐시에 없을 때만 실행)"""
+        # 1~2. 오늘의 활동 요약 + 주간 활동 분석
+        # ❗️ [개선] 날짜별 SUM 쿼리 8번 대신, 일일 집계(DailyActivityRollup)를 한 번의 범위 조회로 읽습니다.
+        week_start = today - timezone.timedelta(days=6)
+        rollups = {
+            rollup.date: rollup
+            for rollup in DailyActivityRollup.objects.filter(pet=pet, date__range=(week_start, today))
+        }
+
+        # 1. 오늘의 활동 요약 (today_summary)
+        today_rollup = rollups.get(today)
         today_summary = {
-            "duration": today_summary_agg['total_duration'] or 0,
-            "distance": today_summary_agg['total_distance'] or 0
+            "duration": today_rollup.total_duration if today_rollup else 0,
+            "distance": today_rollup.total_distance if today_rollup else 0
         }
 
-        # 2. 주간 활동 분석 (weekly_analysis)
-        # (실제로는 7일치 데이터를 조회해서 합산해야 합니다.)
-        # ❗️ [개선] 지난 7일간의 날짜별 총 활동 시간(duration)을 계산
+        # 2. 주간 활동 분석 (weekly_analysis) - 6일 전 ~ 오늘
         weekly_data = []
-        for i in range(6, -1, -1): # 6일 전 ~ 오늘
+        for i in range(6, -1, -1):
             day = today - timezone.timedelta(days=i)
-            daily_duration = WalkLog.objects.filter(pet=pet, log_date=day).aggregate(total=Sum('duration'))['total']
+            rollup = rollups.get(day)
             weekly_data.append({
                 "day": day.strftime("%a"), # 예: "Mon"
-                "duration": daily_duration or 0
+                "duration": rollup.total_duration if rollup else 0
             })
         
         # 3. 최근 산책 기록 (recent_logs)
@@ -366,8 +336,104 @@ class ActivityPageView(APIView):
             "recent_logs": logs_serializer.data
         }
 
+        return response_data
+
+# --- Meal API (API 5.4, 5.5) ---
+
+class MealLogViewSet(viewsets.ModelViewSet):
+    """
+    API 명세서 5.5: 식사 기록(MealLog) 관리(CRUD) ViewSet
+    - POST /pets/meals/logs/{pet_id}/
+    - PUT /pets/meals/logs/items/{log_id}/
+    - DELETE /pets/meals/logs/items/{log_id}/
+    """
+    queryset = MealLog.objects.all()
+    serializer_class = MealLogSerializer
+    permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly] # 소유자만 관리 가능
+
+    def get_queryset(self):
+        """
+        이 요청을 보낸 사용자가 소유한 반려동물의 식사 기록만 반환합니다.
+        """
+        user = self.request.user
+        return MealLog.objects.filter(pet__owner=user)
+
+    def perform_create(self, serializer):
+        """
+        POST 요청 시, pet 정보를 URL에서 가져와 자동으로 저장합니다.
+        """
+        try:
+            pet = Pet.objects.get(id=self.kwargs['pet_id'], owner=self.request.user)
+            serializer.save(pet=pet)
+        except Pet.DoesNotExist:
+            raise ValidationError("유효한 반려동물이 아니거나, 본인의 반려동물이 아닙니다.")
+        except KeyError:
+            raise ValidationError("URL에서 pet_id를 찾을 수 없습니다.")
+
+
+class MealPageView(APIView):
+    """
+    API 명세서 5.4: 식사 페이지 정보 조회 View
+    - GET /pets/meals/{pet_id}/
+    - 오늘의 식사 요약(종류별), 최근 7일/30일 칼로리·양 추이, 최근 식사 기록
+    - 날짜별 합계는 MealLog를 매번 SUM 하지 않고 일일 식사 집계(DailyNutritionRollup)를 한 번의 범위 조회로 읽습니다.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    trend_days = 30
+
+    def get(self, request, pet_id):
+        try:
+            pet = Pet.objects.get(id=pet_id, owner=request.user)
+        except Pet.DoesNotExist:
+            return Response({"error": "반려동물 정보를 찾을 수 없거나 권한이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        today = timezone.now().date()
+        start = today - timezone.timedelta(days=self.trend_days - 1)
+
+        # 날짜 -> {종류: 집계}
+        daily = {}
+        for rollup in DailyNutritionRollup.objects.filter(pet=pet, date__range=(start, today), count__gt=0):
+            daily.setdefault(rollup.date, {})[rollup.food_type] = rollup
+
+        # 1. 오늘의 식사 요약 (today_summary)
+        today_rollups = daily.get(today, {})
+        today_summary = {
+            "calorie": round(sum(r.total_calorie for r in today_rollups.values()), 1),
+            "quantity_g": round(sum(r.total_quantity_g for r in today_rollups.values()), 1),
+            "by_food_type": [
+                {
+                    "food_type": food_type,
+                    "calorie": round(rollup.total_calorie, 1),
+                    "quantity_g": round(rollup.total_quantity_g, 1),
+                    "count": rollup.count,
+                }
+                for food_type, rollup in sorted(today_rollups.items())
+            ],
+        }
+
+        # 2. 일별 추이 (오래된 날짜 -> 오늘)
+        trend = []
+        for i in range(self.trend_days - 1, -1, -1):
+            day = today - timezone.timedelta(days=i)
+            rollups = daily.get(day, {})
+            trend.append({
+                "date": day,
+                "calorie": round(sum(r.total_calorie for r in rollups.values()), 1),
+                "quantity_g": round(sum(r.total_quantity_g for r in rollups.values()), 1),
+            })
+
+        # 3. 최근 식사 기록 (recent_logs)
+        recent_logs = MealLog.objects.filter(pet=pet).order_by('-log_date', '-created_at')[:5] # 최근 5개
+
+        response_data = {
+            "today_summary": today_summary,
+            "weekly_trend": trend[-7:],
+            "monthly_trend": trend,
+            "recent_logs": MealLogSerializer(recent_logs, many=True).data,
+        }
         return Response(response_data, status=status.HTTP_200_OK)
 
+
 # --- Calendar API (API 6.x) --- [❗️ 2-B 단계: 이 코드 블록이 새로 추가되었습니다!]
 
 class CalendarScheduleViewSet(viewsets.ModelViewSet):
@@ -410,33 +476,55 @@ class CalendarScheduleListView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, pet_id):
-        try:
-            pet = Pet.objects.get(id=pet_id, owner=request.user)
-        except Pet.DoesNotExist:
+        pet = owned_pet_with_version(request.user, pet_id)
+        if pet is None:
             return Response({"error": "반려동물 정보를 찾을 수 없거나 권한이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
         
         # 쿼리 파라미터에서 year와 month를 가져옵니다.
-        year = request.query_params.get('year')
-        month = request.query_params.get('month')
+        try:
+            year, month = parse_year_month(request.query_params)
+        except CalendarParamError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 바뀐 것이 없으면 일정을 조회하지 않고 304 (pets/versioning.py)
+        etag = pet_etag(pet, 'calendar', year, month)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        # 같은 데이터 버전의 응답이 캐시에 있으면 그대로 반환 (pets/page_cache.py)
+        response_data = get_page_cache().get_or_build(
+            pet.id, pet_version(pet), 'calendar', (year, month), lambda: self.build_page(pet, year, month)
+        )
+        return with_etag(Response(response_data, status=status.HTTP_200_OK), etag)
+
+    def build_page(self, pet, year, month):
+        """월별 일정 응답 데이터 (캐시에 없을 때만 실행)"""
+        # 해당 년도/월의 일정만 필터링 ([1일, 다음 달 1일) 범위 조건이라 인덱스 범위 스캔)
+        schedules = month_schedules(pet, year, month)
+        return CalendarScheduleSerializer(schedules, many=True).data
 
-        if not year or not month:
-            return Response({"error": "year와 month 쿼리 파라미터가 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+class CalendarMonthGridView(APIView):
+    """
+    API 명세서 6.4: 월 그리드 요약 조회 View
+    - GET /pets/calendar/{pet_id}/grid/?year=YYYY&month=MM&months=3
+    - year년 month월부터 months개월의 날짜별 일정 수와 카테고리를 한 번에 반환합니다.
+      (캘린더 앞뒤 달을 미리 그릴 때 달마다 6.1을 호출하지 않도록)
+    """
+    permission_classes = [permissions.IsAuthenticated]
 
+    def get(self, request, pet_id):
         try:
-            year = int(year)
-            month = int(month)
-        except ValueError:
-            return Response({"error": "year와 month는 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+            pet = Pet.objects.get(id=pet_id, owner=request.user)
+        except Pet.DoesNotExist:
+            return Response({"error": "반려동물 정보를 찾을 수 없거나 권한이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        # 해당 년도/월의 일정만 필터링
-        schedules = CalendarSchedule.objects.filter(
-            pet=pet,
-            schedule_date__year=year,
-            schedule_date__month=month
-        ).order_by('schedule_date')
-        
-        serializer = CalendarScheduleSerializer(schedules, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        try:
+            year, month = parse_year_month(request.query_params)
+            months = parse_month_count(request.query_params)
+        except CalendarParamError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({"months": build_month_grid(pet, year, month, months)}, status=status.HTTP_200_OK)
 # --- Health & BCS API (API 7.x) --- [❗️ 2단계: 이 코드 블록을 새로 추가!]
 
 class HealthLogViewSet(viewsets.ModelViewSet):
@@ -478,11 +566,24 @@ class HealthPageView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, pet_id):
-        try:
-            pet = Pet.objects.get(id=pet_id, owner=request.user)
-        except Pet.DoesNotExist:
+        pet = owned_pet_with_version(request.user, pet_id)
+        if pet is None:
             return Response({"error": "반려동물 정보를 찾을 수 없거나 권한이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
+        # 바뀐 것이 없으면 기록을 조회하지 않고 304 (나이 계산이 날짜에 따라 바뀌므로 날짜 포함)
+        today = date.today()
+        etag = pet_etag(pet, 'health', today)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        # 같은 데이터 버전의 응답이 캐시에 있으면 그대로 반환 (pets/page_cache.py)
+        response_data = get_page_cache().get_or_build(
+            pet.id, pet_version(pet), 'health', (today,), lambda: self.build_page(pet, today)
+        )
+        return with_etag(Response(response_data, status=status.HTTP_200_OK), etag)
+
+    def build_page(self, pet, today):
+        """건강 페이지 응답 데이터 (캐시에 없을 때만 실행)"""
         # 1. 체중 변화 그래프 데이터 (HealthLog에서 체중 기록 조회)
         weight_logs = HealthLog.objects.filter(pet=pet, weight__isnull=False).order_by('log_date')
         weight_graph_data = [
@@ -506,7 +607,7 @@ class HealthPageView(APIView):
             "name": pet.name,
             "breed": pet.breed,
             "current_weight": pet.weight,
-            "age": (date.today() - pet.birth_date).days // 365, # 간단한 나이 계산
+            "age": (today - pet.birth_date).days // 365, # 간단한 나이 계산
             "bcs": bcs_value
         }
 
@@ -516,7 +617,7 @@ class HealthPageView(APIView):
             "recent_health_logs": logs_serializer.data
         }
         
-        return Response(response_data, status=status.HTTP_200_OK)
+        return response_data
 
 class AiCheckupView(APIView):
     """
@@ -534,160 +635,48 @@ class AiCheckupView(APIView):
 
         # 2. 증상 목록 받기 (기존과 동일)
         symptoms = request.data.get('symptoms', []) # 예: ["구토", "설사"]
-        user_location = request.data.get('location') # 병원 검색용 (여기선 사용 안 함)
+        user_location = request.data.get('location') # 병원 검색용
 
         if not symptoms:
             return Response({"error": "증상을 선택해주세요."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # --- ⬇️ [수정] 3. Gemini API 호출 로직 ⬇️ ---
-        try:
-            # 3-1. API 키 설정
-            api_key = settings.GOOGLE_GEMINI_API_KEY
-            if not api_key:
-                # settings.py에 키가 없거나 환경 변수가 로드되지 않은 경우
-                raise ValueError("GOOGLE_GEMINI_API_KEY가 설정되지 않았습니다.")
-            
-            genai.configure(api_key=api_key)
-
-            # 3-2. AI 모델 및 프롬프트 준비
-            model = genai.GenerativeModel('gemini-pro-latest') # 최신 모델 (gemini-pro도 가능)
-            
-            # 펫의 나이 계산 (HealthPageView 로직 참고)
-            pet_age_days = (date.today() - pet.birth_date).days
-            pet_age = pet_age_days // 365 # 간단한 나이 계산
-            
-            symptoms_str = ", ".join(symptoms) # 리스트를 "구토, 설사" 같은 문자열로 변경
-
-            # AI에게 JSON 형식으로 응답하도록 강력하게 요청하는 프롬프트
-            prompt = f"""
-            당신은 수의사 역할을 하는 반려동물 건강 AI 어시스턴트입니다.
-            아래 반려동물 정보와 주요 증상을 바탕으로, '의심 질환'과 '보호자 대처 방안'을 분석해주세요.
-
-            [반려동물 정보]
-            - 종류: {pet.species}
-            - 품종: {pet.breed}
-            - 나이: {pet_age}살
-            - 성별: {pet.gender}
-            - 중성화 여부: {'예' if pet.is_neutered else '아니오'}
-            - 특이사항: {pet.special_notes or '없음'}
-
-            [주요 증상]
-            {symptoms_str}
-
-            [요청]
-            분석한 결과를 반드시 다음의 JSON 형식으로만 응답해주세요.
-            다른 설명이나 마크다운 표기(```json) 없이 순수한 JSON 객체만 반환해야 합니다.
-            'recommendations'는 반드시 3개 이상의 항목으로 구성된 리스트(배열)여야 합니다.
-
-            {{
-              "analysis": {{
-                "issue_title": "(AI가 판단한 '의심 질환'의 요약 제목. 예: '복합적 문제' 또는 '급성 위장염 의심')",
-                "description": "(프론트엔드 디자인의 '의심 질환' 박스에 들어갈 상세 설명. 예: '선택하신 '구토', '설사' 증상은...')"
-              }},
-              "recommendations": [
-                "(프론트엔드 디자인의 '권장 대처 방안' 리스트의 첫 번째 항목. 예: '유산균을 급여하고 식단을 점검해주세요.')",
-                "(두 번째 항목. 예: '신선한 물을 마실 수 있도록 수분 섭취를...')"
-              ]
-            }}
-            """
-
-            # 3-3. AI 모델 호출 (429 에러 처리 추가)
-            try:
-                ai_response = model.generate_content(prompt)
-            except Exception as api_error:
-                # 429 에러 또는 quota 관련 에러 확인
-                error_message = str(api_error).lower()
-                if "429" in error_message or "quota" in error_message or "resource" in error_message:
-                    # 할당량 초과 시 샘플 데이터 반환
-                    analysis_result = {
-                        "analysis": {
-                            "issue_title": f"{symptoms_str} 관련 주의 사항",
-                            "description": f"선택하신 증상({symptoms_str})은 반려동물에게 불편함을 줄 수 있습니다. 증상이 지속되거나 악화될 경우 즉시 수의사와 상담하시기 바랍니다."
-                        },
-                        "recommendations": [
-                            "증상이 24시간 이상 지속되면 동물병원 방문을 권장합니다.",
-                            "충분한 수분 섭취를 유지하고, 편안한 환경을 제공해주세요.",
-                            "급격한 식단 변화는 피하고, 평소 식사량을 유지해주세요."
-                        ]
-                    }
-                    # Kakao 병원 검색은 정상 진행
-                    kakao_api_key = settings.KAKAO_API_KEY
-                    clinics_list = []
-                    if not user_location or 'lat' not in user_location or 'lng' not in user_location:
-                        clinics_list = [{"id": 0, "name": "위치 정보 없음", "subtitle": "사용자 위치 정보(lat, lng)가 전송되지 않았습니다.", "phone": ""}]
-                    else:
-                        try:
-                            lat = float(user_location['lat'])
-                            lng = float(user_location['lng'])
-                            clinics_list = search_nearby_clinics(kakao_api_key, lat, lng)
-                        except (ValueError, TypeError):
-                            clinics_list = [{"id": 0, "name": "위치 정보 오류", "subtitle": "위치 정보(lat, lng) 형식이 잘못되었습니다.", "phone": ""}]
-                    
-                    response_data = {
-                        "analysis_result": analysis_result,
-                        "nearby_clinics": clinics_list
-                    }
-                    return Response(response_data, status=status.HTTP_200_OK)
-                else:
-                    # 다른 에러는 그대로 발생시킴
-                    raise api_error
-            
-           # --- ⬇️ [수정] AI 응답 "청소" 로직 추가 ⬇️ ---
+        # 3-A. [비동기 모드] 작업을 큐에 넣고 바로 202 응답
+        # (워커: python manage.py run_ai_checkup_worker)
+        if settings.AI_CHECKUP_ASYNC:
+            job = enqueue_checkup(pet, symptoms, user_location)
+            return Response({
+                "job_id": job.id,
+                "status": job.status,
+                "status_url": reverse('ai-checkup-job', args=[job.id]),
+            }, status=status.HTTP_202_ACCEPTED)
 
-            # 1. AI가 보낸 원본 텍스트를 가져옵니다.
-            ai_text = ai_response.text
-            
-            # 2. 텍스트 앞뒤의 공백과 마크다운(```)을 제거합니다.
-            ai_text_cleaned = ai_text.strip().strip("```json").strip("```").strip()
-            
-            # 3-4. "깨끗해진" 텍스트를 JSON 객체로 파싱
-            try:
-                analysis_result = json.loads(ai_text_cleaned)
-            except json.JSONDecodeError:
-                # 3-5. (예외 처리) 만약 "청소" 후에도 JSON이 아니라면,
-                #      "청소 전" 원본 텍스트를 에러 메시지로 반환합니다.
-                raise ValueError(f"AI가 JSON 형식이 아닌 응답을 반환했습니다: {ai_response.text}")
-
-        except json.JSONDecodeError as e:
-            # 3-6. (기존 예외 처리) 파싱 실패 시
-            analysis_result = {
-                "analysis": {"issue_title": "AI 응답 분석 실패", "description": f"AI가 JSON 형식이 아닌 응답을 반환했습니다 (JSONDecodeError): {e} \n\n 원본응답: {ai_response.text}"},
-                "recommendations": []
-            }
-        except Exception as e:
+        # 3-B. [동기 모드] Gemini 분석 + 주변 병원 검색 후 바로 응답
+        try:
+            response_data = run_checkup(pet, symptoms, user_location)
+        except AiCheckupError as e:
             # API 키가 잘못되었거나, 네트워크 오류, 모델 호출 한도 초과 등
             # 500 Internal Server Error로 응답
             return Response({"error": f"AI 분석 중 오류 발생: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        # 4. (가상) 위치 기반 주변 병원 검색 (기존 로직 유지)
-        # --- ⬇️ [수정] 4. (가상) 위치 기반 주변 병원 검색 (실제 API로 교체) ⬇️ ---
-        
-        clinics_list = []
-        kakao_api_key = settings.KAKAO_API_KEY # settings.py에서 키 가져오기
-        
-        # 1. user_location이 제대로 왔는지 확인
-        if not user_location or 'lat' not in user_location or 'lng' not in user_location:
-            clinics_list = [{"id": 0, "name": "위치 정보 없음", "address": "사용자 위치 정보(lat, lng)가 전송되지 않았습니다.", "phone": "", "distance": 0}]
-        else:
-            try:
-                # 2. 위도(lat), 경도(lng) 값을 float(숫자)으로 변환
-                lat = float(user_location['lat'])
-                lng = float(user_location['lng'])
-                
-                # 3. 위에서 만든 헬퍼 함수 호출!
-                clinics_list = search_nearby_clinics(kakao_api_key, lat, lng)
-                
-            except (ValueError, TypeError):
-                 # lat, lng가 숫자가 아닐 경우
-                 clinics_list = [{"id": 0, "name": "위치 정보 오류", "address": "위치 정보(lat, lng) 형식이 잘못되었습니다.", "phone": "", "distance": 0}]
-        
-        # 5. AI 결과와 병원 목록(예시)을 조합하여 최종 응답
-        response_data = {
-          "analysis_result": analysis_result, # ⬅️ 예시 데이터 대신, AI가 생성한 실제 JSON으로 교체
-          "nearby_clinics": clinics_list # ⬅️ 이 부분은 여전히 예시 데이터
-        }
-        
+
         return Response(response_data, status=status.HTTP_200_OK)
 
+
+class AiCheckupJobView(APIView):
+    """
+    API 명세서 7.3 (비동기 모드): AI 건강 분석 작업 상태/결과 조회 View
+    - GET /pets/health/ai-checkup/jobs/{job_id}/
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, job_id):
+        try:
+            job = AiCheckupJob.objects.get(id=job_id, pet__owner=request.user)
+        except AiCheckupJob.DoesNotExist:
+            return Response({"error": "분석 작업을 찾을 수 없거나 권한이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = AiCheckupJobSerializer(job)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
 class BcsCheckupView(APIView):
     """
     API 명세서 7.4: BCS 자가 진단 View
@@ -777,18 +766,9 @@ class ListMyModelsView(APIView):
 
     def get(self, request):
         try:
-            api_key = settings.GOOGLE_GEMINI_API_KEY
-            if not api_key:
-                raise ValueError("GOOGLE_GEMINI_API_KEY가 설정되지 않았습니다.")
-            
-            genai.configure(api_key=api_key)
-            
-            models_list = []
-            # 내 키로 사용 가능한 모든 모델을 조회합니다.
-            for m in genai.list_models():
-                # 그중에서 'generateContent'(AI 분석)를 지원하는 모델만 필터링합니다.
-                if 'generateContent' in m.supported_generation_methods:
-                    models_list.append(m.name)
+            # 내 키로 사용 가능한 모델 중 'generateContent'(AI 분석)를 지원하는 모델 목록
+            # (ai_clients가 일정 시간 동안 캐시합니다)
+            models_list = ai_clients.list_generation_models()
             
             return Response({
                 "message": "내 API 키로 'generateContent'를 지원하는 모델 목록입니다.",
@@ -796,4 +776,21 @@ class ListMyModelsView(APIView):
             }, status=status.HTTP_200_OK)
             
         except Exception as e:
-            return Response({"error": f"모델 목록 조회 중 오류 발생: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            return Response({"error": f"모델 목록 조회 중 오류 발생: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class CacheStatsView(APIView):
+    """
+    [운영용] 캐시 적중/실패/삭제 통계와 외부 HTTP 호출 지표 (관리자 전용)
+    - GET /pets/cache/stats/
+    - outbound_http: 호스트별 호출/오류/재시도/거절 수, 지연 시간(avg/p50/p95/max), 서킷 상태
+    - 통계는 프로세스별 값입니다. (여러 워커로 운영하면 요청을 받은 워커의 값)
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            "pet_pages": get_page_cache().stats(),
+            "ai_analysis": get_analysis_cache().stats(),
+            "outbound_http": get_http_client().metrics(),
+        }, status=status.HTTP_200_OK)
@@ -0,0 +1,33 @@
+# users/authentication.py
+"""
+DRF 밖(ASGI 스트림, 웹소켓)에서 SimpleJWT 액세스 토큰으로 사용자를 확인하는 도우미
+
+브라우저의 EventSource/WebSocket은 Authorization 헤더를 보낼 수 없으므로
+?token=<access token> 쿼리 파라미터도 함께 받습니다.
+"""
+from channels.db import database_sync_to_async
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+
+
+async def user_from_token(raw_token):
+    """액세스 토큰 문자열로 사용자를 찾습니다. 토큰이 없거나 잘못되었으면 None"""
+    if not raw_token:
+        return None
+    auth = JWTAuthentication()
+    try:
+        validated = auth.get_validated_token(raw_token)
+        return await database_sync_to_async(auth.get_user)(validated)
+    except (InvalidToken, AuthenticationFailed, TokenError):
+        return None
+
+
+def raw_token_from_request(request):
+    """Authorization: Bearer <token> 헤더 또는 ?token= 값을 꺼냅니다."""
+    auth = JWTAuthentication()
+    header = auth.get_header(request)
+    if header:
+        raw = auth.get_raw_token(header)
+        if raw:
+            return raw.decode() if isinstance(raw, bytes) else raw
+    return request.GET.get('token')